@@ -0,0 +1,177 @@
+"""Local stand-in for the Credere API used by the benchmarks.
+
+Serves canned JSON over TLS and negotiates HTTP/2 or HTTP/1.1 through ALPN,
+so client-side protocol choices can be compared without touching the real
+API. A throwaway self-signed certificate is generated with the ``openssl``
+CLI and exported through ``SSL_CERT_FILE`` so httpx trusts it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import ssl
+import subprocess
+import tempfile
+from pathlib import Path
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+import h11
+
+
+def _make_certificate(directory: Path) -> tuple[Path, Path]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-nodes", "-days", "1",
+            "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1",
+            "-keyout", str(key), "-out", str(cert),
+            "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+    return cert, key
+
+
+class StandInServer:
+    """Async context manager running the stand-in server on a random port.
+
+    Every request is answered with *body* after *latency* seconds, which
+    stands in for upstream processing time. ``connections`` counts accepted
+    TCP connections (and therefore TLS handshakes).
+    """
+
+    def __init__(self, body: bytes, *, latency: float = 0.0) -> None:
+        self.body = body
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+        self._tmp = tempfile.TemporaryDirectory()
+        self._server: asyncio.Server | None = None
+        self._previous_cert_file: str | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        port = self._server.sockets[0].getsockname()[1]
+        return f"https://localhost:{port}"
+
+    async def __aenter__(self) -> StandInServer:
+        cert, key = _make_certificate(Path(self._tmp.name))
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert, key)
+        context.set_alpn_protocols(["h2", "http/1.1"])
+        self._previous_cert_file = os.environ.get("SSL_CERT_FILE")
+        os.environ["SSL_CERT_FILE"] = str(cert)
+        self._server = await asyncio.start_server(
+            self._handle, "127.0.0.1", 0, ssl=context, backlog=1024
+        )
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+        if self._previous_cert_file is None:
+            os.environ.pop("SSL_CERT_FILE", None)
+        else:
+            os.environ["SSL_CERT_FILE"] = self._previous_cert_file
+        self._tmp.cleanup()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        protocol = writer.get_extra_info("ssl_object").selected_alpn_protocol()
+        try:
+            if protocol == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_h11(reader, writer)
+        except (ConnectionError, h11.RemoteProtocolError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h11(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h11.Connection(h11.SERVER)
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                conn.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.EndOfMessage):
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                headers = [
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(self.body))),
+                ]
+                writer.write(conn.send(h11.Response(status_code=200, headers=headers)))
+                writer.write(conn.send(h11.Data(data=self.body)))
+                writer.write(conn.send(h11.EndOfMessage()))
+                await writer.drain()
+                if conn.our_state is not h11.DONE:
+                    return
+                conn.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed) or event is h11.PAUSED:
+                return
+
+    async def _serve_h2(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        conn.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000})
+        writer.write(conn.data_to_send())
+        window_updated = asyncio.Event()
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def respond(stream_id: int) -> None:
+            self.requests += 1
+            await asyncio.sleep(self.latency)
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(self.body))),
+                ],
+            )
+            remaining = self.body
+            while remaining:
+                window = min(
+                    conn.local_flow_control_window(stream_id),
+                    conn.max_outbound_frame_size,
+                )
+                if window <= 0:
+                    window_updated.clear()
+                    await window_updated.wait()
+                    continue
+                chunk, remaining = remaining[:window], remaining[window:]
+                conn.send_data(stream_id, chunk, end_stream=not remaining)
+                writer.write(conn.data_to_send())
+            await writer.drain()
+
+        while data := await reader.read(65536):
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.create_task(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_updated.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
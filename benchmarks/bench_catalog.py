@@ -0,0 +1,71 @@
+"""Searching the vehicle catalog locally: query latency and index build time.
+
+Builds a :class:`credere.catalog.VehicleCatalog` over a synthetic catalog and
+times the keystroke-by-keystroke queries an autocomplete field would send::
+
+    python benchmarks/bench_catalog.py --models 30000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from credere.catalog import VehicleCatalog
+from credere.models.vehicle_models import VehicleModel
+
+BRANDS = {
+    "Chevrolet": ["Onix", "Tracker", "Cruze", "S10", "Spin"],
+    "Fiat": ["Argo", "Mobi", "Toro", "Strada", "Pulse"],
+    "Honda": ["Civic", "City", "Fit", "HR-V", "WR-V"],
+    "Toyota": ["Corolla", "Yaris", "Hilux", "Etios", "SW4"],
+    "Volkswagen": ["Gol", "Polo", "Virtus", "T-Cross", "Nivus"],
+}
+VERSIONS = ["LT 1.0 Turbo", "Premier 1.4", "EXL 2.0 Flex", "XEi 2.0 CVT", "Comfortline"]
+QUERIES = ["c", "co", "cor", "coro", "corol", "corolla x", "corola xei 2019", "002713"]
+
+
+def _models(count: int) -> list[VehicleModel]:
+    names = [(brand, name) for brand, names in BRANDS.items() for name in names]
+    models = []
+    for i in range(count):
+        brand, name = names[i % len(names)]
+        year = 2000 + i % 24
+        models.append(
+            VehicleModel(
+                id=i,
+                brand=brand,
+                name=name,
+                version=f"{VERSIONS[i // len(names) % len(VERSIONS)]} {i // 125}",
+                molicar_code=f"{i:06d}-{i % 10}",
+                year_start=year,
+                year_end=year + 3,
+                active=True,
+            )
+        )
+    return models
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=30_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    models = _models(args.models)
+    start = time.perf_counter()
+    catalog = VehicleCatalog(models)
+    print(f"{args.models} models indexed in {time.perf_counter() - start:.2f}s")
+    for query in QUERIES:
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            matches = catalog.search(query)
+            timings.append(time.perf_counter() - start)
+        micros = statistics.median(timings) * 1e6
+        print(f"  {query!r:>20}: {micros:10,.0f} us  ({len(matches)} matches)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Decoding a large ``vehicle_prices`` response: per-item loop vs. shared decoder.
+
+Compares the previous decoding path, ``response.json()`` followed by one
+``VehiclePrice.model_validate`` call per item, with the module-level
+``Decoder`` that validates the whole envelope straight from the raw bytes::
+
+    python benchmarks/bench_decode.py --items 50000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+
+import httpx
+
+from credere._decode import Decoder
+from credere.models.vehicle_models import VehiclePrice
+
+PRICES = Decoder(list[VehiclePrice], "vehicle_prices")
+
+
+def _payload(items: int) -> bytes:
+    prices = [
+        {
+            "id": i,
+            "store_id": 42,
+            "min_price_cents": 5_000_000 + i,
+            "default_price_cents": 6_000_000 + i,
+            "active": i % 7 != 0,
+            "vehicle_model": {
+                "id": i % 900,
+                "name": "Civic",
+                "brand": "Honda",
+                "molicar_code": f"{i:06d}",
+                "version": "EXL 2.0 CVT",
+                "year_start": 2020,
+                "year_end": 2024,
+                "active": True,
+                "public_price_cents": 13_990_000,
+                "vehicle_brand": {"id": 7, "name": "Honda"},
+                "fuel": {"id": 1, "name": "Flex", "object_type": "Fuel"},
+                "vehicle_type": {"id": 1, "name": "Carro"},
+            },
+            "store": {"id": 42, "name": "Loja Centro", "uf": "SP"},
+            "created_at": "2024-01-15T10:30:00Z",
+            "updated_at": "2024-06-01T08:00:00Z",
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"vehicle_prices": prices}).encode()
+
+
+def per_item(response: httpx.Response) -> list[VehiclePrice]:
+    return [
+        VehiclePrice.model_validate(item) for item in response.json()["vehicle_prices"]
+    ]
+
+
+def _time(
+    decode: Callable[[httpx.Response], list[VehiclePrice]], body: bytes, rounds: int
+) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        response = httpx.Response(200, content=body)
+        start = time.perf_counter()
+        result = decode(response)
+        timings.append(time.perf_counter() - start)
+        assert len(result) > 0
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    body = _payload(args.items)
+    print(
+        f"{args.items} vehicle prices, {len(body) / 1e6:.1f} MB, {args.rounds} rounds"
+    )
+    medians = {
+        name: statistics.median(_time(decode, body, args.rounds))
+        for name, decode in (("json() + model_validate", per_item), ("Decoder", PRICES))
+    }
+    baseline = medians["json() + model_validate"]
+    for name, median in medians.items():
+        print(f"{name:>24}: {median * 1000:8.1f} ms  ({baseline / median:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
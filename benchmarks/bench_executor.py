@@ -0,0 +1,103 @@
+"""Per-call overhead of resource methods: inline request code vs. the executor.
+
+Sends ``leads.get`` calls through an :class:`httpx.MockTransport` that
+answers instantly, so the numbers measure the SDK side of a call (path and
+header building, error mapping, decoding) rather than the network.
+"inline" is the code every resource method used to repeat: build a fresh
+``Store-Id`` header dict, call ``client.get`` and decode::
+
+    python benchmarks/bench_executor.py --calls 20000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+
+import httpx
+
+from credere._decode import Decoder
+from credere._executor import Endpoint, Executor
+from credere._response import handle_request_error, raise_for_status
+from credere.models.leads import Lead
+from credere.resources.leads import Leads
+
+BASE_URL = "https://api.example.test"
+STORE_ID = 42
+LEAD = Decoder(Lead, "data")
+GET = Endpoint("GET", "/v1/banks_api/leads/{}", LEAD)
+
+_BODY = json.dumps(
+    {"data": {"id": 1, "cpf_cnpj": "12345678901", "name": "Maria", "store_id": 42}}
+).encode()
+
+
+def _client() -> httpx.Client:
+    return httpx.Client(
+        base_url=BASE_URL,
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=_BODY)
+        ),
+    )
+
+
+def inline(client: httpx.Client) -> Callable[[str], Lead]:
+    def get(cpf_cnpj: str) -> Lead:
+        sid = STORE_ID
+        headers = {"Store-Id": str(sid)} if sid is not None else {}
+        try:
+            response = client.get(f"/v1/banks_api/leads/{cpf_cnpj}", headers=headers)
+        except httpx.HTTPError as exc:
+            handle_request_error(exc)
+            raise
+        raise_for_status(response)
+        return LEAD(response)
+
+    return get
+
+
+def executor(client: httpx.Client) -> Callable[[str], Lead]:
+    call = Executor(client, STORE_ID)
+    return lambda cpf_cnpj: call(GET, cpf_cnpj)
+
+
+def resource(client: httpx.Client) -> Callable[[str], Lead]:
+    return Leads(client, store_id=STORE_ID).get
+
+
+def _rate(get: Callable[[str], Lead], calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        get(str(i))
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.calls} leads.get calls per round, {args.rounds} rounds")
+    makers = {"inline": inline, "Executor": executor, "Leads.get": resource}
+    rates: dict[str, list[float]] = {name: [] for name in makers}
+    with _client() as client:
+        calls = {name: make(client) for name, make in makers.items()}
+        for get in calls.values():
+            get("warmup")
+        # Interleave the variants so that drift in machine speed over the
+        # run affects them all alike.
+        for _ in range(args.rounds):
+            for name, get in calls.items():
+                rates[name].append(_rate(get, args.calls))
+    medians = {name: statistics.median(values) for name, values in rates.items()}
+    baseline = medians["inline"]
+    for name, median in medians.items():
+        print(f"{name:>10}: {median:10,.0f} calls/s  ({median / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Estimating a large condition grid offline: pure Python vs. numpy columns.
+
+Runs :func:`credere.finance.estimate` over a grid of financed amounts and
+installments counts, once element by element (the fallback used without
+numpy) and once over numpy arrays::
+
+    python benchmarks/bench_finance.py --conditions 100000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from unittest import mock
+
+from credere import finance
+
+RATES = finance.RateTable({24: (1.29, 1.45), 36: (1.39, 1.52), 48: (1.49, 1.62)})
+COUNTS = [12, 18, 24, 30, 36, 42, 48, 54, 60]
+
+
+def _grid(conditions: int) -> tuple[list[int], list[int]]:
+    financed = [1_000_000 + 1_000 * (i // len(COUNTS)) for i in range(conditions)]
+    installments = [COUNTS[i % len(COUNTS)] for i in range(conditions)]
+    return financed, installments
+
+
+def _time(conditions: int, rounds: int) -> list[float]:
+    financed, installments = _grid(conditions)
+    rates = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        finance.estimate(financed, installments, RATES)
+        rates.append(conditions / (time.perf_counter() - start))
+    return rates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conditions", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.conditions} conditions per round, {args.rounds} rounds")
+    with mock.patch.object(finance, "_numpy", lambda: None):
+        python = statistics.median(_time(args.conditions, args.rounds))
+    print(f"    python: {python:12,.0f} conditions/s")
+    if finance._numpy() is None:
+        print("     numpy: not installed")
+        return
+    numpy = statistics.median(_time(args.conditions, args.rounds))
+    print(f"     numpy: {numpy:12,.0f} conditions/s  ({numpy / python:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
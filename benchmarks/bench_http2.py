@@ -0,0 +1,119 @@
+"""Tail latency of concurrent ``AsyncSimulations.create`` calls, HTTP/1.1 vs HTTP/2.
+
+Fires N concurrent simulation requests at a local TLS stand-in server and
+reports latency percentiles plus the number of connections (TLS handshakes)
+each protocol needed.
+
+Requires the ``http2`` extra and the ``openssl`` CLI::
+
+    pip install -e ".[http2]"
+    python benchmarks/bench_http2.py --requests 500 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from _standin import StandInServer
+
+from credere import (
+    AsyncCredereClient,
+    SimulationConditionRequest,
+    SimulationCreateRequest,
+    SimulationVehicleRequest,
+)
+
+REQUEST = SimulationCreateRequest(
+    assets_value=5000000,
+    conditions=[
+        SimulationConditionRequest(
+            down_payment=1000000, financed_amount=4000000, installments=48
+        )
+    ],
+    retrieve_lead={"cpf_cnpj": "12345678900"},
+    seller_cpf="98765432100",
+    vehicle=SimulationVehicleRequest(
+        asset_value=5000000,
+        licensing_uf="SP",
+        manufacture_year=2024,
+        model_year=2024,
+        vehicle_molicar_code="MOL123",
+        zero_km=True,
+    ),
+)
+
+RESPONSE = {
+    "data": {
+        "assets_value": 5000000,
+        "conditions": [
+            {
+                "id": i,
+                "installments": 48,
+                "down_payment": 1000000,
+                "financed_amount": 4000000,
+                "bank": {"id": i, "febraban_code": "341", "name": "Itaú"},
+                "success": True,
+                "interest_monthly": 1.49,
+                "cet_monthly": 1.62,
+                "first_installment_value": 115000,
+                "amount_paid_in_financing": 5520000,
+            }
+            for i in range(5)
+        ],
+    }
+}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _run(http2: bool, requests: int, latency: float) -> None:
+    body = json.dumps(RESPONSE).encode()
+    async with (
+        StandInServer(body, latency=latency) as server,
+        AsyncCredereClient(
+            api_key="bench", base_url=server.url, store_id=1, http2=http2
+        ) as client,
+    ):
+
+        async def one() -> float:
+            start = time.perf_counter()
+            await client.simulations.create(REQUEST)
+            return time.perf_counter() - start
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(one() for _ in range(requests)))
+        wall = time.perf_counter() - started
+
+    ms = [value * 1000 for value in latencies]
+    print(
+        f"{'HTTP/2  ' if http2 else 'HTTP/1.1'}  "
+        f"wall={wall * 1000:8.1f}ms  "
+        f"p50={statistics.median(ms):7.1f}ms  "
+        f"p95={_percentile(ms, 95):7.1f}ms  "
+        f"p99={_percentile(ms, 99):7.1f}ms  "
+        f"max={max(ms):7.1f}ms  "
+        f"connections={server.connections}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    print(f"{args.requests} concurrent simulations.create, {args.latency_ms}ms server")
+    for http2 in (False, True):
+        await _run(http2, args.requests, args.latency_ms / 1000)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
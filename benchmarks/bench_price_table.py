@@ -0,0 +1,105 @@
+"""Price analytics over a large ``vehicle_prices`` response: models vs. columns.
+
+Loads the same response with ``vehicle_models.prices()`` and flattens the
+models into columns by hand, then with ``vehicle_models.price_table()``
+straight into numpy arrays, and times each path up to the arrays::
+
+    python benchmarks/bench_price_table.py --items 50000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import numpy as np
+
+from credere.client import CredereClient
+
+COLUMNS = ["store_id", "default_price_cents", "vehicle_model.molicar_code"]
+
+
+def _payload(items: int) -> bytes:
+    prices = [
+        {
+            "id": i,
+            "store_id": 40 + i % 5,
+            "min_price_cents": 5_000_000 + i,
+            "default_price_cents": 6_000_000 + i,
+            "active": i % 7 != 0,
+            "vehicle_model": {
+                "id": i % 900,
+                "name": "Civic",
+                "brand": "Honda",
+                "molicar_code": f"{i % 900:06d}",
+                "version": "EXL 2.0 CVT",
+                "year_start": 2020,
+                "year_end": 2024,
+                "active": True,
+                "vehicle_brand": {"id": 7, "name": "Honda"},
+            },
+            "store": {"id": 40 + i % 5, "name": "Loja Centro", "uf": "SP"},
+            "created_at": "2024-01-15T10:30:00Z",
+            "updated_at": "2024-06-01T08:00:00Z",
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"vehicle_prices": prices}).encode()
+
+
+def models(client: CredereClient) -> dict[str, Any]:
+    prices = client.vehicle_models.prices()
+    return {
+        "store_id": np.array([p.store_id for p in prices]),
+        "default_price_cents": np.array([p.default_price_cents for p in prices]),
+        "vehicle_model.molicar_code": np.array(
+            [p.vehicle_model.molicar_code if p.vehicle_model else None for p in prices],
+            dtype=object,
+        ),
+    }
+
+
+def columns(client: CredereClient) -> dict[str, Any]:
+    return client.vehicle_models.price_table(columns=COLUMNS).to_numpy()
+
+
+def _time(
+    load: Callable[[CredereClient], dict[str, Any]], body: bytes, rounds: int
+) -> list[float]:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    timings = []
+    with CredereClient(api_key="bench", transport=transport) as client:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            arrays = load(client)
+            timings.append(time.perf_counter() - start)
+            assert len(arrays["store_id"]) > 0
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    body = _payload(args.items)
+    print(
+        f"{args.items} vehicle prices, {len(body) / 1e6:.1f} MB, {args.rounds} rounds"
+    )
+    medians = {
+        name: statistics.median(_time(load, body, args.rounds))
+        for name, load in (("prices() + flatten", models), ("price_table()", columns))
+    }
+    baseline = medians["prices() + flatten"]
+    for name, median in medians.items():
+        print(f"{name:>20}: {median * 1000:8.1f} ms  ({baseline / median:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,70 +1,186 @@
 """Credere SDK — Python client for the Credere credit simulation API."""
 
-from credere.client import AsyncCredereClient, CredereClient
-from credere.exceptions import (
-    AuthenticationError,
-    CredereAPIError,
-    CredereConnectionError,
-    CredereError,
-    CredereTimeoutError,
-    NotFoundError,
-)
-from credere.models.bank_credentials import IntegratedBank
-from credere.models.customers import (
-    Customer,
-    CustomerAddress,
-    CustomerAddressRequest,
-    CustomerCreateRequest,
-)
-from credere.models.leads import (
-    Address,
-    DomainValue,
-    Lead,
-    LeadAddress,
-    LeadCreateRequest,
-    LeadRequiredFields,
-)
-from credere.models.plus_returns import PlusReturnRule, PlusReturnRuleCreateRequest
-from credere.models.proposal_attempts import (
-    ProposalAttempt,
-    ProposalAttemptCreateRequest,
-)
-from credere.models.proposals import (
-    Proposal,
-    ProposalCondition,
-    ProposalConditionRequest,
-    ProposalCreateRequest,
-    ProposalVehicle,
-    ProposalVehicleRequest,
-)
-from credere.models.simulations import (
-    Bank,
-    Simulation,
-    SimulationCondition,
-    SimulationConditionRequest,
-    SimulationCreateRequest,
-    SimulationVehicleRequest,
-)
-from credere.models.stock import StockVehicle, StockVehicleCreateRequest
-from credere.models.stores import Store, StoreCreateRequest
-from credere.models.users import User, UserAccount, UserRole
-from credere.models.utilities import Domain
-from credere.models.vehicle_models import (
-    VehicleBrand,
-    VehicleFuel,
-    VehicleModel,
-    VehiclePrice,
-    VehiclePriceStore,
-    VehicleType,
-)
+from typing import TYPE_CHECKING
+
+from credere._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from credere._decode import LazyModel, ResponseMode
+    from credere.bulk import AsyncBulkRun, BulkResult, BulkRun, BulkStats
+    from credere.cache import CacheStats, TTLCache
+    from credere.catalog import VehicleCatalog
+    from credere.circuit_breaker import CircuitBreakerConfig, CircuitState
+    from credere.client import AsyncCredereClient, CredereClient
+    from credere.codec import JSONCodec, MsgspecCodec, OrjsonCodec, StdlibCodec
+    from credere.config import PoolConfig
+    from credere.exceptions import (
+        AuthenticationError,
+        CircuitOpenError,
+        CredereAPIError,
+        CredereConnectionError,
+        CredereError,
+        CredereTimeoutError,
+        NotFoundError,
+    )
+    from credere.factory import AsyncCredereClientFactory, CredereClientFactory
+    from credere.finance import FinancingEstimate, RateTable
+    from credere.http_cache import HTTPCache
+    from credere.models.bank_credentials import IntegratedBank
+    from credere.models.customers import (
+        Customer,
+        CustomerAddress,
+        CustomerAddressRequest,
+        CustomerCreateRequest,
+    )
+    from credere.models.leads import (
+        Address,
+        DomainValue,
+        Lead,
+        LeadAddress,
+        LeadCreateRequest,
+        LeadRequiredFields,
+    )
+    from credere.models.plus_returns import PlusReturnRule, PlusReturnRuleCreateRequest
+    from credere.models.proposal_attempts import (
+        ProposalAttempt,
+        ProposalAttemptCreateRequest,
+    )
+    from credere.models.proposals import (
+        Proposal,
+        ProposalCondition,
+        ProposalConditionRequest,
+        ProposalCreateRequest,
+        ProposalVehicle,
+        ProposalVehicleRequest,
+    )
+    from credere.models.simulations import (
+        Bank,
+        Simulation,
+        SimulationCondition,
+        SimulationConditionRequest,
+        SimulationCreateRequest,
+        SimulationVehicleRequest,
+    )
+    from credere.models.stock import StockVehicle, StockVehicleCreateRequest
+    from credere.models.stores import Store, StoreCreateRequest
+    from credere.models.users import User, UserAccount, UserRole
+    from credere.models.utilities import Domain
+    from credere.models.vehicle_models import (
+        VehicleBrand,
+        VehicleFuel,
+        VehicleModel,
+        VehiclePrice,
+        VehiclePriceStore,
+        VehicleType,
+    )
+    from credere.price_table import PriceTable
+    from credere.rate_limit import RateLimit, RateLimiter
+    from credere.retry import RetryPolicy
+    from credere.sqlite_cache import SQLiteCache
+    from credere.sweep import SimulationSweep, SweepRow
+
+# Each name's module is imported on first access, so ``import credere`` does
+# not pay for models, resources or the transport stack until they are used.
+_EXPORTS = {
+    "Address": "credere.models.leads",
+    "AsyncBulkRun": "credere.bulk",
+    "AsyncCredereClient": "credere.client",
+    "AsyncCredereClientFactory": "credere.factory",
+    "AuthenticationError": "credere.exceptions",
+    "Bank": "credere.models.simulations",
+    "BulkResult": "credere.bulk",
+    "BulkRun": "credere.bulk",
+    "BulkStats": "credere.bulk",
+    "CacheStats": "credere.cache",
+    "CircuitBreakerConfig": "credere.circuit_breaker",
+    "CircuitOpenError": "credere.exceptions",
+    "CircuitState": "credere.circuit_breaker",
+    "CredereAPIError": "credere.exceptions",
+    "CredereClient": "credere.client",
+    "CredereClientFactory": "credere.factory",
+    "CredereConnectionError": "credere.exceptions",
+    "CredereError": "credere.exceptions",
+    "CredereTimeoutError": "credere.exceptions",
+    "Customer": "credere.models.customers",
+    "CustomerAddress": "credere.models.customers",
+    "CustomerAddressRequest": "credere.models.customers",
+    "CustomerCreateRequest": "credere.models.customers",
+    "Domain": "credere.models.utilities",
+    "DomainValue": "credere.models.leads",
+    "FinancingEstimate": "credere.finance",
+    "HTTPCache": "credere.http_cache",
+    "IntegratedBank": "credere.models.bank_credentials",
+    "JSONCodec": "credere.codec",
+    "LazyModel": "credere._decode",
+    "Lead": "credere.models.leads",
+    "LeadAddress": "credere.models.leads",
+    "LeadCreateRequest": "credere.models.leads",
+    "LeadRequiredFields": "credere.models.leads",
+    "MsgspecCodec": "credere.codec",
+    "NotFoundError": "credere.exceptions",
+    "OrjsonCodec": "credere.codec",
+    "PlusReturnRule": "credere.models.plus_returns",
+    "PlusReturnRuleCreateRequest": "credere.models.plus_returns",
+    "PoolConfig": "credere.config",
+    "PriceTable": "credere.price_table",
+    "Proposal": "credere.models.proposals",
+    "ProposalAttempt": "credere.models.proposal_attempts",
+    "ProposalAttemptCreateRequest": "credere.models.proposal_attempts",
+    "ProposalCondition": "credere.models.proposals",
+    "ProposalConditionRequest": "credere.models.proposals",
+    "ProposalCreateRequest": "credere.models.proposals",
+    "ProposalVehicle": "credere.models.proposals",
+    "ProposalVehicleRequest": "credere.models.proposals",
+    "RateLimit": "credere.rate_limit",
+    "RateLimiter": "credere.rate_limit",
+    "RateTable": "credere.finance",
+    "ResponseMode": "credere._decode",
+    "RetryPolicy": "credere.retry",
+    "SQLiteCache": "credere.sqlite_cache",
+    "Simulation": "credere.models.simulations",
+    "SimulationCondition": "credere.models.simulations",
+    "SimulationConditionRequest": "credere.models.simulations",
+    "SimulationCreateRequest": "credere.models.simulations",
+    "SimulationSweep": "credere.sweep",
+    "SimulationVehicleRequest": "credere.models.simulations",
+    "StdlibCodec": "credere.codec",
+    "StockVehicle": "credere.models.stock",
+    "StockVehicleCreateRequest": "credere.models.stock",
+    "Store": "credere.models.stores",
+    "StoreCreateRequest": "credere.models.stores",
+    "SweepRow": "credere.sweep",
+    "TTLCache": "credere.cache",
+    "User": "credere.models.users",
+    "UserAccount": "credere.models.users",
+    "UserRole": "credere.models.users",
+    "VehicleBrand": "credere.models.vehicle_models",
+    "VehicleCatalog": "credere.catalog",
+    "VehicleFuel": "credere.models.vehicle_models",
+    "VehicleModel": "credere.models.vehicle_models",
+    "VehiclePrice": "credere.models.vehicle_models",
+    "VehiclePriceStore": "credere.models.vehicle_models",
+    "VehicleType": "credere.models.vehicle_models",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
 
 __all__ = [
     "Address",
+    "AsyncBulkRun",
     "AsyncCredereClient",
+    "AsyncCredereClientFactory",
     "AuthenticationError",
     "Bank",
+    "BulkResult",
+    "BulkRun",
+    "BulkStats",
+    "CacheStats",
+    "CircuitBreakerConfig",
+    "CircuitOpenError",
+    "CircuitState",
     "CredereAPIError",
     "CredereClient",
+    "CredereClientFactory",
     "CredereConnectionError",
     "CredereError",
     "CredereTimeoutError",
@@ -74,14 +190,22 @@ __all__ = [
     "CustomerCreateRequest",
     "Domain",
     "DomainValue",
+    "FinancingEstimate",
+    "HTTPCache",
     "IntegratedBank",
+    "JSONCodec",
+    "LazyModel",
     "Lead",
     "LeadAddress",
     "LeadCreateRequest",
     "LeadRequiredFields",
+    "MsgspecCodec",
     "NotFoundError",
+    "OrjsonCodec",
     "PlusReturnRule",
     "PlusReturnRuleCreateRequest",
+    "PoolConfig",
+    "PriceTable",
     "Proposal",
     "ProposalAttempt",
     "ProposalAttemptCreateRequest",
@@ -90,19 +214,30 @@ __all__ = [
     "ProposalCreateRequest",
     "ProposalVehicle",
     "ProposalVehicleRequest",
+    "RateLimit",
+    "RateLimiter",
+    "RateTable",
+    "ResponseMode",
+    "RetryPolicy",
+    "SQLiteCache",
     "Simulation",
     "SimulationCondition",
     "SimulationConditionRequest",
     "SimulationCreateRequest",
+    "SimulationSweep",
     "SimulationVehicleRequest",
+    "StdlibCodec",
     "StockVehicle",
     "StockVehicleCreateRequest",
     "Store",
     "StoreCreateRequest",
+    "SweepRow",
+    "TTLCache",
     "User",
     "UserAccount",
     "UserRole",
     "VehicleBrand",
+    "VehicleCatalog",
     "VehicleFuel",
     "VehicleModel",
     "VehiclePrice",
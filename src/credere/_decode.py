@@ -0,0 +1,208 @@
+"""Decoding of JSON response bodies into SDK models."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from functools import cache, cached_property
+from typing import Annotated, Any, Generic, Literal, TypeVar, get_args, get_origin
+
+import httpx
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+from credere._stream import ArrayItemParser
+from credere.codec import response_codec
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+ResponseMode = Literal["model", "raw", "lazy"]
+"""How response bodies are decoded.
+
+``"model"`` validates them into pydantic models, ``"raw"`` returns the
+decoded JSON (plain dicts and lists) without any validation, and ``"lazy"``
+returns :class:`LazyModel` proxies that validate a field on first access.
+"""
+
+_RESPONSE_MODES: tuple[str, ...] = get_args(ResponseMode)
+
+
+def check_response_mode(mode: str) -> ResponseMode:
+    """Return *mode* if it is a valid :data:`ResponseMode`."""
+    if mode not in _RESPONSE_MODES:
+        raise ValueError(
+            f"response_mode must be one of {', '.join(map(repr, _RESPONSE_MODES))}, "
+            f"got {mode!r}"
+        )
+    return mode  # type: ignore[return-value]
+
+
+def _model_class(annotation: Any) -> type[BaseModel] | None:
+    """Return the model class of ``Model`` or ``Model | None``, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if get_origin(annotation) is not None and len(args) == 1:
+        return _model_class(args[0])
+    return None
+
+
+@cache
+def _field_adapter(model: type[BaseModel], name: str) -> TypeAdapter[Any]:
+    field = model.model_fields[name]
+    annotation: Any = field.annotation
+    if field.metadata:
+        annotation = Annotated[(annotation, *field.metadata)]
+    return TypeAdapter(annotation)
+
+
+class LazyModel(Generic[M]):
+    """Read-only view of a JSON object that validates fields on first access.
+
+    Attribute access mirrors the wrapped model: a declared field is
+    validated against its annotation the first time it is read and then
+    cached, a missing one falls back to its default, and any other key of
+    the object is returned as is, like ``extra="allow"`` fields. Nested
+    model fields are wrapped in their own :class:`LazyModel`, so reading
+    ``price.vehicle_model.name`` never validates ``vehicle_brand``. Call
+    :meth:`model` to validate the whole object.
+    """
+
+    __slots__ = ("_data", "_model", "_values")
+
+    def __init__(self, model: type[M], data: dict[str, Any]) -> None:
+        self._model = model
+        self._data = data
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Slots not set yet, e.g. while copying or unpickling.
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        field = self._model.model_fields.get(name)
+        if field is None:
+            try:
+                return self._data[name]
+            except KeyError:
+                raise AttributeError(
+                    f"{self._model.__name__!r} object has no attribute {name!r}"
+                ) from None
+        if name not in self._data:
+            value = field.get_default(call_default_factory=True)
+        else:
+            raw = self._data[name]
+            nested = _model_class(field.annotation)
+            if nested is not None and isinstance(raw, dict):
+                value = LazyModel(nested, raw)
+            else:
+                value = _field_adapter(self._model, name).validate_python(raw)
+        self._values[name] = value
+        return value
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The undecoded JSON object."""
+        return self._data
+
+    def model(self) -> M:
+        """Validate the whole object into the wrapped model."""
+        return self._model.model_validate(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyModel):
+            return self._model is other._model and self._data == other._data
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model.__name__}]({self._data!r})"
+
+
+class Decoder(Generic[T]):
+    """Validates a JSON body, or the value under one of its keys, as ``T``.
+
+    Decoders are declared once at import time, one per response shape; the
+    pydantic validator is compiled on first use and then reused. The raw
+    body bytes are parsed and validated in a single pass by pydantic-core,
+    without building an intermediate ``response.json()`` tree; the other
+    keys of the envelope are skipped. Bodies served from an
+    :class:`~credere.http_cache.HTTPCache` entry are decoded again on every
+    hit, so callers never share model instances.
+
+    In ``"raw"`` and ``"lazy"`` mode the body is only parsed, with the
+    sending client's :class:`~credere.codec.JSONCodec`, and the value is
+    returned as plain JSON or wrapped in :class:`LazyModel` proxies.
+    """
+
+    def __init__(self, type_: type[T], key: str | None = None) -> None:
+        self.key = key
+        self._type = type_
+        self._many = get_origin(type_) is list
+        self._model = _model_class(get_args(type_)[0] if self._many else type_)
+
+    @cached_property
+    def _adapter(self) -> TypeAdapter[Any]:
+        key = self.key
+        if key is None:
+            return TypeAdapter(self._type)
+        return TypeAdapter(TypedDict("Envelope", {key: self._type}))  # type: ignore[operator]
+
+    @cached_property
+    def _item_adapter(self) -> TypeAdapter[Any]:
+        if not self._many:
+            raise TypeError(f"{self._type} is not a list type")
+        return TypeAdapter(get_args(self._type)[0])
+
+    def _decode_item(self, item: Any, mode: ResponseMode) -> Any:
+        if mode == "raw":
+            return item
+        if mode == "lazy" and self._model is not None:
+            return LazyModel(self._model, item)
+        return self._item_adapter.validate_python(item)
+
+    def iter_items(
+        self, chunks: Iterable[bytes], mode: ResponseMode = "model"
+    ) -> Iterator[Any]:
+        """Decode the items of a list body one at a time as *chunks* arrive."""
+        check_response_mode(mode)
+        parser = ArrayItemParser(self.key)
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                yield self._decode_item(item, mode)
+        parser.close()
+
+    async def aiter_items(
+        self, chunks: AsyncIterable[bytes], mode: ResponseMode = "model"
+    ) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`iter_items`."""
+        check_response_mode(mode)
+        parser = ArrayItemParser(self.key)
+        async for chunk in chunks:
+            for item in parser.feed(chunk):
+                yield self._decode_item(item, mode)
+        parser.close()
+
+    def decode(self, content: bytes) -> T:
+        value = self._adapter.validate_json(content)
+        return value if self.key is None else value[self.key]  # type: ignore[no-any-return]
+
+    def parse(self, response: httpx.Response) -> Any:
+        """Parse the body of *response* without validating it."""
+        value = response_codec(response).loads(response.content)
+        return value if self.key is None else value[self.key]
+
+    def __call__(self, response: httpx.Response, mode: ResponseMode = "model") -> T:
+        if mode == "raw":
+            return self.parse(response)  # type: ignore[no-any-return]
+        if mode == "lazy" and self._model is not None:
+            value = self.parse(response)
+            if self._many:
+                return [LazyModel(self._model, item) for item in value]  # type: ignore[return-value]
+            return LazyModel(self._model, value)  # type: ignore[return-value]
+        check_response_mode(mode)
+        return self.decode(response.content)
@@ -0,0 +1,233 @@
+"""Table-driven execution of API calls, shared by every resource."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+
+import httpx
+
+from credere._decode import Decoder, ResponseMode
+from credere._response import handle_request_error, raise_for_status
+from credere.codec import STDLIB_CODEC, JSONCodec
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint(Generic[T]):
+    """One API operation.
+
+    ``path`` is a :meth:`str.format` template filled positionally from the
+    call's path arguments. ``body_key`` wraps the request body in a one-key
+    envelope, e.g. ``{"lead": ...}``. The response is decoded by ``decoder``;
+    without one the body is ignored and the call returns ``None``. With
+    ``store_header=False`` the ``Store-Id`` header is never sent.
+    """
+
+    method: str
+    path: str
+    decoder: Decoder[T] | None = None
+    body_key: str | None = None
+    store_header: bool = True
+
+    def url(self, path_args: tuple[Any, ...]) -> str:
+        return self.path.format(*path_args) if path_args else self.path
+
+
+@lru_cache(maxsize=1024)
+def _headers(store_id: int | None, json_body: bool) -> Mapping[str, str]:
+    headers = {}
+    if store_id is not None:
+        headers["Store-Id"] = str(store_id)
+    if json_body:
+        headers["Content-Type"] = "application/json"
+    return headers
+
+
+class _BaseExecutor:
+    def __init__(
+        self,
+        client: httpx.Client | httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self.store_id = store_id
+        self.response_mode = response_mode
+        # Bodies are encoded here rather than passed as ``json=``, so plain
+        # httpx clients can send pydantic models too.
+        self.codec: JSONCodec = getattr(client, "codec", STDLIB_CODEC)
+        # Keyword arguments of a call with no body, params or store override,
+        # indexed by ``Endpoint.store_header``: the same for every such call.
+        headers = _headers(store_id, False)
+        self._static_kwargs: tuple[dict[str, Any], dict[str, Any]] = (
+            {},
+            {"headers": headers} if headers else {},
+        )
+        # Default-mode decoding skips the mode dispatch of ``Decoder.__call__``.
+        self._decode_models = response_mode == "model"
+
+    def _request_kwargs(
+        self,
+        endpoint: Endpoint[Any],
+        store_id: int | None,
+        params: Mapping[str, Any] | None,
+        body: Any,
+    ) -> dict[str, Any]:
+        if body is None and not params and store_id is None:
+            return self._static_kwargs[endpoint.store_header]
+        kwargs: dict[str, Any] = {}
+        if not endpoint.store_header:
+            store_id = None
+        elif store_id is None:
+            store_id = self.store_id
+        headers = _headers(store_id, body is not None)
+        if headers:
+            kwargs["headers"] = headers
+        if params:
+            kwargs["params"] = params
+        if body is not None:
+            kwargs["content"] = self.codec.encode(
+                body if endpoint.body_key is None else {endpoint.body_key: body}
+            )
+        return kwargs
+
+    def _decode(
+        self,
+        endpoint: Endpoint[T],
+        response: httpx.Response,
+        response_mode: ResponseMode | None,
+    ) -> T:
+        if endpoint.decoder is None:
+            return None  # type: ignore[return-value]
+        if response_mode is None and self._decode_models:
+            return endpoint.decoder.decode(response.content)
+        return endpoint.decoder(response, response_mode or self.response_mode)
+
+
+class Executor(_BaseExecutor):
+    """Sends :class:`Endpoint` calls through a sync client.
+
+    The ``Store-Id`` header for the default store is built once, and those
+    of per-call stores are cached, so a call only formats its path, sends
+    the request, maps errors and decodes the body.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        super().__init__(client, store_id, response_mode)
+        self.client = client
+
+    def __call__(
+        self,
+        endpoint: Endpoint[T],
+        *path_args: Any,
+        store_id: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        body: Any = None,
+        response_mode: ResponseMode | None = None,
+    ) -> T:
+        try:
+            response = self.client.request(
+                endpoint.method,
+                endpoint.url(path_args),
+                **self._request_kwargs(endpoint, store_id, params, body),
+            )
+        except httpx.HTTPError as exc:
+            handle_request_error(exc)
+            raise  # unreachable, satisfies type checker
+        raise_for_status(response)
+        return self._decode(endpoint, response, response_mode)
+
+    def stream(
+        self,
+        endpoint: Endpoint[list[T]],
+        *path_args: Any,
+        store_id: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> Iterator[T]:
+        """Yield the items of a list response as its body streams in."""
+        assert endpoint.decoder is not None
+        mode = response_mode or self.response_mode
+        try:
+            with self.client.stream(
+                endpoint.method,
+                endpoint.url(path_args),
+                **self._request_kwargs(endpoint, store_id, params, None),
+            ) as response:
+                if not response.is_success:
+                    response.read()
+                    raise_for_status(response)
+                yield from endpoint.decoder.iter_items(response.iter_bytes(), mode)
+        except httpx.HTTPError as exc:
+            handle_request_error(exc)
+            raise
+
+
+class AsyncExecutor(_BaseExecutor):
+    """Async counterpart of :class:`Executor`."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        super().__init__(client, store_id, response_mode)
+        self.client = client
+
+    async def __call__(
+        self,
+        endpoint: Endpoint[T],
+        *path_args: Any,
+        store_id: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        body: Any = None,
+        response_mode: ResponseMode | None = None,
+    ) -> T:
+        try:
+            response = await self.client.request(
+                endpoint.method,
+                endpoint.url(path_args),
+                **self._request_kwargs(endpoint, store_id, params, body),
+            )
+        except httpx.HTTPError as exc:
+            handle_request_error(exc)
+            raise
+        raise_for_status(response)
+        return self._decode(endpoint, response, response_mode)
+
+    async def stream(
+        self,
+        endpoint: Endpoint[list[T]],
+        *path_args: Any,
+        store_id: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> AsyncIterator[T]:
+        """Yield the items of a list response as its body streams in."""
+        assert endpoint.decoder is not None
+        mode = response_mode or self.response_mode
+        try:
+            async with self.client.stream(
+                endpoint.method,
+                endpoint.url(path_args),
+                **self._request_kwargs(endpoint, store_id, params, None),
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    raise_for_status(response)
+                async for item in endpoint.decoder.aiter_items(
+                    response.aiter_bytes(), mode
+                ):
+                    yield item
+        except httpx.HTTPError as exc:
+            handle_request_error(exc)
+            raise
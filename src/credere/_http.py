@@ -0,0 +1,51 @@
+"""``httpx`` clients that send and receive JSON through a :class:`JSONCodec`."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+from credere.codec import CODEC_EXTENSION, JSONCodec
+
+
+def _with_codec(codec: JSONCodec, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Encode a ``json=`` body with *codec* and attach *codec* to the request."""
+    body = kwargs.pop("json", None)
+    if body is not None:
+        headers = httpx.Headers(kwargs.get("headers"))
+        headers.setdefault("Content-Type", "application/json")
+        kwargs["headers"] = headers
+        kwargs["content"] = codec.encode(body)
+    kwargs["extensions"] = {**(kwargs.get("extensions") or {}), CODEC_EXTENSION: codec}
+    return kwargs
+
+
+class CodecClient(httpx.Client):
+    """``httpx.Client`` whose ``json=`` bodies are encoded by *codec*.
+
+    The codec is also attached to every request, so responses are decoded
+    with it (see :func:`~credere.codec.response_codec`).
+    """
+
+    def __init__(self, *, codec: JSONCodec, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.codec = codec
+
+    def build_request(
+        self, method: str, url: httpx.URL | str, **kwargs: Any
+    ) -> httpx.Request:
+        return super().build_request(method, url, **_with_codec(self.codec, kwargs))
+
+
+class AsyncCodecClient(httpx.AsyncClient):
+    """Async counterpart of :class:`CodecClient`."""
+
+    def __init__(self, *, codec: JSONCodec, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.codec = codec
+
+    def build_request(
+        self, method: str, url: httpx.URL | str, **kwargs: Any
+    ) -> httpx.Request:
+        return super().build_request(method, url, **_with_codec(self.codec, kwargs))
@@ -0,0 +1,94 @@
+"""Helpers that walk page-numbered list endpoints one page at a time."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def iter_pages(
+    fetch: Callable[[int], list[T]], *, start: int = 1, prefetch: bool = False
+) -> Iterator[T]:
+    """Yield the items of pages ``start, start + 1, ...`` until one is empty.
+
+    At most the current page (and, with *prefetch*, the next one, fetched on
+    a worker thread while the current page is consumed) is held in memory.
+    """
+    if not prefetch:
+        page = start
+        while items := fetch(page):
+            yield from items
+            page += 1
+        return
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="credere-page") as pool:
+        pending: Future[list[T]] = pool.submit(fetch, start)
+        try:
+            page = start
+            while items := pending.result():
+                page += 1
+                pending = pool.submit(fetch, page)
+                yield from items
+        finally:
+            pending.cancel()
+
+
+async def aiter_pages(
+    fetch: Callable[[int], Awaitable[list[T]]],
+    *,
+    start: int = 1,
+    prefetch: bool = False,
+    concurrency: int = 1,
+) -> AsyncIterator[T]:
+    """Async counterpart of :func:`iter_pages`.
+
+    Up to *concurrency* pages are requested at once, each in its own task,
+    and yielded in page order. When several pages are in flight, the length
+    of the first page is taken as the page size and iteration also stops at
+    the first shorter page; requests for pages past the end are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    eager = prefetch or concurrency > 1
+
+    async def load(page: int) -> list[T]:
+        return await fetch(page)
+
+    pending: deque[asyncio.Task[list[T]]] = deque()
+    next_page = start
+
+    def fill(size: int) -> None:
+        nonlocal next_page
+        while len(pending) < size:
+            pending.append(asyncio.create_task(load(next_page)))
+            next_page += 1
+
+    page_size: int | None = None
+    try:
+        fill(concurrency)
+        while pending:
+            items = await pending.popleft()
+            if not items:
+                return
+            if concurrency > 1:
+                if page_size is None:
+                    page_size = len(items)
+                elif len(items) < page_size:
+                    for item in items:
+                        yield item
+                    return
+            if eager:
+                fill(concurrency)
+            for item in items:
+                yield item
+            fill(concurrency)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
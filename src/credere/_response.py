@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import httpx
 
+from credere.codec import response_codec
 from credere.exceptions import (
     AuthenticationError,
     CredereAPIError,
@@ -13,10 +16,15 @@ from credere.exceptions import (
 )
 
 
+def json_body(response: httpx.Response) -> Any:
+    """Decode the JSON body of *response* with its client's codec."""
+    return response_codec(response).loads(response.content)
+
+
 def _parse_error_body(response: httpx.Response) -> tuple[str, dict | None]:
     """Extract an error message and body from the response."""
     try:
-        body = response.json()
+        body = json_body(response)
     except Exception:
         return response.text or f"HTTP {response.status_code}", None
 
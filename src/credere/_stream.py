@@ -0,0 +1,126 @@
+"""Incremental extraction of array items from a streamed JSON body."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Incomplete(Exception):
+    """More input is needed before the next value can be decoded."""
+
+
+class ArrayItemParser:
+    """Decodes the items of the array under *key* of a streamed JSON object.
+
+    Chunks are fed as they arrive and every complete item is returned as a
+    plain JSON value, decoded by the C scanner of :mod:`json`, so only the
+    item being parsed and the current chunk are held in memory however long
+    the array is. With *key* ``None`` the body itself must be the array.
+    The other values of the object are decoded and dropped.
+    """
+
+    def __init__(self, key: str | None) -> None:
+        self._key = key
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._state = "array" if key is None else "object"
+        self._member: str | None = None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Consume *chunk* and return the items it completed."""
+        if self._state == "done":
+            return []
+        self._text = self._text[self._pos :] + self._utf8.decode(chunk)
+        self._pos = 0
+        items: list[Any] = []
+        try:
+            while self._state != "done":
+                self._step(items)
+        except _Incomplete:
+            pass
+        return items
+
+    def close(self) -> None:
+        """Check that the whole array was seen once the body is exhausted."""
+        if self._state != "done":
+            target = "array" if self._key is None else f"{self._key!r} array"
+            raise ValueError(f"response body ended before the end of the {target}")
+
+    def _step(self, items: list[Any]) -> None:
+        state = self._state
+        if state == "item":
+            items.append(self._value())
+            self._state = "next_item"
+        elif state == "next_item":
+            if self._peek() == "]":
+                self._pos += 1
+                self._state = "done"
+            else:
+                self._expect(",")
+                self._state = "item"
+        elif state == "object":
+            self._expect("{")
+            self._state = "first_member"
+        elif state == "first_member":
+            self._check_more_members()
+            self._state = "member"
+        elif state == "member":
+            self._member = self._value()
+            self._state = "colon"
+        elif state == "colon":
+            self._expect(":")
+            self._state = "array" if self._member == self._key else "skip"
+        elif state == "skip":
+            self._value()
+            self._state = "next_member"
+        elif state == "next_member":
+            self._check_more_members()
+            self._expect(",")
+            self._state = "member"
+        elif state == "array":
+            self._expect("[")
+            self._state = "first_item"
+        elif state == "first_item":
+            if self._peek() == "]":
+                self._pos += 1
+                self._state = "done"
+            else:
+                self._state = "item"
+
+    def _check_more_members(self) -> None:
+        if self._peek() == "}":
+            raise ValueError(f"response body has no {self._key!r} array")
+
+    def _peek(self) -> str:
+        self._pos = _WHITESPACE.match(self._text, self._pos).end()  # type: ignore[union-attr]
+        if self._pos >= len(self._text):
+            raise _Incomplete
+        return self._text[self._pos]
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(
+                f"invalid JSON body: expected {char!r} at offset {self._pos}, "
+                f"got {found!r}"
+            )
+        self._pos += 1
+
+    def _value(self) -> Any:
+        self._peek()
+        try:
+            value, end = _DECODER.raw_decode(self._text, self._pos)
+        except json.JSONDecodeError:
+            raise _Incomplete from None
+        if end == len(self._text) and isinstance(value, int | float):
+            # A number may continue in the next chunk.
+            raise _Incomplete
+        self._pos = end
+        return value
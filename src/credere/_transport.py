@@ -0,0 +1,107 @@
+"""Transport wrappers shared by the sync and async clients."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+
+class SharedTransport(httpx.BaseTransport):
+    """Delegates to a transport owned elsewhere; closing it is a no-op."""
+
+    def __init__(self, wrapped: httpx.BaseTransport) -> None:
+        self.wrapped = wrapped
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.wrapped.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`SharedTransport`."""
+
+    def __init__(self, wrapped: httpx.AsyncBaseTransport) -> None:
+        self.wrapped = wrapped
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.wrapped.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+RawHeaders = list[tuple[bytes, bytes]]
+
+# Headers describing the encoded body; invalid once only the decoded one is left.
+_ENCODING_HEADERS = frozenset({b"content-encoding", b"content-length"})
+
+
+def _decoded_headers(response: httpx.Response) -> RawHeaders:
+    return [
+        (name, value)
+        for name, value in response.headers.raw
+        if name.lower() not in _ENCODING_HEADERS
+    ]
+
+
+def read_raw(response: httpx.Response) -> tuple[RawHeaders, bytes]:
+    """Read and close *response*, returning headers and body for replaying it.
+
+    The body is kept encoded alongside the original headers, so a replayed
+    response is decoded by its client exactly like the original. Responses
+    already read (e.g. by a mock transport) only hold the decoded body, in
+    which case the encoding headers are dropped.
+    """
+    try:
+        if response.is_stream_consumed:
+            return _decoded_headers(response), response.content
+        return list(response.headers.raw), b"".join(response.iter_raw())
+    finally:
+        response.close()
+
+
+async def aread_raw(response: httpx.Response) -> tuple[RawHeaders, bytes]:
+    """Async counterpart of :func:`read_raw`."""
+    try:
+        if response.is_stream_consumed:
+            return _decoded_headers(response), response.content
+        chunks = [chunk async for chunk in response.aiter_raw()]
+        return list(response.headers.raw), b"".join(chunks)
+    finally:
+        await response.aclose()
+
+
+def endpoint_family(path: str) -> str:
+    """Group a request path by resource, e.g. ``/v1/banks_api/leads/1`` -> ``leads``."""
+    segments = [segment for segment in path.split("/") if segment]
+    if segments and segments[0][:1] == "v" and segments[0][1:].isdigit():
+        segments = segments[1:]
+    if segments and segments[0] == "banks_api":
+        segments = segments[1:]
+    return segments[0] if segments else ""
+
+
+def innermost(
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport,
+) -> httpx.BaseTransport | httpx.AsyncBaseTransport:
+    """Follow ``wrapped`` links down to the transport doing the actual I/O."""
+    while (wrapped := getattr(transport, "wrapped", None)) is not None:
+        transport = wrapped
+    return transport
+
+
+def collect_metrics(
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport,
+) -> dict[str, Any]:
+    """Gather ``metrics()`` from every wrapper in a transport chain."""
+    metrics: dict[str, Any] = {}
+    current: Any = transport
+    while current is not None:
+        name = getattr(current, "metrics_name", None)
+        if name is not None:
+            metrics[name] = current.metrics()
+        current = getattr(current, "wrapped", None)
+    return metrics
@@ -0,0 +1,245 @@
+"""Bulk operations that run one API call per input item, concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[T]):
+    """Outcome of one item of a bulk operation.
+
+    ``index`` is the item's position in the input. Exactly one of ``value``
+    and ``error`` is set.
+    """
+
+    index: int
+    item: Any
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BulkStats:
+    """Point-in-time counters of a bulk operation."""
+
+    submitted: int
+    succeeded: int
+    failed: int
+    elapsed: float
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Completed items per second."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "completed": self.completed,
+            "throughput": self.throughput,
+        }
+
+
+class _BulkCounters:
+    def __init__(self, concurrency: int, clock: Callable[[], float]) -> None:
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        self._concurrency = concurrency
+        self._clock = clock
+        self._submitted = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._started: float | None = None
+        self._finished: float | None = None
+
+    def _record(self, result: BulkResult[Any]) -> BulkResult[Any]:
+        if result.ok:
+            self._succeeded += 1
+        else:
+            self._failed += 1
+        return result
+
+    def stats(self) -> BulkStats:
+        """Return the counters so far; ``elapsed`` stops once the run ends."""
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            end = self._finished if self._finished is not None else self._clock()
+            elapsed = end - self._started
+        return BulkStats(self._submitted, self._succeeded, self._failed, elapsed)
+
+
+class BulkRun(_BulkCounters, Generic[T]):
+    """Iterator over the results of a bulk operation, in completion order.
+
+    Input items are pulled lazily and at most ``concurrency`` calls run at
+    once, each on a worker thread. A failing call yields a
+    :class:`BulkResult` carrying the exception instead of stopping the run.
+    Nothing is sent until iteration starts. :meth:`close`, also called
+    when the run is garbage collected, cancels the calls not yet started
+    and waits for the running ones.
+    """
+
+    def __init__(
+        self,
+        call: Callable[[Any], T],
+        items: Iterable[Any],
+        *,
+        concurrency: int,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        super().__init__(concurrency, clock)
+        self._call = call
+        self._items = items
+        self._results = self._run()
+
+    def __iter__(self) -> Iterator[BulkResult[T]]:
+        return self
+
+    def __next__(self) -> BulkResult[T]:
+        return next(self._results)
+
+    def collect(self) -> list[BulkResult[T]]:
+        """Run the remaining items and return every result in input order."""
+        return sorted(self, key=lambda result: result.index)
+
+    def close(self) -> None:
+        """Stop the run without submitting the remaining items."""
+        self._results.close()
+
+    def _run(self) -> Generator[BulkResult[T]]:
+        self._started = self._clock()
+        items = enumerate(self._items)
+        pending: dict[Future[T], tuple[int, Any]] = {}
+        pool = ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="credere-bulk"
+        )
+        try:
+            while True:
+                for index, item in items:
+                    pending[pool.submit(self._call, item)] = (index, item)
+                    self._submitted += 1
+                    if len(pending) >= self._concurrency:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, item = pending.pop(future)
+                    yield self._record(_result(index, item, future))
+        finally:
+            self._finished = self._clock()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+class AsyncBulkRun(_BulkCounters, Generic[T]):
+    """Async counterpart of :class:`BulkRun`; calls run as asyncio tasks.
+
+    *items* may be a sync or an async iterable.
+    """
+
+    def __init__(
+        self,
+        call: Callable[[Any], Awaitable[T]],
+        items: Iterable[Any] | AsyncIterable[Any],
+        *,
+        concurrency: int,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        super().__init__(concurrency, clock)
+        self._call = call
+        self._items = items
+        self._results = self._run()
+
+    def __aiter__(self) -> AsyncIterator[BulkResult[T]]:
+        return self
+
+    async def __anext__(self) -> BulkResult[T]:
+        return await anext(self._results)
+
+    async def collect(self) -> list[BulkResult[T]]:
+        """Run the remaining items and return every result in input order."""
+        return sorted([result async for result in self], key=lambda r: r.index)
+
+    async def aclose(self) -> None:
+        """Stop the run, cancelling the calls in flight."""
+        await self._results.aclose()
+
+    async def _run(self) -> AsyncGenerator[BulkResult[T]]:
+        self._started = self._clock()
+        items = _aenumerate(self._items)
+        pending: dict[asyncio.Task[T], tuple[int, Any]] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self._concurrency:
+                    try:
+                        index, item = await anext(items)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(self._call(item))] = (index, item)
+                    self._submitted += 1
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index, item = pending.pop(task)
+                    yield self._record(_result(index, item, task))
+        finally:
+            self._finished = self._clock()
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _result(
+    index: int, item: Any, future: Future[T] | asyncio.Future[T]
+) -> BulkResult[T]:
+    error = future.exception()
+    if error is None:
+        return BulkResult(index, item, value=future.result())
+    if not isinstance(error, Exception):
+        raise error
+    return BulkResult(index, item, error=error)
+
+
+async def _aenumerate(
+    items: Iterable[Any] | AsyncIterable[Any],
+) -> AsyncIterator[tuple[int, Any]]:
+    if isinstance(items, AsyncIterable):
+        index = 0
+        async for item in items:
+            yield index, item
+            index += 1
+    else:
+        for pair in enumerate(items):
+            yield pair
@@ -0,0 +1,244 @@
+"""In-memory and on-disk caches used by cacheable SDK endpoints."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters of a cache."""
+
+    hits: int
+    misses: int
+    stale_hits: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class TTLCache:
+    """Thread-safe cache with per-entry expiry and least-recently-used eviction.
+
+    Entries are fresh for ``ttl`` seconds. With ``stale_while_revalidate``
+    set, an expired entry is still served for that many extra seconds while
+    the caller refreshes it in the background (see :meth:`lookup` and
+    :meth:`begin_refresh`). The lock is never held while computing values,
+    so the cache is safe to share between threads and asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 300.0,
+        *,
+        stale_while_revalidate: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        if ttl <= 0:
+            raise ValueError(f"ttl must be > 0, got {ttl}")
+        if stale_while_revalidate < 0:
+            raise ValueError("stale_while_revalidate must be >= 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._evictions = 0
+
+    def lookup(self, key: Hashable) -> tuple[Any, bool] | None:
+        """Return ``(value, is_stale)`` for *key*, or ``None`` on a miss."""
+        return self._find(key, self.stale_while_revalidate)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the fresh value for *key*, or *default*.
+
+        Unlike :meth:`lookup`, an expired entry is a miss even within the
+        ``stale_while_revalidate`` window, and is counted as one.
+        """
+        found = self._find(key, 0.0)
+        return default if found is None else found[0]
+
+    def _find(self, key: Hashable, grace: float) -> tuple[Any, bool] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                now = self._clock()
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value, False
+                if now < expires_at + grace:
+                    self._entries.move_to_end(key)
+                    self._stale_hits += 1
+                    return value, True
+                if now >= expires_at + self.stale_while_revalidate:
+                    del self._entries[key]
+            self._misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop *key*, or every entry when *key* is ``None``."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches *predicate*."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """Claim the background refresh of *key*; ``False`` if already claimed."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stale_hits=self._stale_hits,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+
+class DiskCache:
+    """Byte-value cache stored as one file per key under *directory*.
+
+    Reads refresh a file's modification time, and a write that takes the
+    cache beyond ``max_entries`` evicts the least recently used files, down
+    to 90% of ``max_entries`` so that the next writes need not scan the
+    directory again. Writes go through a temporary file and an atomic
+    rename, so several processes can share the directory; each keeps its
+    own count of the entries, recounted whenever it evicts.
+    """
+
+    _SUFFIX = ".entry"
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_entries: int = 4096
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._count = len(self._entries())
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{digest}{self._SUFFIX}"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data
+
+    def set(self, key: str, value: bytes) -> None:
+        path = self._path(key)
+        added = not path.exists()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(value)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+        with self._lock:
+            self._count += added
+            if self._count <= self.max_entries:
+                return
+            self._evict()
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop *key*, or every entry when *key* is ``None``."""
+        paths = [self._path(key)] if key is not None else self._entries()
+        removed = 0
+        for path in paths:
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+                removed += 1
+        with self._lock:
+            self._count = max(self._count - removed, 0)
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob(f"*{self._SUFFIX}"))
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        self._count = len(entries)
+        if self._count <= self.max_entries:
+            return
+        keep = self.max_entries - self.max_entries // 10
+
+        def mtime(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        entries.sort(key=mtime)
+        for path in entries[: len(entries) - keep]:
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+        self._count = keep
+
+    def __len__(self) -> int:
+        return len(self._entries())
@@ -0,0 +1,351 @@
+"""In-memory index of the vehicle model catalog for fast offline search."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import heapq
+import inspect
+import itertools
+import re
+import threading
+import unicodedata
+from collections.abc import Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from credere.models.vehicle_models import VehicleModel
+
+if TYPE_CHECKING:
+    from credere.resources.vehicle_models import AsyncVehicleModels, VehicleModels
+
+# Score of a query term matching a model token exactly, by prefix or by typo.
+_EXACT, _PREFIX, _FUZZY = 3, 2, 1
+# Shorter terms are too ambiguous to match with a typo.
+_MIN_FUZZY_LENGTH = 4
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN.findall(_normalize(text))
+
+
+def _code(text: str) -> str:
+    """``"001234-5"`` -> ``"0012345"``, so codes match however they are typed."""
+    return "".join(_tokens(text))
+
+
+def _deletions(token: str) -> set[str]:
+    return {token[:i] + token[i + 1 :] for i in range(len(token))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Whether one insertion, deletion, substitution or swap turns *a* into *b*."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diff = [i for i, (x, y) in enumerate(zip(a, b, strict=True)) if x != y]
+        return len(diff) <= 1 or (
+            len(diff) == 2
+            and diff[1] == diff[0] + 1
+            and a[diff[0]] == b[diff[1]]
+            and a[diff[1]] == b[diff[0]]
+        )
+    short, long = (a, b) if len(a) < len(b) else (b, a)
+    return any(long[:i] + long[i + 1 :] == short for i in range(len(long)))
+
+
+def _unique(docs: Iterable[int]) -> Iterator[int]:
+    seen: set[int] = set()
+    for doc in docs:
+        if doc not in seen:
+            seen.add(doc)
+            yield doc
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    model: VehicleModel
+    tokens: frozenset[str]
+    codes: frozenset[str]
+
+    @classmethod
+    def build(cls, model: VehicleModel) -> _Entry:
+        brand = model.vehicle_brand.name if model.vehicle_brand else None
+        text = " ".join(
+            value for value in (model.brand, brand, model.name, model.version) if value
+        )
+        codes = frozenset(
+            _code(value) for value in (model.molicar_code, model.fipe_code) if value
+        )
+        return cls(model, frozenset(_tokens(text)) | codes, codes)
+
+    def rank(self) -> tuple[Any, ...]:
+        """Order between models matching a query equally well."""
+        model = self.model
+        return (
+            model.active is False,
+            -(model.year_end or model.year_start or 0),
+            model.name or "",
+            model.version or "",
+        )
+
+    def covers(self, year: int) -> bool:
+        start, end = self.model.year_start, self.model.year_end
+        return (start is None or start <= year) and (end is None or year <= end)
+
+
+class _Index:
+    """Immutable postings built from a snapshot of the catalog."""
+
+    def __init__(self, entries: Iterable[_Entry]) -> None:
+        self.entries = sorted(entries, key=_Entry.rank)
+        self.postings: dict[str, list[int]] = {}
+        self.codes: dict[str, list[int]] = {}
+        for doc, entry in enumerate(self.entries):
+            for token in entry.tokens:
+                self.postings.setdefault(token, []).append(doc)
+            for code in entry.codes:
+                self.codes.setdefault(code, []).append(doc)
+        self.tokens = sorted(self.postings)
+        # Every word, and every way of deleting one of its characters, maps
+        # back to the word: two words one edit apart share a key. Numbers and
+        # codes are left out, a typo in them is a different model.
+        self.neighbours: dict[str, set[str]] = {}
+        for token in self.tokens:
+            if len(token) >= _MIN_FUZZY_LENGTH - 1 and not token.isdigit():
+                for key in _deletions(token) | {token}:
+                    self.neighbours.setdefault(key, set()).add(token)
+
+    def expand(self, term: str) -> dict[str, int]:
+        """Map every token *term* matches to its score: exact, prefix or typo."""
+        weights: dict[str, int] = {}
+        if len(term) >= _MIN_FUZZY_LENGTH:
+            for key in _deletions(term) | {term}:
+                for token in self.neighbours.get(key, ()):
+                    if _within_one_edit(term, token):
+                        weights[token] = _FUZZY
+        position = bisect.bisect_left(self.tokens, term)
+        while position < len(self.tokens) and self.tokens[position].startswith(term):
+            weights[self.tokens[position]] = _PREFIX
+            position += 1
+        if term in self.postings:
+            weights[term] = _EXACT
+        return weights
+
+    def docs(self, tokens: Iterable[str]) -> Iterator[int]:
+        """Yield the documents holding any of *tokens*, in rank order."""
+        return (
+            doc
+            for doc, _ in itertools.groupby(
+                heapq.merge(*(self.postings[token] for token in tokens))
+            )
+        )
+
+    def size(self, weights: dict[str, int]) -> int:
+        return sum(len(self.postings[token]) for token in weights)
+
+
+class VehicleCatalog:
+    """Searchable in-memory copy of the vehicle model catalog.
+
+    Load it once from :meth:`VehicleModels.list
+    <credere.resources.vehicle_models.VehicleModels.list>` with :meth:`load`
+    and query it locally with :meth:`search`. The index covers molicar and
+    FIPE codes, brand, name and version tokens and the model-year range.
+    Each refresh swaps in a new index, so searches never wait on a refresh
+    and can run from any thread.
+    """
+
+    def __init__(self, models: Iterable[VehicleModel] = ()) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, _Entry] = {}
+        self._index = _Index(())
+        self._stop: threading.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.replace(models)
+
+    @classmethod
+    def load(cls, resource: VehicleModels, **params: Any) -> VehicleCatalog:
+        """Build a catalog from *resource*; *params* are passed to the listing."""
+        catalog = cls()
+        catalog.refresh(resource, **params)
+        return catalog
+
+    @classmethod
+    async def aload(cls, resource: AsyncVehicleModels, **params: Any) -> VehicleCatalog:
+        """Async counterpart of :meth:`load`."""
+        catalog = cls()
+        await catalog.arefresh(resource, **params)
+        return catalog
+
+    def __len__(self) -> int:
+        return len(self._index.entries)
+
+    def search(
+        self, query: str, *, year: int | None = None, limit: int = 10
+    ) -> list[VehicleModel]:
+        """Return the models best matching *query*, best first.
+
+        A query equal to a molicar or FIPE code returns that model. Otherwise
+        every word must match a token of the model, exactly, as a prefix or
+        with one typo, and exact matches rank first. A four-digit word that
+        matches no token, e.g. ``"civic 2021"``, is read as a model year, as
+        is *year*.
+        """
+        index = self._index
+        terms = _tokens(query)
+        by_code = index.codes.get("".join(terms))
+        if by_code:
+            return [index.entries[doc].model for doc in by_code[:limit]]
+        words = []
+        for term in terms:
+            is_year = len(term) == 4 and term.isdigit() and term not in index.postings
+            if year is None and is_year:
+                year = int(term)
+                continue
+            words.append(term)
+        if not words and year is None:
+            return []
+        expansions = sorted((index.expand(word) for word in words), key=index.size)
+        if len(expansions) == 1:
+            # Walk the postings best score first, in rank order within each
+            # score, and stop as soon as there are enough matches.
+            weights = expansions[0]
+            tiers = [
+                index.docs(token for token in weights if weights[token] == score)
+                for score in (_EXACT, _PREFIX, _FUZZY)
+            ]
+            docs: Iterable[int] = _unique(itertools.chain(*tiers))
+        elif expansions:
+            # Score the models matching the rarest word, then narrow them
+            # down word by word, so later words only touch the survivors.
+            scores: dict[int, int] | None = None
+            for weights in expansions:
+                survivors = None if scores is None else set(scores)
+                found: dict[int, int] = {}
+                # Higher weights are applied last and win.
+                for token in sorted(weights, key=weights.__getitem__):
+                    postings = index.postings[token]
+                    hits = (
+                        postings
+                        if survivors is None
+                        else survivors.intersection(postings)
+                    )
+                    found.update(dict.fromkeys(hits, weights[token]))
+                if scores is not None:
+                    found = {doc: scores[doc] + weight for doc, weight in found.items()}
+                scores = found
+            assert scores is not None
+            docs = sorted(scores, key=lambda doc: (-scores[doc], doc))
+        else:
+            docs = range(len(index.entries))
+        if year is not None:
+            docs = (doc for doc in docs if index.entries[doc].covers(year))
+        return [index.entries[doc].model for doc in itertools.islice(docs, limit)]
+
+    def get(self, code: str) -> VehicleModel | None:
+        """Return the model with molicar or FIPE code *code*, if any."""
+        docs = self._index.codes.get(_code(code))
+        return self._index.entries[docs[0]].model if docs else None
+
+    def replace(self, models: Iterable[VehicleModel]) -> int:
+        """Make *models* the catalog's contents; return how many changed.
+
+        Models whose ``updated_at`` is unchanged since the last load keep
+        their indexed tokens, and the index is only rebuilt when a model was
+        added, changed or removed.
+        """
+        with self._lock:
+            entries: dict[Hashable, _Entry] = {}
+            changed = 0
+            for model in models:
+                key = model.id if model.id is not None else model.molicar_code
+                entry = self._entries.get(key)
+                if (
+                    entry is None
+                    or model.updated_at is None
+                    or entry.model.updated_at != model.updated_at
+                ):
+                    entry = _Entry.build(model)
+                    changed += 1
+                entries[key] = entry
+            changed += len(self._entries.keys() - entries.keys())
+            if changed:
+                self._entries = entries
+                self._index = _Index(entries.values())
+            return changed
+
+    def refresh(self, resource: VehicleModels, **params: Any) -> int:
+        """Reload the catalog from *resource*; return how many models changed."""
+        return self.replace(resource.iter_list(response_mode="model", **params))
+
+    async def arefresh(self, resource: AsyncVehicleModels, **params: Any) -> int:
+        """Async counterpart of :meth:`refresh`."""
+        models = [
+            model async for model in resource.iter_list(response_mode="model", **params)
+        ]
+        return self.replace(models)
+
+    def start_refresh(
+        self,
+        resource: VehicleModels | AsyncVehicleModels,
+        interval: float,
+        **params: Any,
+    ) -> None:
+        """Refresh from *resource* every *interval* seconds in the background.
+
+        A sync resource is refreshed from a daemon thread; an async one from
+        a task on the running event loop. A failed refresh keeps the current
+        contents until the next attempt. Stop with :meth:`stop_refresh`.
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        self.stop_refresh()
+        if inspect.iscoroutinefunction(resource.list):
+            self._task = asyncio.get_running_loop().create_task(
+                self._arefresh_every(resource, interval, params)  # type: ignore[arg-type]
+            )
+            return
+        stop = self._stop = threading.Event()
+        threading.Thread(
+            target=self._refresh_every,
+            args=(resource, interval, params, stop),
+            name="credere-catalog-refresh",
+            daemon=True,
+        ).start()
+
+    def stop_refresh(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _refresh_every(
+        self,
+        resource: VehicleModels,
+        interval: float,
+        params: dict[str, Any],
+        stop: threading.Event,
+    ) -> None:
+        while not stop.wait(interval):
+            # Keep serving the current catalog until the next attempt.
+            with contextlib.suppress(Exception):
+                self.refresh(resource, **params)
+
+    async def _arefresh_every(
+        self, resource: AsyncVehicleModels, interval: float, params: dict[str, Any]
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            with contextlib.suppress(Exception):
+                await self.arefresh(resource, **params)
@@ -0,0 +1,290 @@
+"""Per-endpoint circuit breakers for the Credere clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+import httpx
+
+from credere._transport import endpoint_family
+from credere.exceptions import CircuitOpenError
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Thresholds that trip the circuit for an endpoint family.
+
+    The breaker looks at the last ``window_size`` calls of a family. Once at
+    least ``minimum_calls`` were seen, the circuit opens when the share of
+    failed calls reaches ``failure_rate_threshold`` or the share of calls
+    slower than ``slow_call_duration`` seconds reaches
+    ``slow_call_rate_threshold``. After ``open_duration`` seconds the
+    circuit lets ``half_open_max_calls`` trial calls through: if they all
+    succeed it closes, otherwise it opens again.
+
+    Transport errors and responses in ``failure_statuses`` count as failures.
+    """
+
+    failure_rate_threshold: float = 0.5
+    slow_call_rate_threshold: float = 1.0
+    slow_call_duration: float | None = None
+    window_size: int = 20
+    minimum_calls: int = 10
+    open_duration: float = 30.0
+    half_open_max_calls: int = 1
+    failure_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+
+    def __post_init__(self) -> None:
+        for name in ("failure_rate_threshold", "slow_call_rate_threshold"):
+            value = getattr(self, name)
+            if not 0 < value <= 1:
+                raise ValueError(f"{name} must be in (0, 1], got {value}")
+        if self.window_size < 1 or self.half_open_max_calls < 1:
+            raise ValueError("window_size and half_open_max_calls must be >= 1")
+        if not 1 <= self.minimum_calls <= self.window_size:
+            raise ValueError("minimum_calls must be between 1 and window_size")
+        if self.open_duration < 0:
+            raise ValueError(f"open_duration must be >= 0, got {self.open_duration}")
+
+
+class CircuitBreaker:
+    """Closed / open / half-open state machine for one endpoint family.
+
+    Thread-safe; the lock is never held across I/O, so the same breaker
+    also works from asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=config.window_size)
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.config.open_duration
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trials = 0
+            self._trial_successes = 0
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._window.clear()
+
+    def before_call(self) -> None:
+        """Reserve a call, raising :class:`CircuitOpenError` if it must not run."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state is CircuitState.CLOSED:
+                return
+            if (
+                self._state is CircuitState.HALF_OPEN
+                and self._trials < self.config.half_open_max_calls
+            ):
+                self._trials += 1
+                return
+            self.rejected += 1
+            if self._state is CircuitState.OPEN:
+                retry_after = self._opened_at + self.config.open_duration
+                retry_after -= self._clock()
+            else:
+                retry_after = 0.0
+            raise CircuitOpenError(self.name, max(0.0, retry_after))
+
+    def record(self, *, failed: bool, duration: float) -> None:
+        """Record the outcome of a call reserved with :meth:`before_call`."""
+        config = self.config
+        slow = (
+            config.slow_call_duration is not None
+            and duration >= config.slow_call_duration
+        )
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                if failed or slow:
+                    self._open()
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= config.half_open_max_calls:
+                    self._state = CircuitState.CLOSED
+                    self._window.clear()
+                return
+            if self._state is CircuitState.OPEN:
+                return
+            self._window.append((failed, slow))
+            calls = len(self._window)
+            if calls < config.minimum_calls:
+                return
+            failures = sum(1 for f, _ in self._window if f)
+            slow_calls = sum(1 for _, s in self._window if s)
+            if (
+                failures / calls >= config.failure_rate_threshold
+                or slow_calls / calls >= config.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """Give back a half-open trial slot for a call that never completed."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open()
+            calls = len(self._window)
+            failures = sum(1 for f, _ in self._window if f)
+            return {
+                "state": str(self._state),
+                "calls": calls,
+                "failure_rate": failures / calls if calls else 0.0,
+                "rejected": self.rejected,
+            }
+
+
+class _Breakers:
+    """Lazily created breakers, one per endpoint family."""
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig,
+        key: Callable[[str], str],
+        clock: Callable[[], float],
+    ) -> None:
+        self._config = config
+        self._key = key
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def for_request(self, request: httpx.Request) -> CircuitBreaker:
+        name = self._key(request.url.path)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    name, CircuitBreaker(name, self._config, clock=self._clock)
+                )
+        return breaker
+
+    def get(self, name: str) -> CircuitBreaker | None:
+        return self._breakers.get(name)
+
+    def metrics(self) -> dict[str, Any]:
+        return {name: b.snapshot() for name, b in sorted(self._breakers.items())}
+
+
+class CircuitBreakerTransport(httpx.BaseTransport):
+    """Fails fast with :class:`CircuitOpenError` while a family's circuit is open."""
+
+    metrics_name = "circuit_breaker"
+
+    def __init__(
+        self,
+        wrapped: httpx.BaseTransport,
+        config: CircuitBreakerConfig,
+        *,
+        key: Callable[[str], str] = endpoint_family,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.wrapped = wrapped
+        self.config = config
+        self.breakers = _Breakers(config, key, clock)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self.breakers.for_request(request)
+        breaker.before_call()
+        start = time.monotonic()
+        try:
+            response = self.wrapped.handle_request(request)
+        except httpx.TransportError:
+            breaker.record(failed=True, duration=time.monotonic() - start)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record(
+            failed=response.status_code in self.config.failure_statuses,
+            duration=time.monotonic() - start,
+        )
+        return response
+
+    def metrics(self) -> dict[str, Any]:
+        return self.breakers.metrics()
+
+    def close(self) -> None:
+        self.wrapped.close()
+
+
+class AsyncCircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`CircuitBreakerTransport`."""
+
+    metrics_name = "circuit_breaker"
+
+    def __init__(
+        self,
+        wrapped: httpx.AsyncBaseTransport,
+        config: CircuitBreakerConfig,
+        *,
+        key: Callable[[str], str] = endpoint_family,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.wrapped = wrapped
+        self.config = config
+        self.breakers = _Breakers(config, key, clock)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self.breakers.for_request(request)
+        breaker.before_call()
+        start = time.monotonic()
+        try:
+            response = await self.wrapped.handle_async_request(request)
+        except httpx.TransportError:
+            breaker.record(failed=True, duration=time.monotonic() - start)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record(
+            failed=response.status_code in self.config.failure_statuses,
+            duration=time.monotonic() - start,
+        )
+        return response
+
+    def metrics(self) -> dict[str, Any]:
+        return self.breakers.metrics()
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
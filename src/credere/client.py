@@ -2,29 +2,149 @@
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
+import warnings
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
+
 import httpx
 
+from credere._decode import ResponseMode, check_response_mode
+from credere._http import AsyncCodecClient, CodecClient
+from credere._transport import (
+    AsyncSharedTransport,
+    SharedTransport,
+    collect_metrics,
+    innermost,
+)
 from credere.auth import APIKeyAuth
-from credere.resources.bank_credentials import AsyncBankCredentials, BankCredentials
-from credere.resources.customers import AsyncCustomers, Customers
-from credere.resources.leads import AsyncLeads, Leads
-from credere.resources.plus_returns import AsyncPlusReturns, PlusReturns
-from credere.resources.proposal_attempts import AsyncProposalAttempts, ProposalAttempts
-from credere.resources.proposals import AsyncProposals, Proposals
-from credere.resources.simulations import AsyncSimulations, Simulations
-from credere.resources.stock import AsyncStock, Stock
-from credere.resources.stores import AsyncStores, Stores
-from credere.resources.users import AsyncUsers, Users
-from credere.resources.utilities import AsyncUtilities, Utilities
-from credere.resources.vehicle_models import AsyncVehicleModels, VehicleModels
+from credere.codec import JSONCodec, resolve_codec
+from credere.config import PoolConfig
+
+if TYPE_CHECKING:
+    from credere.cache import TTLCache
+    from credere.circuit_breaker import CircuitBreakerConfig
+    from credere.http_cache import HTTPCache
+    from credere.rate_limit import RateLimiter
+    from credere.resources.bank_credentials import AsyncBankCredentials, BankCredentials
+    from credere.resources.customers import AsyncCustomers, Customers
+    from credere.resources.leads import AsyncLeads, Leads
+    from credere.resources.plus_returns import AsyncPlusReturns, PlusReturns
+    from credere.resources.proposal_attempts import (
+        AsyncProposalAttempts,
+        ProposalAttempts,
+    )
+    from credere.resources.proposals import AsyncProposals, Proposals
+    from credere.resources.simulations import AsyncSimulations, Simulations
+    from credere.resources.stock import AsyncStock, Stock
+    from credere.resources.stores import AsyncStores, Stores
+    from credere.resources.users import AsyncUsers, Users
+    from credere.resources.utilities import AsyncUtilities, Utilities
+    from credere.resources.vehicle_models import AsyncVehicleModels, VehicleModels
+    from credere.retry import RetryPolicy
+    from credere.sqlite_cache import SQLiteCache
 
 _DEFAULT_BASE_URL = "https://api.credere.com"
 _DEFAULT_TIMEOUT = 30.0
 
+R = TypeVar("R")
+
+
+class _Resource(Generic[R]):
+    """Client attribute that builds its resource on first access.
+
+    The resource module, and the models it imports, are only loaded when
+    the attribute is first read; the instance is then stored in the
+    client's ``__dict__``, which shadows the descriptor. *options* maps
+    extra constructor arguments to the client attributes holding them.
+    """
+
+    def __init__(self, module: str, name: str, **options: str) -> None:
+        self._module = module
+        self._class = name
+        self._options = options
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self._attr = attr
+
+    @overload
+    def __get__(self, client: None, owner: type) -> _Resource[R]: ...
+
+    @overload
+    def __get__(self, client: object, owner: type) -> R: ...
+
+    def __get__(self, client: object, owner: type) -> R | _Resource[R]:
+        if client is None:
+            return self
+        cls = getattr(importlib.import_module(self._module), self._class)
+        resource: R = cls(
+            client._http,  # type: ignore[attr-defined]
+            store_id=client._store_id,  # type: ignore[attr-defined]
+            response_mode=client._response_mode,  # type: ignore[attr-defined]
+            **{arg: getattr(client, attr) for arg, attr in self._options.items()},
+        )
+        client.__dict__[self._attr] = resource
+        return resource
+
+
+def _resolve_http2(http2: bool) -> bool:
+    """Return whether HTTP/2 can be used, warning when ``h2`` is missing."""
+    if http2 and importlib.util.find_spec("h2") is None:
+        warnings.warn(
+            "http2=True requires the 'h2' package (pip install credere-sdk[http2]); "
+            "falling back to HTTP/1.1",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return False
+    return http2
+
+
+def _pool_metrics(
+    pool: PoolConfig, transport: httpx.BaseTransport | httpx.AsyncBaseTransport
+) -> dict[str, Any]:
+    """Describe the configured pool and, when available, its live connections."""
+    metrics = pool.as_dict()
+    pool_impl = getattr(innermost(transport), "_pool", None)
+    connections = getattr(pool_impl, "connections", None)
+    if connections is not None:
+        metrics["connections"] = len(connections)
+        metrics["idle_connections"] = sum(1 for c in connections if c.is_idle())
+    return metrics
+
 
 class CredereClient:
     """Synchronous client for the Credere API."""
 
+    leads: _Resource[Leads] = _Resource("credere.resources.leads", "Leads")
+    proposals: _Resource[Proposals] = _Resource(
+        "credere.resources.proposals", "Proposals"
+    )
+    simulations: _Resource[Simulations] = _Resource(
+        "credere.resources.simulations", "Simulations", cache="_simulation_cache"
+    )
+    bank_credentials: _Resource[BankCredentials] = _Resource(
+        "credere.resources.bank_credentials", "BankCredentials"
+    )
+    customers: _Resource[Customers] = _Resource(
+        "credere.resources.customers", "Customers"
+    )
+    plus_returns: _Resource[PlusReturns] = _Resource(
+        "credere.resources.plus_returns", "PlusReturns"
+    )
+    stock: _Resource[Stock] = _Resource("credere.resources.stock", "Stock")
+    utilities: _Resource[Utilities] = _Resource(
+        "credere.resources.utilities", "Utilities", cache="_reference_cache"
+    )
+    vehicle_models: _Resource[VehicleModels] = _Resource(
+        "credere.resources.vehicle_models", "VehicleModels"
+    )
+    proposal_attempts: _Resource[ProposalAttempts] = _Resource(
+        "credere.resources.proposal_attempts", "ProposalAttempts"
+    )
+    stores: _Resource[Stores] = _Resource("credere.resources.stores", "Stores")
+    users: _Resource[Users] = _Resource("credere.resources.users", "Users")
+
     def __init__(
         self,
         api_key: str,
@@ -32,25 +152,83 @@ class CredereClient:
         base_url: str = _DEFAULT_BASE_URL,
         timeout: float = _DEFAULT_TIMEOUT,
         store_id: int | None = None,
+        pool: PoolConfig | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        reference_cache: TTLCache | None = None,
+        simulation_cache: TTLCache | None = None,
+        http_cache: HTTPCache | None = None,
+        sqlite_cache: SQLiteCache | None = None,
+        response_mode: ResponseMode = "model",
+        codec: str | JSONCodec = "auto",
     ) -> None:
+        response_mode = check_response_mode(response_mode)
+        self._codec = resolve_codec(codec)
         self._store_id = store_id
-        self._http = httpx.Client(
+        self._response_mode = response_mode
+        self._reference_cache = reference_cache
+        self._simulation_cache = simulation_cache
+        self._pool = pool or PoolConfig()
+        self._http2 = _resolve_http2(http2)
+        self._transport: httpx.BaseTransport
+        if transport is not None:
+            # Owned by the caller (e.g. a client factory); never closed here.
+            self._transport = SharedTransport(transport)
+        else:
+            self._transport = httpx.HTTPTransport(
+                limits=self._pool.limits(), http2=self._http2
+            )
+        # Each wrapper is imported only when its option is set, so a plain
+        # client never loads sqlite3 or the other wrappers' dependencies.
+        if circuit_breaker is not None:
+            from credere.circuit_breaker import CircuitBreakerTransport
+
+            self._transport = CircuitBreakerTransport(self._transport, circuit_breaker)
+        if rate_limiter is not None:
+            from credere.rate_limit import RateLimitTransport
+
+            self._transport = RateLimitTransport(self._transport, rate_limiter)
+        if retry is not None:
+            from credere.retry import RetryTransport
+
+            self._transport = RetryTransport(self._transport, retry)
+        if http_cache is not None:
+            from credere.http_cache import HTTPCacheTransport
+
+            self._transport = HTTPCacheTransport(self._transport, http_cache)
+        if sqlite_cache is not None:
+            from credere.sqlite_cache import SQLiteCacheTransport
+
+            self._transport = SQLiteCacheTransport(self._transport, sqlite_cache)
+        if coalesce_requests:
+            from credere.coalesce import CoalescingTransport
+
+            self._transport = CoalescingTransport(self._transport)
+        self._http = CodecClient(
+            codec=self._codec,
             base_url=base_url,
             auth=APIKeyAuth(api_key),
-            timeout=timeout,
+            timeout=self._pool.timeout(timeout),
+            transport=self._transport,
         )
-        self.leads = Leads(self._http, store_id=store_id)
-        self.proposals = Proposals(self._http, store_id=store_id)
-        self.simulations = Simulations(self._http, store_id=store_id)
-        self.bank_credentials = BankCredentials(self._http, store_id=store_id)
-        self.customers = Customers(self._http, store_id=store_id)
-        self.plus_returns = PlusReturns(self._http, store_id=store_id)
-        self.stock = Stock(self._http, store_id=store_id)
-        self.utilities = Utilities(self._http, store_id=store_id)
-        self.vehicle_models = VehicleModels(self._http, store_id=store_id)
-        self.proposal_attempts = ProposalAttempts(self._http, store_id=store_id)
-        self.stores = Stores(self._http, store_id=store_id)
-        self.users = Users(self._http, store_id=store_id)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return a snapshot of client configuration and runtime counters."""
+        metrics = {
+            "pool": _pool_metrics(self._pool, self._transport),
+            "http2": self._http2,
+            "codec": self._codec.name,
+            **collect_metrics(self._transport),
+        }
+        if self._reference_cache is not None:
+            metrics["reference_cache"] = self._reference_cache.stats().as_dict()
+        if self._simulation_cache is not None:
+            metrics["simulation_cache"] = self._simulation_cache.stats().as_dict()
+        return metrics
 
     def close(self) -> None:
         self._http.close()
@@ -65,6 +243,37 @@ class CredereClient:
 class AsyncCredereClient:
     """Asynchronous client for the Credere API."""
 
+    leads: _Resource[AsyncLeads] = _Resource("credere.resources.leads", "AsyncLeads")
+    proposals: _Resource[AsyncProposals] = _Resource(
+        "credere.resources.proposals", "AsyncProposals"
+    )
+    simulations: _Resource[AsyncSimulations] = _Resource(
+        "credere.resources.simulations", "AsyncSimulations", cache="_simulation_cache"
+    )
+    bank_credentials: _Resource[AsyncBankCredentials] = _Resource(
+        "credere.resources.bank_credentials", "AsyncBankCredentials"
+    )
+    customers: _Resource[AsyncCustomers] = _Resource(
+        "credere.resources.customers", "AsyncCustomers"
+    )
+    plus_returns: _Resource[AsyncPlusReturns] = _Resource(
+        "credere.resources.plus_returns", "AsyncPlusReturns"
+    )
+    stock: _Resource[AsyncStock] = _Resource("credere.resources.stock", "AsyncStock")
+    utilities: _Resource[AsyncUtilities] = _Resource(
+        "credere.resources.utilities", "AsyncUtilities", cache="_reference_cache"
+    )
+    vehicle_models: _Resource[AsyncVehicleModels] = _Resource(
+        "credere.resources.vehicle_models", "AsyncVehicleModels"
+    )
+    proposal_attempts: _Resource[AsyncProposalAttempts] = _Resource(
+        "credere.resources.proposal_attempts", "AsyncProposalAttempts"
+    )
+    stores: _Resource[AsyncStores] = _Resource(
+        "credere.resources.stores", "AsyncStores"
+    )
+    users: _Resource[AsyncUsers] = _Resource("credere.resources.users", "AsyncUsers")
+
     def __init__(
         self,
         api_key: str,
@@ -72,25 +281,83 @@ class AsyncCredereClient:
         base_url: str = _DEFAULT_BASE_URL,
         timeout: float = _DEFAULT_TIMEOUT,
         store_id: int | None = None,
+        pool: PoolConfig | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        reference_cache: TTLCache | None = None,
+        simulation_cache: TTLCache | None = None,
+        http_cache: HTTPCache | None = None,
+        sqlite_cache: SQLiteCache | None = None,
+        response_mode: ResponseMode = "model",
+        codec: str | JSONCodec = "auto",
     ) -> None:
+        response_mode = check_response_mode(response_mode)
+        self._codec = resolve_codec(codec)
         self._store_id = store_id
-        self._http = httpx.AsyncClient(
+        self._response_mode = response_mode
+        self._reference_cache = reference_cache
+        self._simulation_cache = simulation_cache
+        self._pool = pool or PoolConfig()
+        self._http2 = _resolve_http2(http2)
+        self._transport: httpx.AsyncBaseTransport
+        if transport is not None:
+            # Owned by the caller (e.g. a client factory); never closed here.
+            self._transport = AsyncSharedTransport(transport)
+        else:
+            self._transport = httpx.AsyncHTTPTransport(
+                limits=self._pool.limits(), http2=self._http2
+            )
+        if circuit_breaker is not None:
+            from credere.circuit_breaker import AsyncCircuitBreakerTransport
+
+            self._transport = AsyncCircuitBreakerTransport(
+                self._transport, circuit_breaker
+            )
+        if rate_limiter is not None:
+            from credere.rate_limit import AsyncRateLimitTransport
+
+            self._transport = AsyncRateLimitTransport(self._transport, rate_limiter)
+        if retry is not None:
+            from credere.retry import AsyncRetryTransport
+
+            self._transport = AsyncRetryTransport(self._transport, retry)
+        if http_cache is not None:
+            from credere.http_cache import AsyncHTTPCacheTransport
+
+            self._transport = AsyncHTTPCacheTransport(self._transport, http_cache)
+        if sqlite_cache is not None:
+            from credere.sqlite_cache import AsyncSQLiteCacheTransport
+
+            self._transport = AsyncSQLiteCacheTransport(self._transport, sqlite_cache)
+        if coalesce_requests:
+            from credere.coalesce import AsyncCoalescingTransport
+
+            self._transport = AsyncCoalescingTransport(self._transport)
+        self._http = AsyncCodecClient(
+            codec=self._codec,
             base_url=base_url,
             auth=APIKeyAuth(api_key),
-            timeout=timeout,
+            timeout=self._pool.timeout(timeout),
+            transport=self._transport,
         )
-        self.leads = AsyncLeads(self._http, store_id=store_id)
-        self.proposals = AsyncProposals(self._http, store_id=store_id)
-        self.simulations = AsyncSimulations(self._http, store_id=store_id)
-        self.bank_credentials = AsyncBankCredentials(self._http, store_id=store_id)
-        self.customers = AsyncCustomers(self._http, store_id=store_id)
-        self.plus_returns = AsyncPlusReturns(self._http, store_id=store_id)
-        self.stock = AsyncStock(self._http, store_id=store_id)
-        self.utilities = AsyncUtilities(self._http, store_id=store_id)
-        self.vehicle_models = AsyncVehicleModels(self._http, store_id=store_id)
-        self.proposal_attempts = AsyncProposalAttempts(self._http, store_id=store_id)
-        self.stores = AsyncStores(self._http, store_id=store_id)
-        self.users = AsyncUsers(self._http, store_id=store_id)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return a snapshot of client configuration and runtime counters."""
+        metrics = {
+            "pool": _pool_metrics(self._pool, self._transport),
+            "http2": self._http2,
+            "codec": self._codec.name,
+            **collect_metrics(self._transport),
+        }
+        if self._reference_cache is not None:
+            metrics["reference_cache"] = self._reference_cache.stats().as_dict()
+        if self._simulation_cache is not None:
+            metrics["simulation_cache"] = self._simulation_cache.stats().as_dict()
+        return metrics
 
     async def close(self) -> None:
         await self._http.aclose()
@@ -0,0 +1,180 @@
+"""Single-flight coalescing of identical in-flight GET requests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import httpx
+
+from credere._transport import RawHeaders, aread_raw, read_raw
+
+_COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _request_key(request: httpx.Request) -> tuple[str, ...]:
+    """Identify requests that are guaranteed to get the same answer."""
+    headers = request.headers
+    return (
+        request.method,
+        str(request.url),
+        headers.get("Store-Id", ""),
+        headers.get("Authorization", ""),
+    )
+
+
+class _Result:
+    """Raw outcome of the leader's request, replayable for every waiter."""
+
+    def __init__(self, status_code: int, headers: RawHeaders, content: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def response(self) -> httpx.Response:
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.content
+        )
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: _Result | None = None
+        self.error: BaseException | None = None
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.coalesced = 0
+
+    def as_dict(self, in_flight: int) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": in_flight,
+        }
+
+
+class CoalescingTransport(httpx.BaseTransport):
+    """Shares one upstream call between threads issuing the same GET.
+
+    The first thread to ask for a given method, URL, ``Store-Id`` and
+    credentials performs the request; threads asking for the same thing
+    while it is in flight wait for it and receive a copy of its response
+    (or its exception).
+    """
+
+    metrics_name = "coalescing"
+
+    def __init__(self, wrapped: httpx.BaseTransport) -> None:
+        self.wrapped = wrapped
+        self._lock = threading.Lock()
+        self._in_flight: dict[tuple[str, ...], _Call] = {}
+        self._stats = _Stats()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in _COALESCED_METHODS:
+            return self.wrapped.handle_request(request)
+        key = _request_key(request)
+        with self._lock:
+            self._stats.requests += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._in_flight[key] = _Call()
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            assert call.result is not None
+            return call.result.response()
+
+        try:
+            response = self.wrapped.handle_request(request)
+            headers, content = read_raw(response)
+            call.result = _Result(response.status_code, headers, content)
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result.response()
+
+    def metrics(self) -> dict[str, Any]:
+        return self._stats.as_dict(len(self._in_flight))
+
+    def close(self) -> None:
+        self.wrapped.close()
+
+
+class _Flight:
+    """One upstream call shared by the tasks awaiting it."""
+
+    def __init__(self, task: asyncio.Task[_Result]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncCoalescingTransport(httpx.AsyncBaseTransport):
+    """Shares one upstream call between tasks issuing the same GET.
+
+    The call runs in its own task, which every caller, the first included,
+    awaits through :func:`asyncio.shield`: a cancelled caller only stops
+    waiting, and the call is cancelled once nobody waits for it anymore.
+    """
+
+    metrics_name = "coalescing"
+
+    def __init__(self, wrapped: httpx.AsyncBaseTransport) -> None:
+        self.wrapped = wrapped
+        self._in_flight: dict[tuple[str, ...], _Flight] = {}
+        self._stats = _Stats()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in _COALESCED_METHODS:
+            return await self.wrapped.handle_async_request(request)
+        key = _request_key(request)
+        self._stats.requests += 1
+        flight = self._in_flight.get(key)
+        if flight is None:
+            task = asyncio.get_running_loop().create_task(self._fetch(request))
+            flight = self._in_flight[key] = _Flight(task)
+            task.add_done_callback(lambda _: self._land(key, flight))
+        else:
+            self._stats.coalesced += 1
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+        return result.response()
+
+    async def _fetch(self, request: httpx.Request) -> _Result:
+        response = await self.wrapped.handle_async_request(request)
+        headers, content = await aread_raw(response)
+        return _Result(response.status_code, headers, content)
+
+    def _land(self, key: tuple[str, ...], flight: _Flight) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every caller gave up waiting.
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+    def metrics(self) -> dict[str, Any]:
+        return self._stats.as_dict(len(self._in_flight))
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
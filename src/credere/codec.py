@@ -0,0 +1,142 @@
+"""JSON codecs used to encode request bodies and decode response bodies."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+# ``Request.extensions`` key under which the sending client's codec travels,
+# so whoever reads the response decodes it with the same codec.
+CODEC_EXTENSION = "credere_codec"
+
+
+class JSONCodec(ABC):
+    """Base class for JSON backends.
+
+    Subclasses implement :meth:`dumps` and :meth:`loads`. :meth:`encode`
+    builds request bodies: pydantic models, alone or as the values of a
+    top-level envelope dict, are serialized with ``model_dump_json``
+    straight to bytes, without an intermediate dict, and ``None`` fields
+    are left out.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes: ...
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any: ...
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a request body."""
+        if isinstance(value, BaseModel):
+            return value.model_dump_json(exclude_none=True).encode()
+        if isinstance(value, dict) and any(
+            isinstance(item, BaseModel) for item in value.values()
+        ):
+            members = b",".join(
+                self.dumps(str(key)) + b":" + self.encode(item)
+                for key, item in value.items()
+            )
+            return b"{" + members + b"}"
+        return self.dumps(value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibCodec(JSONCodec):
+    """The standard library :mod:`json` module."""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """`orjson <https://github.com/ijl/orjson>`_ (``pip install orjson``)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._orjson: Any = importlib.import_module("orjson")
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """`msgspec <https://jcristharif.com/msgspec/>`_ (``pip install msgspec``)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        msgspec: Any = importlib.import_module("msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+_BACKENDS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+STDLIB_CODEC = StdlibCodec()
+
+
+def resolve_codec(codec: str | JSONCodec) -> JSONCodec:
+    """Return the codec for *codec*, a backend name, ``"auto"`` or an instance.
+
+    ``"auto"`` picks the fastest installed backend and falls back to the
+    standard library.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for name in ("orjson", "msgspec"):
+            if importlib.util.find_spec(name) is not None:
+                return _BACKENDS[name]()
+        return STDLIB_CODEC
+    if codec == "json":
+        return STDLIB_CODEC
+    if codec not in _BACKENDS:
+        raise ValueError(
+            f"unknown JSON codec {codec!r}; expected 'auto', "
+            f"{', '.join(map(repr, _BACKENDS))} or a JSONCodec instance"
+        )
+    if importlib.util.find_spec(codec) is None:
+        raise ImportError(f"the {codec!r} JSON codec requires 'pip install {codec}'")
+    return _BACKENDS[codec]()
+
+
+def response_codec(response: httpx.Response) -> JSONCodec:
+    """Return the codec of the client that sent *response*."""
+    try:
+        extensions = response.request.extensions
+    except RuntimeError:  # built by hand, without a request
+        return STDLIB_CODEC
+    codec = extensions.get(CODEC_EXTENSION)
+    return codec if isinstance(codec, JSONCodec) else STDLIB_CODEC
@@ -0,0 +1,72 @@
+"""Connection pool and timeout configuration for the Credere clients."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool limits and per-phase timeouts.
+
+    Any timeout left as ``None`` falls back to the client-wide ``timeout``.
+    ``keepalive_expiry`` is the number of seconds an idle connection is
+    kept open before being closed.
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("max_connections", "max_keepalive_connections"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be >= 1, got {value}")
+        for name in (
+            "keepalive_expiry",
+            "connect_timeout",
+            "read_timeout",
+            "write_timeout",
+            "pool_timeout",
+        ):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be >= 0, got {value}")
+        if (
+            self.max_connections is not None
+            and self.max_keepalive_connections is not None
+            and self.max_keepalive_connections > self.max_connections
+        ):
+            raise ValueError(
+                "max_keepalive_connections cannot exceed max_connections "
+                f"({self.max_keepalive_connections} > {self.max_connections})"
+            )
+
+    def limits(self) -> httpx.Limits:
+        """Build the ``httpx.Limits`` for this configuration."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self, default: float | None) -> httpx.Timeout:
+        """Build the ``httpx.Timeout``, filling unset phases from *default*."""
+        return httpx.Timeout(
+            default,
+            connect=default if self.connect_timeout is None else self.connect_timeout,
+            read=default if self.read_timeout is None else self.read_timeout,
+            write=default if self.write_timeout is None else self.write_timeout,
+            pool=default if self.pool_timeout is None else self.pool_timeout,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
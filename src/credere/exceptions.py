@@ -35,3 +35,14 @@ class CredereConnectionError(CredereError):
 
 class CredereTimeoutError(CredereError):
     """Request timed out."""
+
+
+class CircuitOpenError(CredereError):
+    """The circuit for an endpoint family is open; the call was not sent."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            f"circuit for '{endpoint}' is open; retry in {retry_after:.1f}s"
+        )
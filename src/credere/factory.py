@@ -0,0 +1,237 @@
+"""Factories that build many logical clients on one shared connection pool."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from credere._decode import ResponseMode, check_response_mode
+from credere._transport import collect_metrics
+from credere.client import (
+    _DEFAULT_BASE_URL,
+    _DEFAULT_TIMEOUT,
+    AsyncCredereClient,
+    CredereClient,
+    _pool_metrics,
+    _resolve_http2,
+)
+from credere.codec import JSONCodec, resolve_codec
+from credere.config import PoolConfig
+
+if TYPE_CHECKING:
+    from credere.cache import TTLCache
+    from credere.circuit_breaker import CircuitBreakerConfig
+    from credere.http_cache import HTTPCache
+    from credere.rate_limit import RateLimiter
+    from credere.retry import RetryPolicy
+    from credere.sqlite_cache import SQLiteCache
+
+
+class CredereClientFactory:
+    """Registry of :class:`CredereClient` instances sharing one transport.
+
+    Each ``(api_key, store_id)`` pair gets its own logical client, but every
+    client sends its requests through the same connection pool, so socket
+    count and memory stay flat as the number of stores grows. The factory
+    owns the pool: closing a logical client leaves the pool untouched, and
+    closing the factory closes every client and the pool. A circuit breaker,
+    rate limiter, reference or simulation cache, HTTP cache or SQLite cache
+    configured on the factory is shared by all of its clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str = _DEFAULT_BASE_URL,
+        timeout: float = _DEFAULT_TIMEOUT,
+        pool: PoolConfig | None = None,
+        http2: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        reference_cache: TTLCache | None = None,
+        simulation_cache: TTLCache | None = None,
+        http_cache: HTTPCache | None = None,
+        sqlite_cache: SQLiteCache | None = None,
+        response_mode: ResponseMode = "model",
+        codec: str | JSONCodec = "auto",
+    ) -> None:
+        self._base_url = base_url
+        self._timeout = timeout
+        self._pool = pool or PoolConfig()
+        self._http2 = _resolve_http2(http2)
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._coalesce_requests = coalesce_requests
+        self._reference_cache = reference_cache
+        self._simulation_cache = simulation_cache
+        self._http_cache = http_cache
+        self._sqlite_cache = sqlite_cache
+        self._response_mode = check_response_mode(response_mode)
+        self._codec = resolve_codec(codec)
+        self._transport: httpx.BaseTransport = httpx.HTTPTransport(
+            limits=self._pool.limits(), http2=self._http2
+        )
+        if circuit_breaker is not None:
+            from credere.circuit_breaker import CircuitBreakerTransport
+
+            # One breaker per endpoint family, shared by every client.
+            self._transport = CircuitBreakerTransport(self._transport, circuit_breaker)
+        self._clients: dict[tuple[str, int | None], CredereClient] = {}
+        self._lock = threading.Lock()
+
+    def client(self, api_key: str, *, store_id: int | None = None) -> CredereClient:
+        """Return the client for *api_key* and *store_id*, creating it if needed."""
+        key = (api_key, store_id)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client._http.is_closed:
+                client = CredereClient(
+                    api_key,
+                    base_url=self._base_url,
+                    timeout=self._timeout,
+                    store_id=store_id,
+                    pool=self._pool,
+                    http2=self._http2,
+                    transport=self._transport,
+                    retry=self._retry,
+                    rate_limiter=self._rate_limiter,
+                    coalesce_requests=self._coalesce_requests,
+                    reference_cache=self._reference_cache,
+                    simulation_cache=self._simulation_cache,
+                    http_cache=self._http_cache,
+                    sqlite_cache=self._sqlite_cache,
+                    response_mode=self._response_mode,
+                    codec=self._codec,
+                )
+                self._clients[key] = client
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return a snapshot of the shared pool and the number of clients."""
+        return {
+            "pool": _pool_metrics(self._pool, self._transport),
+            "http2": self._http2,
+            "codec": self._codec.name,
+            "clients": len(self._clients),
+            **collect_metrics(self._transport),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+        self._transport.close()
+
+    def __enter__(self) -> CredereClientFactory:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class AsyncCredereClientFactory:
+    """Registry of :class:`AsyncCredereClient` instances sharing one transport."""
+
+    def __init__(
+        self,
+        *,
+        base_url: str = _DEFAULT_BASE_URL,
+        timeout: float = _DEFAULT_TIMEOUT,
+        pool: PoolConfig | None = None,
+        http2: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        reference_cache: TTLCache | None = None,
+        simulation_cache: TTLCache | None = None,
+        http_cache: HTTPCache | None = None,
+        sqlite_cache: SQLiteCache | None = None,
+        response_mode: ResponseMode = "model",
+        codec: str | JSONCodec = "auto",
+    ) -> None:
+        self._base_url = base_url
+        self._timeout = timeout
+        self._pool = pool or PoolConfig()
+        self._http2 = _resolve_http2(http2)
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._coalesce_requests = coalesce_requests
+        self._reference_cache = reference_cache
+        self._simulation_cache = simulation_cache
+        self._http_cache = http_cache
+        self._sqlite_cache = sqlite_cache
+        self._response_mode = check_response_mode(response_mode)
+        self._codec = resolve_codec(codec)
+        self._transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            limits=self._pool.limits(), http2=self._http2
+        )
+        if circuit_breaker is not None:
+            from credere.circuit_breaker import AsyncCircuitBreakerTransport
+
+            # One breaker per endpoint family, shared by every client.
+            self._transport = AsyncCircuitBreakerTransport(
+                self._transport, circuit_breaker
+            )
+        self._clients: dict[tuple[str, int | None], AsyncCredereClient] = {}
+
+    def client(
+        self, api_key: str, *, store_id: int | None = None
+    ) -> AsyncCredereClient:
+        """Return the client for *api_key* and *store_id*, creating it if needed."""
+        key = (api_key, store_id)
+        client = self._clients.get(key)
+        if client is None or client._http.is_closed:
+            client = AsyncCredereClient(
+                api_key,
+                base_url=self._base_url,
+                timeout=self._timeout,
+                store_id=store_id,
+                pool=self._pool,
+                http2=self._http2,
+                transport=self._transport,
+                retry=self._retry,
+                rate_limiter=self._rate_limiter,
+                coalesce_requests=self._coalesce_requests,
+                reference_cache=self._reference_cache,
+                simulation_cache=self._simulation_cache,
+                http_cache=self._http_cache,
+                sqlite_cache=self._sqlite_cache,
+                response_mode=self._response_mode,
+                codec=self._codec,
+            )
+            self._clients[key] = client
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return a snapshot of the shared pool and the number of clients."""
+        return {
+            "pool": _pool_metrics(self._pool, self._transport),
+            "http2": self._http2,
+            "codec": self._codec.name,
+            "clients": len(self._clients),
+            **collect_metrics(self._transport),
+        }
+
+    async def close(self) -> None:
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+        await self._transport.aclose()
+
+    async def __aenter__(self) -> AsyncCredereClientFactory:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
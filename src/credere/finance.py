@@ -0,0 +1,246 @@
+"""Offline Price-table (French amortization) estimates for simulation conditions.
+
+The estimates are computed locally from rates seen in earlier simulations,
+so hopeless conditions can be discarded before calling the API. Inputs are
+columns: sequences or numpy arrays with one entry per condition. With numpy
+installed (``pip install credere-sdk[numpy]``) every column is computed as
+one array operation and results are numpy arrays; otherwise the same
+formulas run element by element and results are lists of floats.
+
+Rates are monthly percentages, as in :class:`SimulationCondition`; amounts
+are in cents.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import math
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from credere.models.simulations import Simulation, SimulationConditionRequest
+
+# A numpy array when numpy is installed, otherwise a list of floats.
+Vector = Any
+
+_NEWTON_STEPS = 50
+_TOLERANCE = 1e-12
+
+
+@dataclass(frozen=True)
+class FinancingEstimate:
+    """Estimated outcome of each condition, one column per field."""
+
+    installment_value: Vector
+    amount_paid_in_financing: Vector
+    interest_monthly: Vector
+    cet_monthly: Vector
+
+
+class RateTable:
+    """Monthly interest and CET rates, by number of installments.
+
+    A condition is estimated with the rates of the nearest installments
+    count in the table. The gap between an entry's CET and its interest
+    rate is read as financed fees, a fixed share of the financed amount,
+    and carried over to other installments counts.
+    """
+
+    def __init__(self, rates: Mapping[int, tuple[float, float]]) -> None:
+        """*rates* maps installments to ``(interest_monthly, cet_monthly)``."""
+        if not rates:
+            raise ValueError("a rate table needs at least one entry")
+        self._rates = dict(rates)
+        self._counts = sorted(self._rates)
+
+    @classmethod
+    def from_simulations(cls, simulations: Iterable[Simulation]) -> RateTable:
+        """Build a table from the successful conditions of *simulations*.
+
+        For each installments count the lowest interest rate is kept, the
+        best any bank offered, so that screening against the table only
+        drops conditions that no bank would make acceptable.
+        """
+        rates: dict[int, tuple[float, float]] = {}
+        for simulation in simulations:
+            for condition in simulation.conditions or ():
+                interest = condition.interest_monthly
+                count = condition.installments
+                if not condition.success or interest is None or count is None:
+                    continue
+                cet = condition.cet_monthly
+                entry = (interest, interest if cet is None else cet)
+                if count not in rates or entry < rates[count]:
+                    rates[count] = entry
+        return cls(rates)
+
+    def __getitem__(self, installments: int) -> tuple[float, float]:
+        """Return the rates of the installments count nearest *installments*."""
+        return self._rates[self._nearest(installments)]
+
+    def __repr__(self) -> str:
+        return f"RateTable({self._rates!r})"
+
+    def _nearest(self, installments: int) -> int:
+        return min(self._counts, key=lambda count: abs(count - installments))
+
+    def _fees(self, installments: Sequence[int]) -> tuple[list[float], list[float]]:
+        """Return the interest rate and financed fee share for each count."""
+        rows = {count: self._fee_row(count) for count in set(installments)}
+        return (
+            [rows[count][0] for count in installments],
+            [rows[count][1] for count in installments],
+        )
+
+    def _fee_row(self, installments: int) -> tuple[float, float]:
+        count = self._nearest(installments)
+        interest, cet = self._rates[count]
+        ratio = _annuity(_SCALAR, interest / 100, count) / _annuity(
+            _SCALAR, cet / 100, count
+        )
+        return interest, ratio - 1
+
+
+def price_installment(
+    financed_amount: Sequence[float],
+    installments: Sequence[int],
+    interest_monthly: Sequence[float],
+) -> Vector:
+    """Return the fixed Price-table installment of each condition."""
+    return _apply(
+        _installment_kernel, 1, financed_amount, installments, interest_monthly
+    )[0]
+
+
+def estimate(
+    financed_amount: Sequence[float],
+    installments: Sequence[int],
+    rates: RateTable,
+) -> FinancingEstimate:
+    """Estimate installments, total paid and CET of each condition."""
+    installments = list(installments)
+    interest, fees = rates._fees(installments)
+    return FinancingEstimate(
+        *_apply(_estimate_kernel, 4, financed_amount, installments, interest, fees)
+    )
+
+
+def screen(
+    conditions: Sequence[SimulationConditionRequest],
+    rates: RateTable,
+    *,
+    max_installment: float | None = None,
+    max_amount_paid: float | None = None,
+    max_cet_monthly: float | None = None,
+) -> list[SimulationConditionRequest]:
+    """Return the *conditions* whose estimate is within every given limit.
+
+    Meant to run before :meth:`~credere.resources.simulations.Simulations.create`
+    or a sweep, so that only promising conditions are sent to the API.
+    """
+    result = estimate(
+        [condition.financed_amount for condition in conditions],
+        [condition.installments for condition in conditions],
+        rates,
+    )
+    limits = [
+        (result.installment_value, max_installment),
+        (result.amount_paid_in_financing, max_amount_paid),
+        (result.cet_monthly, max_cet_monthly),
+    ]
+    keep = [True] * len(conditions)
+    for column, limit in limits:
+        if limit is not None:
+            keep = [k and value <= limit for k, value in zip(keep, column, strict=True)]
+    return [condition for condition, k in zip(conditions, keep, strict=True) if k]
+
+
+class _ScalarMath:
+    """The few numpy functions the kernels use, for plain floats."""
+
+    log1p = staticmethod(math.log1p)
+    expm1 = staticmethod(math.expm1)
+
+    @staticmethod
+    def where(condition: bool, a: float, b: float) -> float:
+        return a if condition else b
+
+    @staticmethod
+    def all(value: bool) -> bool:
+        return value
+
+
+_SCALAR = _ScalarMath()
+
+
+@cache
+def _numpy() -> Any:
+    if importlib.util.find_spec("numpy") is None:
+        return None
+    return importlib.import_module("numpy")
+
+
+def _apply(
+    kernel: Callable[..., tuple[Any, ...]], outputs: int, *columns: Any
+) -> list[Vector]:
+    """Run *kernel* over whole columns with numpy, or row by row without.
+
+    Returns the *outputs* columns the kernel computes.
+    """
+    np = _numpy()
+    if np is not None:
+        return list(kernel(np, *(np.asarray(c, dtype=float) for c in columns)))
+    rows = [kernel(_SCALAR, *map(float, row)) for row in zip(*columns, strict=True)]
+    return [[row[i] for row in rows] for i in range(outputs)]
+
+
+def _annuity(xp: Any, rate: Any, installments: Any) -> Any:
+    """Present value of *installments* payments of 1 at *rate* per period."""
+    safe = xp.where(rate == 0, 1.0, rate)
+    factor = -xp.expm1(-installments * xp.log1p(safe)) / safe
+    return xp.where(rate == 0, installments, factor)
+
+
+def _installment_kernel(
+    xp: Any, financed: Any, installments: Any, interest: Any
+) -> tuple[Any]:
+    return (financed / _annuity(xp, interest / 100, installments),)
+
+
+def _estimate_kernel(
+    xp: Any, financed: Any, installments: Any, interest: Any, fees: Any
+) -> tuple[Any, Any, Any, Any]:
+    rate = interest / 100
+    annuity = _annuity(xp, rate, installments)
+    payment = financed * (1 + fees) / annuity
+    # The CET is the rate at which the installments repay only the amount
+    # actually financed, without the fees.
+    cet = _solve_rate(xp, annuity / (1 + fees), installments, rate)
+    return payment, payment * installments, interest, cet * 100
+
+
+def _solve_rate(xp: Any, target: Any, installments: Any, start: Any) -> Any:
+    """Find the rate at which the annuity of *installments* equals *target*.
+
+    Newton's method from *start*, a rate at or below the answer: the
+    annuity is convex and decreasing in the rate, so each step lands at or
+    below the root and the iteration converges monotonically.
+    """
+    rate = start
+    n = installments
+    for _ in range(_NEWTON_STEPS):
+        annuity = _annuity(xp, rate, n)
+        safe = xp.where(rate == 0, 1.0, rate)
+        slope = xp.where(
+            rate == 0,
+            -n * (n + 1) / 2,
+            (n * xp.expm1(-(n + 1) * xp.log1p(safe)) + n - annuity) / safe,
+        )
+        step = (annuity - target) / slope
+        rate = rate - step
+        if xp.all(abs(step) < _TOLERANCE):
+            break
+    return rate
@@ -0,0 +1,214 @@
+"""Conditional GET requests backed by a validator-aware response cache."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from credere._transport import RawHeaders, aread_raw, read_raw
+from credere.cache import DiskCache, TTLCache
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and the validators used to revalidate it."""
+
+    status_code: int
+    headers: RawHeaders
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def response(self) -> httpx.Response:
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.content
+        )
+
+    def to_bytes(self) -> bytes:
+        meta = {
+            "status_code": self.status_code,
+            "headers": [
+                [k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers
+            ],
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+        return json.dumps(meta).encode() + b"\n" + self.content
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CachedResponse:
+        meta_line, _, content = data.partition(b"\n")
+        meta = json.loads(meta_line)
+        return cls(
+            status_code=meta["status_code"],
+            headers=[
+                (k.encode("latin-1"), v.encode("latin-1")) for k, v in meta["headers"]
+            ],
+            content=content,
+            etag=meta["etag"],
+            last_modified=meta["last_modified"],
+        )
+
+
+class HTTPCache:
+    """Stores GET responses that carry ``ETag`` or ``Last-Modified`` validators.
+
+    Entries live in a bounded in-memory LRU store and, when *directory* is
+    given, in an on-disk store shared across processes and restarts. Entries
+    never expire on their own: every use is revalidated with the server
+    through ``If-None-Match`` / ``If-Modified-Since``, and a ``304 Not
+    Modified`` answer is served from the cache. One cache may be shared by
+    several clients; entries are keyed by URL, ``Store-Id`` and credentials.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        *,
+        directory: str | os.PathLike[str] | None = None,
+        max_disk_entries: int = 4096,
+    ) -> None:
+        self._memory = TTLCache(maxsize=maxsize, ttl=math.inf)
+        self._disk = (
+            DiskCache(directory, max_entries=max_disk_entries)
+            if directory is not None
+            else None
+        )
+        self._lock = threading.Lock()
+        self._counters = {"revalidated": 0, "stored": 0, "misses": 0, "disk_hits": 0}
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        credentials = request.headers.get("Authorization", "").encode()
+        return "|".join(
+            (
+                str(request.url),
+                request.headers.get("Store-Id", ""),
+                hashlib.sha256(credentials).hexdigest()[:16],
+            )
+        )
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        entry: CachedResponse | None = self._memory.get(key)
+        if entry is None and self._disk is not None:
+            data = self._disk.get(key)
+            if data is not None:
+                entry = CachedResponse.from_bytes(data)
+                self._memory.set(key, entry)
+                self._count("disk_hits")
+        if entry is None:
+            self._count("misses")
+        return entry
+
+    def record_revalidated(self) -> None:
+        """Count a cached entry confirmed fresh by a ``304 Not Modified``."""
+        self._count("revalidated")
+
+    def store(self, key: str, entry: CachedResponse) -> None:
+        self._memory.set(key, entry)
+        if self._disk is not None:
+            self._disk.set(key, entry.to_bytes())
+        self._count("stored")
+
+    def clear(self) -> None:
+        self._memory.invalidate()
+        if self._disk is not None:
+            self._disk.invalidate()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self._counters, "size": len(self._memory)}
+
+
+def _add_validators(request: httpx.Request, entry: CachedResponse) -> None:
+    if entry.etag is not None and "If-None-Match" not in request.headers:
+        request.headers["If-None-Match"] = entry.etag
+    if entry.last_modified is not None and "If-Modified-Since" not in request.headers:
+        request.headers["If-Modified-Since"] = entry.last_modified
+
+
+def _validators(response: httpx.Response) -> tuple[str | None, str | None]:
+    return response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+
+class HTTPCacheTransport(httpx.BaseTransport):
+    """Sends conditional GETs and answers 304s from an :class:`HTTPCache`."""
+
+    metrics_name = "http_cache"
+
+    def __init__(self, wrapped: httpx.BaseTransport, cache: HTTPCache) -> None:
+        self.wrapped = wrapped
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return self.wrapped.handle_request(request)
+        key = self.cache.key(request)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            _add_validators(request, entry)
+        response = self.wrapped.handle_request(request)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.cache.record_revalidated()
+            return entry.response()
+        etag, last_modified = _validators(response)
+        if response.status_code != 200 or (etag is None and last_modified is None):
+            return response
+        headers, content = read_raw(response)
+        entry = CachedResponse(200, headers, content, etag, last_modified)
+        self.cache.store(key, entry)
+        return entry.response()
+
+    def metrics(self) -> dict[str, Any]:
+        return self.cache.stats()
+
+    def close(self) -> None:
+        self.wrapped.close()
+
+
+class AsyncHTTPCacheTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`HTTPCacheTransport`."""
+
+    metrics_name = "http_cache"
+
+    def __init__(self, wrapped: httpx.AsyncBaseTransport, cache: HTTPCache) -> None:
+        self.wrapped = wrapped
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self.wrapped.handle_async_request(request)
+        key = self.cache.key(request)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            _add_validators(request, entry)
+        response = await self.wrapped.handle_async_request(request)
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            self.cache.record_revalidated()
+            return entry.response()
+        etag, last_modified = _validators(response)
+        if response.status_code != 200 or (etag is None and last_modified is None):
+            return response
+        headers, content = await aread_raw(response)
+        entry = CachedResponse(200, headers, content, etag, last_modified)
+        self.cache.store(key, entry)
+        return entry.response()
+
+    def metrics(self) -> dict[str, Any]:
+        return self.cache.stats()
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
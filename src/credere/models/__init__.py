@@ -1,53 +1,104 @@
 """Pydantic models for the Credere SDK."""
 
-from credere.models.bank_credentials import IntegratedBank
-from credere.models.customers import (
-    Customer,
-    CustomerAddress,
-    CustomerAddressRequest,
-    CustomerCreateRequest,
-)
-from credere.models.leads import (
-    Address,
-    DomainValue,
-    Lead,
-    LeadAddress,
-    LeadCreateRequest,
-    LeadRequiredFields,
-)
-from credere.models.plus_returns import PlusReturnRule, PlusReturnRuleCreateRequest
-from credere.models.proposal_attempts import (
-    ProposalAttempt,
-    ProposalAttemptCreateRequest,
-)
-from credere.models.proposals import (
-    Proposal,
-    ProposalCondition,
-    ProposalConditionRequest,
-    ProposalCreateRequest,
-    ProposalVehicle,
-    ProposalVehicleRequest,
-)
-from credere.models.simulations import (
-    Bank,
-    Simulation,
-    SimulationCondition,
-    SimulationConditionRequest,
-    SimulationCreateRequest,
-    SimulationVehicleRequest,
-)
-from credere.models.stock import StockVehicle, StockVehicleCreateRequest
-from credere.models.stores import Store, StoreCreateRequest
-from credere.models.users import User, UserAccount, UserRole
-from credere.models.utilities import Domain
-from credere.models.vehicle_models import (
-    VehicleBrand,
-    VehicleFuel,
-    VehicleModel,
-    VehiclePrice,
-    VehiclePriceStore,
-    VehicleType,
-)
+from typing import TYPE_CHECKING
+
+from credere._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from credere.models.bank_credentials import IntegratedBank
+    from credere.models.customers import (
+        Customer,
+        CustomerAddress,
+        CustomerAddressRequest,
+        CustomerCreateRequest,
+    )
+    from credere.models.leads import (
+        Address,
+        DomainValue,
+        Lead,
+        LeadAddress,
+        LeadCreateRequest,
+        LeadRequiredFields,
+    )
+    from credere.models.plus_returns import PlusReturnRule, PlusReturnRuleCreateRequest
+    from credere.models.proposal_attempts import (
+        ProposalAttempt,
+        ProposalAttemptCreateRequest,
+    )
+    from credere.models.proposals import (
+        Proposal,
+        ProposalCondition,
+        ProposalConditionRequest,
+        ProposalCreateRequest,
+        ProposalVehicle,
+        ProposalVehicleRequest,
+    )
+    from credere.models.simulations import (
+        Bank,
+        Simulation,
+        SimulationCondition,
+        SimulationConditionRequest,
+        SimulationCreateRequest,
+        SimulationVehicleRequest,
+    )
+    from credere.models.stock import StockVehicle, StockVehicleCreateRequest
+    from credere.models.stores import Store, StoreCreateRequest
+    from credere.models.users import User, UserAccount, UserRole
+    from credere.models.utilities import Domain
+    from credere.models.vehicle_models import (
+        VehicleBrand,
+        VehicleFuel,
+        VehicleModel,
+        VehiclePrice,
+        VehiclePriceStore,
+        VehicleType,
+    )
+
+_EXPORTS = {
+    "Address": "credere.models.leads",
+    "Bank": "credere.models.simulations",
+    "Customer": "credere.models.customers",
+    "CustomerAddress": "credere.models.customers",
+    "CustomerAddressRequest": "credere.models.customers",
+    "CustomerCreateRequest": "credere.models.customers",
+    "Domain": "credere.models.utilities",
+    "DomainValue": "credere.models.leads",
+    "IntegratedBank": "credere.models.bank_credentials",
+    "Lead": "credere.models.leads",
+    "LeadAddress": "credere.models.leads",
+    "LeadCreateRequest": "credere.models.leads",
+    "LeadRequiredFields": "credere.models.leads",
+    "PlusReturnRule": "credere.models.plus_returns",
+    "PlusReturnRuleCreateRequest": "credere.models.plus_returns",
+    "Proposal": "credere.models.proposals",
+    "ProposalAttempt": "credere.models.proposal_attempts",
+    "ProposalAttemptCreateRequest": "credere.models.proposal_attempts",
+    "ProposalCondition": "credere.models.proposals",
+    "ProposalConditionRequest": "credere.models.proposals",
+    "ProposalCreateRequest": "credere.models.proposals",
+    "ProposalVehicle": "credere.models.proposals",
+    "ProposalVehicleRequest": "credere.models.proposals",
+    "Simulation": "credere.models.simulations",
+    "SimulationCondition": "credere.models.simulations",
+    "SimulationConditionRequest": "credere.models.simulations",
+    "SimulationCreateRequest": "credere.models.simulations",
+    "SimulationVehicleRequest": "credere.models.simulations",
+    "StockVehicle": "credere.models.stock",
+    "StockVehicleCreateRequest": "credere.models.stock",
+    "Store": "credere.models.stores",
+    "StoreCreateRequest": "credere.models.stores",
+    "User": "credere.models.users",
+    "UserAccount": "credere.models.users",
+    "UserRole": "credere.models.users",
+    "VehicleBrand": "credere.models.vehicle_models",
+    "VehicleFuel": "credere.models.vehicle_models",
+    "VehicleModel": "credere.models.vehicle_models",
+    "VehiclePrice": "credere.models.vehicle_models",
+    "VehiclePriceStore": "credere.models.vehicle_models",
+    "VehicleType": "credere.models.vehicle_models",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
 
 __all__ = [
     "Address",
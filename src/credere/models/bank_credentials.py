@@ -10,7 +10,7 @@ from credere.models.simulations import Bank
 class IntegratedBank(BaseModel):
     """Integrated bank as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     store_id: int | None = None
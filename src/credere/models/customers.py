@@ -22,7 +22,7 @@ class CustomerAddressRequest(BaseModel):
 class CustomerAddress(BaseModel):
     """Address as returned in customer responses (includes id)."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     zip_code: str | None = None
@@ -54,7 +54,7 @@ class CustomerCreateRequest(BaseModel):
 class Customer(BaseModel):
     """Customer as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     object_type: str | None = None
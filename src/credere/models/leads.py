@@ -10,7 +10,7 @@ from pydantic import BaseModel, ConfigDict
 class Address(BaseModel):
     """Address input for lead create/update requests."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     zip_code: str | None = None
     city: str | None = None
@@ -24,7 +24,7 @@ class Address(BaseModel):
 class LeadAddress(BaseModel):
     """Address as returned in lead responses (includes id)."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     zip_code: str | None = None
@@ -39,7 +39,7 @@ class LeadAddress(BaseModel):
 class DomainValue(BaseModel):
     """Domain value used for gender, occupation, profession."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     type: str | None = None
@@ -68,7 +68,7 @@ class LeadCreateRequest(BaseModel):
 class Lead(BaseModel):
     """Lead as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     cpf_cnpj: str | None = None
@@ -87,7 +87,7 @@ class Lead(BaseModel):
 class LeadRequiredFields(BaseModel):
     """Response from the required_fields endpoint."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     lead: Lead | None = None
     requirements: dict[str, Any] | None = None
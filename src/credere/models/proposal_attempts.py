@@ -14,7 +14,7 @@ class ProposalAttemptCreateRequest(BaseModel):
 class ProposalAttempt(BaseModel):
     """Proposal attempt as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     created_at: str | None = None
@@ -46,7 +46,7 @@ class ProposalCreateRequest(BaseModel):
 class ProposalCondition(BaseModel):
     """Condition as returned in proposal responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     installments: int | None = None
     down_payment: int | None = None
@@ -60,7 +60,7 @@ class ProposalCondition(BaseModel):
 class ProposalVehicle(BaseModel):
     """Vehicle as returned in proposal responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     asset_value: int | None = None
     licensing_uf: str | None = None
@@ -73,7 +73,7 @@ class ProposalVehicle(BaseModel):
 class Proposal(BaseModel):
     """Proposal as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     assets_value: int | None = None
@@ -44,7 +44,7 @@ class SimulationCreateRequest(BaseModel):
 class Bank(BaseModel):
     """Bank as returned in simulation condition responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     febraban_code: str | None = None
@@ -55,7 +55,7 @@ class Bank(BaseModel):
 class SimulationCondition(BaseModel):
     """Condition as returned in simulation responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     installments: int | None = None
@@ -83,7 +83,7 @@ class SimulationCondition(BaseModel):
 class Simulation(BaseModel):
     """Simulation as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     assets_value: int | None = None
     conditions: list[SimulationCondition] | None = None
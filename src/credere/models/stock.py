@@ -19,7 +19,7 @@ class StockVehicleCreateRequest(BaseModel):
 class StockVehicle(BaseModel):
     """Stock vehicle as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     price_cents: int | None = None
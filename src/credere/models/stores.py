@@ -19,7 +19,7 @@ class StoreCreateRequest(BaseModel):
 class Store(BaseModel):
     """Store as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     object_type: str | None = None
@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict
 class UserRole(BaseModel):
     """User role as returned in user responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     identifier: str | None = None
@@ -18,7 +18,7 @@ class UserRole(BaseModel):
 class UserAccount(BaseModel):
     """User account as returned in user responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     name: str | None = None
@@ -31,7 +31,7 @@ class UserAccount(BaseModel):
 class User(BaseModel):
     """User as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     name: str | None = None
@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict
 class Domain(BaseModel):
     """Domain value used for client and lead domains."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     type: str | None = None
@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict
 class VehicleBrand(BaseModel):
     """Vehicle brand as returned in vehicle model responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     name: str | None = None
@@ -17,7 +17,7 @@ class VehicleBrand(BaseModel):
 class VehicleFuel(BaseModel):
     """Vehicle fuel type as returned in vehicle model responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     name: str | None = None
@@ -29,7 +29,7 @@ class VehicleFuel(BaseModel):
 class VehicleType(BaseModel):
     """Vehicle type as returned in vehicle model responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     name: str | None = None
@@ -38,7 +38,7 @@ class VehicleType(BaseModel):
 class VehicleModel(BaseModel):
     """Vehicle model as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     object_type: str | None = None
@@ -64,7 +64,7 @@ class VehicleModel(BaseModel):
 class VehiclePriceStore(BaseModel):
     """Store as returned in vehicle price responses."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     name: str | None = None
@@ -78,7 +78,7 @@ class VehiclePriceStore(BaseModel):
 class VehiclePrice(BaseModel):
     """Vehicle price as returned by the API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     store_id: int | None = None
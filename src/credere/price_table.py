@@ -0,0 +1,167 @@
+"""Columnar view of vehicle price tables, for analytics without row models."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Literal
+
+ColumnKind = Literal["int", "bool", "str"]
+
+# Columns of a vehicle price row; dotted names are fields of a nested object.
+PRICE_COLUMNS: dict[str, ColumnKind] = {
+    "id": "int",
+    "store_id": "int",
+    "min_price_cents": "int",
+    "default_price_cents": "int",
+    "active": "bool",
+    "created_at": "str",
+    "updated_at": "str",
+    "vehicle_model.id": "int",
+    "vehicle_model.molicar_code": "str",
+    "vehicle_model.fipe_code": "str",
+    "vehicle_model.brand": "str",
+    "vehicle_model.name": "str",
+    "vehicle_model.version": "str",
+    "vehicle_model.year_start": "int",
+    "vehicle_model.year_end": "int",
+    "vehicle_model.active": "bool",
+    "store.id": "int",
+    "store.name": "str",
+    "store.uf": "str",
+}
+
+_EMPTY: Mapping[str, Any] = {}
+
+
+def _require(module: str, extra: str, caller: str) -> Any:
+    if importlib.util.find_spec(module) is None:
+        raise ImportError(f"{caller} requires 'pip install credere-sdk[{extra}]'")
+    return importlib.import_module(module)
+
+
+class PriceTable:
+    """Vehicle prices held as one list per column instead of one model per row.
+
+    Build it with :meth:`VehicleModels.price_table
+    <credere.resources.vehicle_models.VehicleModels.price_table>`, which
+    copies the raw JSON rows into the columns without validating a
+    :class:`~credere.models.vehicle_models.VehiclePrice` per row. Nested
+    fields are flattened into dotted columns such as
+    ``"vehicle_model.molicar_code"``, and missing values are ``None``.
+
+    :meth:`to_numpy` and :meth:`to_arrow` hand the columns to numpy or
+    pyarrow for vectorized filtering and aggregation.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, list[Any]],
+        kinds: Mapping[str, ColumnKind] | None = None,
+    ) -> None:
+        kinds = PRICE_COLUMNS if kinds is None else kinds
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns must all have the same length")
+        self._columns = dict(columns)
+        self._kinds = {name: kinds.get(name, "str") for name in columns}
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Mapping[str, Any]], columns: Iterable[str] | None = None
+    ) -> PriceTable:
+        """Build a table from raw price rows, keeping *columns* (default: all)."""
+        builder = _Builder(columns)
+        for row in rows:
+            builder.add(row)
+        return builder.build()
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> list[Any]:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __repr__(self) -> str:
+        return f"PriceTable({self._length} rows, columns={self.columns})"
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return the columns as numpy arrays, by column name.
+
+        Integer and boolean columns become ``int64`` and ``bool`` arrays, or
+        masked arrays where some values are missing; text columns become
+        ``object`` arrays. Requires numpy (``pip install credere-sdk[numpy]``).
+        """
+        np = _require("numpy", "numpy", "PriceTable.to_numpy()")
+        dtypes = {"int": np.int64, "bool": np.bool_}
+        arrays: dict[str, Any] = {}
+        for name, values in self._columns.items():
+            kind = self._kinds[name]
+            if kind == "str":
+                arrays[name] = np.array(values, dtype=object)
+                continue
+            mask = np.fromiter((v is None for v in values), bool, len(values))
+            if mask.any():
+                filled = [0 if v is None else v for v in values]
+                arrays[name] = np.ma.MaskedArray(filled, mask, dtype=dtypes[kind])
+            else:
+                arrays[name] = np.array(values, dtype=dtypes[kind])
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """Return the columns as a :class:`pyarrow.Table`, missing values null.
+
+        Requires pyarrow (``pip install credere-sdk[arrow]``).
+        """
+        pa = _require("pyarrow", "arrow", "PriceTable.to_arrow()")
+        types = {"int": pa.int64(), "bool": pa.bool_(), "str": pa.string()}
+        return pa.table(
+            {
+                name: pa.array(values, type=types[self._kinds[name]])
+                for name, values in self._columns.items()
+            }
+        )
+
+
+class _Builder:
+    """Appends raw price rows to a :class:`PriceTable`'s columns."""
+
+    def __init__(self, columns: Iterable[str] | None = None) -> None:
+        names = list(PRICE_COLUMNS if columns is None else columns)
+        unknown = [name for name in names if name not in PRICE_COLUMNS]
+        if unknown:
+            raise ValueError(
+                f"unknown price columns: {', '.join(map(repr, unknown))}; "
+                f"expected some of {', '.join(map(repr, PRICE_COLUMNS))}"
+            )
+        self._columns: dict[str, list[Any]] = {name: [] for name in names}
+        # Fields read straight off the row, and fields of each nested object,
+        # with the list each one appends to.
+        self._fields: list[tuple[str, list[Any]]] = []
+        self._nested: dict[str, list[tuple[str, list[Any]]]] = {}
+        for name, values in self._columns.items():
+            parent, _, field = name.rpartition(".")
+            if parent:
+                self._nested.setdefault(parent, []).append((field, values))
+            else:
+                self._fields.append((field, values))
+
+    def add(self, row: Mapping[str, Any]) -> None:
+        for field, values in self._fields:
+            values.append(row.get(field))
+        for parent, fields in self._nested.items():
+            nested = row.get(parent) or _EMPTY
+            for field, values in fields:
+                values.append(nested.get(field))
+
+    def build(self) -> PriceTable:
+        return PriceTable(self._columns)
@@ -0,0 +1,174 @@
+"""Client-side token-bucket rate limiting for the Credere clients."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from credere._transport import endpoint_family
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A budget of ``rate`` requests per second with bursts up to ``burst``.
+
+    ``burst`` defaults to one second worth of requests (at least 1).
+    """
+
+    rate: float
+    burst: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"rate must be > 0, got {self.rate}")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError(f"burst must be >= 1, got {self.burst}")
+
+    @property
+    def capacity(self) -> int:
+        return self.burst if self.burst is not None else max(1, math.ceil(self.rate))
+
+
+class TokenBucket:
+    """Thread-safe token bucket handing out reservations.
+
+    :meth:`reserve` always takes a token, letting the balance go negative,
+    and returns how long the caller must wait before its token is backed by
+    refill. Waiting callers are therefore served in arrival order, spaced
+    exactly ``1 / rate`` apart, instead of racing each other when tokens
+    become available.
+    """
+
+    def __init__(
+        self, limit: RateLimit, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.limit = limit
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(limit.capacity)
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(
+                float(self.limit.capacity), self._tokens + elapsed * self.limit.rate
+            )
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.limit.rate
+
+
+class RateLimiter:
+    """Global and per-endpoint request budgets.
+
+    A single limiter may be shared by several clients, threads and asyncio
+    tasks; every request takes a token from the global bucket and from the
+    bucket of its endpoint family (``customers``, ``leads``, ``vehicles``,
+    ...) and waits until both budgets allow it.
+    """
+
+    def __init__(
+        self,
+        global_limit: RateLimit | None = None,
+        per_endpoint: Mapping[str, RateLimit] | None = None,
+        *,
+        key: Callable[[str], str] = endpoint_family,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._key = key
+        self._global = (
+            TokenBucket(global_limit, clock=clock) if global_limit is not None else None
+        )
+        self._endpoints = {
+            name: TokenBucket(limit, clock=clock)
+            for name, limit in (per_endpoint or {}).items()
+        }
+        self._lock = threading.Lock()
+        self._waits = 0
+        self._waited = 0.0
+
+    def reserve(self, request: httpx.Request) -> float:
+        """Reserve capacity for *request*; return the seconds to wait."""
+        delay = 0.0
+        if self._global is not None:
+            delay = self._global.reserve()
+        bucket = self._endpoints.get(self._key(request.url.path))
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        if delay > 0:
+            with self._lock:
+                self._waits += 1
+                self._waited += delay
+        return delay
+
+    def metrics(self) -> dict[str, Any]:
+        return {"waits": self._waits, "waited_seconds": self._waited}
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Blocks the calling thread until the limiter has capacity."""
+
+    metrics_name = "rate_limit"
+
+    def __init__(
+        self,
+        wrapped: httpx.BaseTransport,
+        limiter: RateLimiter,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.wrapped = wrapped
+        self.limiter = limiter
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.limiter.reserve(request)
+        if delay > 0:
+            self._sleep(delay)
+        return self.wrapped.handle_request(request)
+
+    def metrics(self) -> dict[str, Any]:
+        return self.limiter.metrics()
+
+    def close(self) -> None:
+        self.wrapped.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Suspends the calling task until the limiter has capacity."""
+
+    metrics_name = "rate_limit"
+
+    def __init__(
+        self,
+        wrapped: httpx.AsyncBaseTransport,
+        limiter: RateLimiter,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.wrapped = wrapped
+        self.limiter = limiter
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.limiter.reserve(request)
+        if delay > 0:
+            await self._sleep(delay)
+        return await self.wrapped.handle_async_request(request)
+
+    def metrics(self) -> dict[str, Any]:
+        return self.limiter.metrics()
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
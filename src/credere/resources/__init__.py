@@ -1,17 +1,54 @@
 """Resource classes for the Credere SDK."""
 
-from credere.resources.bank_credentials import AsyncBankCredentials, BankCredentials
-from credere.resources.customers import AsyncCustomers, Customers
-from credere.resources.leads import AsyncLeads, Leads
-from credere.resources.plus_returns import AsyncPlusReturns, PlusReturns
-from credere.resources.proposal_attempts import AsyncProposalAttempts, ProposalAttempts
-from credere.resources.proposals import AsyncProposals, Proposals
-from credere.resources.simulations import AsyncSimulations, Simulations
-from credere.resources.stock import AsyncStock, Stock
-from credere.resources.stores import AsyncStores, Stores
-from credere.resources.users import AsyncUsers, Users
-from credere.resources.utilities import AsyncUtilities, Utilities
-from credere.resources.vehicle_models import AsyncVehicleModels, VehicleModels
+from typing import TYPE_CHECKING
+
+from credere._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from credere.resources.bank_credentials import AsyncBankCredentials, BankCredentials
+    from credere.resources.customers import AsyncCustomers, Customers
+    from credere.resources.leads import AsyncLeads, Leads
+    from credere.resources.plus_returns import AsyncPlusReturns, PlusReturns
+    from credere.resources.proposal_attempts import (
+        AsyncProposalAttempts,
+        ProposalAttempts,
+    )
+    from credere.resources.proposals import AsyncProposals, Proposals
+    from credere.resources.simulations import AsyncSimulations, Simulations
+    from credere.resources.stock import AsyncStock, Stock
+    from credere.resources.stores import AsyncStores, Stores
+    from credere.resources.users import AsyncUsers, Users
+    from credere.resources.utilities import AsyncUtilities, Utilities
+    from credere.resources.vehicle_models import AsyncVehicleModels, VehicleModels
+
+_EXPORTS = {
+    "AsyncBankCredentials": "credere.resources.bank_credentials",
+    "AsyncCustomers": "credere.resources.customers",
+    "AsyncLeads": "credere.resources.leads",
+    "AsyncPlusReturns": "credere.resources.plus_returns",
+    "AsyncProposalAttempts": "credere.resources.proposal_attempts",
+    "AsyncProposals": "credere.resources.proposals",
+    "AsyncSimulations": "credere.resources.simulations",
+    "AsyncStock": "credere.resources.stock",
+    "AsyncStores": "credere.resources.stores",
+    "AsyncUsers": "credere.resources.users",
+    "AsyncUtilities": "credere.resources.utilities",
+    "AsyncVehicleModels": "credere.resources.vehicle_models",
+    "BankCredentials": "credere.resources.bank_credentials",
+    "Customers": "credere.resources.customers",
+    "Leads": "credere.resources.leads",
+    "PlusReturns": "credere.resources.plus_returns",
+    "ProposalAttempts": "credere.resources.proposal_attempts",
+    "Proposals": "credere.resources.proposals",
+    "Simulations": "credere.resources.simulations",
+    "Stock": "credere.resources.stock",
+    "Stores": "credere.resources.stores",
+    "Users": "credere.resources.users",
+    "Utilities": "credere.resources.utilities",
+    "VehicleModels": "credere.resources.vehicle_models",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
 
 __all__ = [
     "AsyncBankCredentials",
@@ -6,99 +6,69 @@ from typing import Any
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.bank_credentials import IntegratedBank
 
+_PERSIST = Endpoint(
+    "GET",
+    "/v1/stores/{}/persist_cnpj_bank_credentials",
+    Decoder(dict[str, Any]),
+)
+_LIST = Endpoint(
+    "GET",
+    "/v1/stores/{}/integrated_banks",
+    Decoder(list[IntegratedBank], "integrated_banks"),
+)
+
 
 class BankCredentials:
     """Synchronous bank credentials resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def persist(
         self,
         store_id: int,
     ) -> dict[str, Any]:
-        try:
-            response = self._client.get(
-                f"/v1/stores/{store_id}/persist_cnpj_bank_credentials",
-                headers=self._headers(),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()
+        return self._call(_PERSIST, store_id)
 
     def list(
         self,
         store_id: int,
+        *,
+        response_mode: ResponseMode | None = None,
     ) -> list[IntegratedBank]:
-        try:
-            response = self._client.get(
-                f"/v1/stores/{store_id}/integrated_banks",
-                headers=self._headers(),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            IntegratedBank.model_validate(item)
-            for item in response.json()["integrated_banks"]
-        ]
+        return self._call(_LIST, store_id, response_mode=response_mode)
 
 
 class AsyncBankCredentials:
     """Asynchronous bank credentials resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def persist(
         self,
         store_id: int,
     ) -> dict[str, Any]:
-        try:
-            response = await self._client.get(
-                f"/v1/stores/{store_id}/persist_cnpj_bank_credentials",
-                headers=self._headers(),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()
+        return await self._call(_PERSIST, store_id)
 
     async def list(
         self,
         store_id: int,
+        *,
+        response_mode: ResponseMode | None = None,
     ) -> list[IntegratedBank]:
-        try:
-            response = await self._client.get(
-                f"/v1/stores/{store_id}/integrated_banks",
-                headers=self._headers(),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            IntegratedBank.model_validate(item)
-            for item in response.json()["integrated_banks"]
-        ]
+        return await self._call(_LIST, store_id, response_mode=response_mode)
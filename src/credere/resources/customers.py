@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from enum import StrEnum
+from functools import partial
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
+from credere._pagination import aiter_pages, iter_pages
 from credere.models.customers import Customer, CustomerCreateRequest
 
 _BASE_PATH = "/v1/customers"
+_CUSTOMER = Decoder(Customer, "customer")
+
+_CREATE = Endpoint("POST", _BASE_PATH, _CUSTOMER, body_key="customer")
+_UPDATE = Endpoint("PATCH", _BASE_PATH + "/{}", _CUSTOMER, body_key="customer")
+_LIST = Endpoint("GET", _BASE_PATH, Decoder(list[Customer], "customers"))
+_GET = Endpoint("GET", _BASE_PATH + "/{}", _CUSTOMER)
+_FIND = Endpoint("GET", _BASE_PATH + "/find", _CUSTOMER)
 
 
 class SortOption(StrEnum):
@@ -22,33 +33,24 @@ class SortOption(StrEnum):
 class Customers:
     """Synchronous customers resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def create(
         self,
         data: CustomerCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
-        try:
-            response = self._client.post(
-                _BASE_PATH,
-                json={"customer": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     def update(
         self,
@@ -56,18 +58,11 @@ class Customers:
         data: CustomerCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
-        try:
-            response = self._client.patch(
-                f"{_BASE_PATH}/{id}",
-                json={"customer": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     def list(
         self,
@@ -78,6 +73,7 @@ class Customers:
         cpf_cnpj: int | None = None,
         name: str | None = None,
         sort: SortOption | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> list[Customer]:
         params = {
             key: value
@@ -90,32 +86,48 @@ class Customers:
             }.items()
             if value is not None
         }
-        try:
-            response = self._client.get(
-                _BASE_PATH, headers=self._headers(store_id), params=params or None
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Customer.model_validate(item) for item in response.json()["customers"]]
+        return self._call(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    def iter_all(
+        self,
+        *,
+        store_id: int | None = None,
+        per_page: int | None = None,
+        start_page: int = 1,
+        cpf_cnpj: int | None = None,
+        name: str | None = None,
+        sort: SortOption | None = None,
+        prefetch: bool = False,
+        response_mode: ResponseMode | None = None,
+    ) -> Iterator[Customer]:
+        """Yield every customer, requesting one page at a time.
+
+        Iteration stops at the first empty page. With *prefetch*, the next
+        page is requested while the current one is being consumed.
+        """
+        fetch = partial(
+            self.list,
+            store_id=store_id,
+            per_page=per_page,
+            cpf_cnpj=cpf_cnpj,
+            name=name,
+            sort=sort,
+            response_mode=response_mode,
+        )
+        return iter_pages(
+            lambda page: fetch(page=page), start=start_page, prefetch=prefetch
+        )
 
     def get(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return self._call(_GET, id, store_id=store_id, response_mode=response_mode)
 
     def find(
         self,
@@ -124,6 +136,7 @@ class Customers:
         cpf_cnpj: str | None = None,
         cpf: str | None = None,
         cnpj: str | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
         params = {}
         if cpf_cnpj:
@@ -132,49 +145,32 @@ class Customers:
             params["cpf"] = cpf
         if cnpj:
             params["cnpj"] = cnpj
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/find",
-                headers=self._headers(store_id),
-                params=params or None,
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return self._call(
+            _FIND, store_id=store_id, params=params, response_mode=response_mode
+        )
 
 
 class AsyncCustomers:
     """Asynchronous customers resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def create(
         self,
         data: CustomerCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
-        try:
-            response = await self._client.post(
-                _BASE_PATH,
-                json={"customer": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return await self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     async def update(
         self,
@@ -182,18 +178,11 @@ class AsyncCustomers:
         data: CustomerCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
-        try:
-            response = await self._client.patch(
-                f"{_BASE_PATH}/{id}",
-                json={"customer": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return await self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     async def list(
         self,
@@ -204,6 +193,7 @@ class AsyncCustomers:
         cpf_cnpj: int | None = None,
         name: str | None = None,
         sort: SortOption | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> list[Customer]:
         params = {}
         if per_page is not None:
@@ -216,32 +206,57 @@ class AsyncCustomers:
             params["name"] = name
         if sort is not None:
             params["sort"] = sort
-        try:
-            response = await self._client.get(
-                _BASE_PATH, headers=self._headers(store_id), params=params or None
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Customer.model_validate(item) for item in response.json()["customers"]]
+        return await self._call(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    def iter_all(
+        self,
+        *,
+        store_id: int | None = None,
+        per_page: int | None = None,
+        start_page: int = 1,
+        cpf_cnpj: int | None = None,
+        name: str | None = None,
+        sort: SortOption | None = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        response_mode: ResponseMode | None = None,
+    ) -> AsyncIterator[Customer]:
+        """Yield every customer, requesting one page at a time.
+
+        Iteration stops at the first empty page. With *prefetch*, the next
+        page is requested while the current one is being consumed. With
+        *concurrency* above 1, that many pages are requested in parallel,
+        customers are still yielded in page order, and iteration also stops
+        at the first page shorter than the first one.
+        """
+        fetch = partial(
+            self.list,
+            store_id=store_id,
+            per_page=per_page,
+            cpf_cnpj=cpf_cnpj,
+            name=name,
+            sort=sort,
+            response_mode=response_mode,
+        )
+        return aiter_pages(
+            lambda page: fetch(page=page),
+            start=start_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
 
     async def get(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return await self._call(
+            _GET, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def find(
         self,
@@ -250,6 +265,7 @@ class AsyncCustomers:
         cpf_cnpj: str | None = None,
         cpf: str | None = None,
         cnpj: str | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Customer:
         params = {}
         if cpf_cnpj:
@@ -258,14 +274,6 @@ class AsyncCustomers:
             params["cpf"] = cpf
         if cnpj:
             params["cnpj"] = cnpj
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/find",
-                headers=self._headers(store_id),
-                params=params or None,
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Customer.model_validate(response.json()["customer"])
+        return await self._call(
+            _FIND, store_id=store_id, params=params, response_mode=response_mode
+        )
@@ -2,44 +2,70 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterable, Iterable
+from functools import partial
+
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
+from credere.bulk import AsyncBulkRun, BulkRun
 from credere.models.leads import Lead, LeadCreateRequest, LeadRequiredFields
 
 _BASE_PATH = "/v1/banks_api/leads"
+_LEAD = Decoder(Lead, "data")
+
+_CREATE = Endpoint("POST", _BASE_PATH, _LEAD, body_key="lead")
+_UPDATE = Endpoint("PATCH", _BASE_PATH + "/{}", _LEAD, body_key="lead")
+_DELETE: Endpoint[None] = Endpoint("DELETE", _BASE_PATH + "/{}")
+_LIST = Endpoint("GET", _BASE_PATH, Decoder(list[Lead], "data"))
+_GET = Endpoint("GET", _BASE_PATH + "/{}", _LEAD)
+_REQUIRED_FIELDS = Endpoint(
+    "GET", _BASE_PATH + "/{}/required_fields", Decoder(LeadRequiredFields, "data")
+)
 
 
 class Leads:
     """Synchronous leads resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def create(
         self,
         data: LeadCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Lead:
-        try:
-            response = self._client.post(
-                _BASE_PATH,
-                json={"lead": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise  # unreachable, satisfies type checker
-        raise_for_status(response)
-        return Lead.model_validate(response.json()["data"])
+        return self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
+
+    def create_many(
+        self,
+        items: Iterable[LeadCreateRequest],
+        *,
+        concurrency: int = 8,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> BulkRun[Lead]:
+        """Create a lead for each of *items*, *concurrency* at a time.
+
+        *items* is consumed lazily, so it can be a generator over a large
+        import. Iterate over the returned :class:`~credere.bulk.BulkRun` to
+        get one :class:`~credere.bulk.BulkResult` per item as it completes;
+        a failed create is reported in its result and does not stop the
+        others. :meth:`~credere.bulk.BulkRun.stats` reports the counts and
+        throughput.
+        """
+        create = partial(self.create, store_id=store_id, response_mode=response_mode)
+        return BulkRun(create, items, concurrency=concurrency)
 
     def update(
         self,
@@ -47,18 +73,11 @@ class Leads:
         data: LeadCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Lead:
-        try:
-            response = self._client.patch(
-                f"{_BASE_PATH}/{cpf_cnpj}",
-                json={"lead": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Lead.model_validate(response.json()["data"])
+        return self._call(
+            _UPDATE, cpf_cnpj, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     def delete(
         self,
@@ -66,93 +85,73 @@ class Leads:
         *,
         store_id: int | None = None,
     ) -> None:
-        try:
-            response = self._client.delete(
-                f"{_BASE_PATH}/{cpf_cnpj}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-
-    def list(self, *, store_id: int | None = None) -> list[Lead]:
-        try:
-            response = self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Lead.model_validate(item) for item in response.json()["data"]]
+        self._call(_DELETE, cpf_cnpj, store_id=store_id)
+
+    def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[Lead]:
+        return self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     def get(
         self,
         cpf_cnpj: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Lead:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{cpf_cnpj}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Lead.model_validate(response.json()["data"])
+        return self._call(
+            _GET, cpf_cnpj, store_id=store_id, response_mode=response_mode
+        )
 
     def required_fields(
         self,
         cpf_cnpj: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> LeadRequiredFields:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{cpf_cnpj}/required_fields",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return LeadRequiredFields.model_validate(response.json()["data"])
+        return self._call(
+            _REQUIRED_FIELDS, cpf_cnpj, store_id=store_id, response_mode=response_mode
+        )
 
 
 class AsyncLeads:
     """Asynchronous leads resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def create(
         self,
         data: LeadCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Lead:
-        try:
-            response = await self._client.post(
-                _BASE_PATH,
-                json={"lead": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Lead.model_validate(response.json()["data"])
+        return await self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
+
+    def create_many(
+        self,
+        items: Iterable[LeadCreateRequest] | AsyncIterable[LeadCreateRequest],
+        *,
+        concurrency: int = 8,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> AsyncBulkRun[Lead]:
+        """Create a lead for each of *items*, *concurrency* at a time.
+
+        Async counterpart of :meth:`Leads.create_many`; *items* may also be
+        an async iterable.
+        """
+        create = partial(self.create, store_id=store_id, response_mode=response_mode)
+        return AsyncBulkRun(create, items, concurrency=concurrency)
 
     async def update(
         self,
@@ -160,18 +159,11 @@ class AsyncLeads:
         data: LeadCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Lead:
-        try:
-            response = await self._client.patch(
-                f"{_BASE_PATH}/{cpf_cnpj}",
-                json={"lead": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Lead.model_validate(response.json()["data"])
+        return await self._call(
+            _UPDATE, cpf_cnpj, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     async def delete(
         self,
@@ -179,58 +171,31 @@ class AsyncLeads:
         *,
         store_id: int | None = None,
     ) -> None:
-        try:
-            response = await self._client.delete(
-                f"{_BASE_PATH}/{cpf_cnpj}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-
-    async def list(self, *, store_id: int | None = None) -> list[Lead]:
-        try:
-            response = await self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Lead.model_validate(item) for item in response.json()["data"]]
+        await self._call(_DELETE, cpf_cnpj, store_id=store_id)
+
+    async def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[Lead]:
+        return await self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     async def get(
         self,
         cpf_cnpj: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Lead:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{cpf_cnpj}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Lead.model_validate(response.json()["data"])
+        return await self._call(
+            _GET, cpf_cnpj, store_id=store_id, response_mode=response_mode
+        )
 
     async def required_fields(
         self,
         cpf_cnpj: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> LeadRequiredFields:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{cpf_cnpj}/required_fields",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return LeadRequiredFields.model_validate(response.json()["data"])
+        return await self._call(
+            _REQUIRED_FIELDS, cpf_cnpj, store_id=store_id, response_mode=response_mode
+        )
@@ -4,71 +4,57 @@ from __future__ import annotations
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.plus_returns import PlusReturnRule, PlusReturnRuleCreateRequest
 
 _BASE_PATH = "/v1/plus_return_rules"
+_RULE = Decoder(PlusReturnRule, "plus_return_rule")
+
+_CREATE = Endpoint("POST", _BASE_PATH, _RULE, body_key="plus_return_rule")
+_LIST = Endpoint("GET", _BASE_PATH, Decoder(list[PlusReturnRule]))
+_GET = Endpoint("GET", _BASE_PATH + "/{}", _RULE)
+_UPDATE = Endpoint("PATCH", _BASE_PATH + "/{}", _RULE, body_key="plus_return_rule")
+_DELETE: Endpoint[None] = Endpoint("DELETE", _BASE_PATH + "/{}")
+_ACTIVATE = Endpoint("GET", _BASE_PATH + "/{}/activate", _RULE)
+_DEACTIVATE = Endpoint("GET", _BASE_PATH + "/{}/deactivate", _RULE)
 
 
 class PlusReturns:
     """Synchronous plus returns resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def create(
         self,
         data: PlusReturnRuleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = self._client.post(
-                _BASE_PATH,
-                json={"plus_return_rule": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
-    def list(self, *, store_id: int | None = None) -> list[PlusReturnRule]:
-        try:
-            response = self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [PlusReturnRule.model_validate(item) for item in response.json()]
+    def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[PlusReturnRule]:
+        return self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     def get(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return self._call(_GET, id, store_id=store_id, response_mode=response_mode)
 
     def update(
         self,
@@ -76,18 +62,11 @@ class PlusReturns:
         data: PlusReturnRuleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = self._client.patch(
-                f"{_BASE_PATH}/{id}",
-                json={"plus_return_rule": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     def delete(
         self,
@@ -95,110 +74,66 @@ class PlusReturns:
         *,
         store_id: int | None = None,
     ) -> None:
-        try:
-            response = self._client.delete(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
+        self._call(_DELETE, id, store_id=store_id)
 
     def activate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}/activate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return self._call(_ACTIVATE, id, store_id=store_id, response_mode=response_mode)
 
     def deactivate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}/deactivate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return self._call(
+            _DEACTIVATE, id, store_id=store_id, response_mode=response_mode
+        )
 
 
 class AsyncPlusReturns:
     """Asynchronous plus returns resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def create(
         self,
         data: PlusReturnRuleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = await self._client.post(
-                _BASE_PATH,
-                json={"plus_return_rule": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return await self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
-    async def list(self, *, store_id: int | None = None) -> list[PlusReturnRule]:
-        try:
-            response = await self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [PlusReturnRule.model_validate(item) for item in response.json()]
+    async def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[PlusReturnRule]:
+        return await self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     async def get(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return await self._call(
+            _GET, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def update(
         self,
@@ -206,18 +141,11 @@ class AsyncPlusReturns:
         data: PlusReturnRuleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = await self._client.patch(
-                f"{_BASE_PATH}/{id}",
-                json={"plus_return_rule": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return await self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     async def delete(
         self,
@@ -225,46 +153,26 @@ class AsyncPlusReturns:
         *,
         store_id: int | None = None,
     ) -> None:
-        try:
-            response = await self._client.delete(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
+        await self._call(_DELETE, id, store_id=store_id)
 
     async def activate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}/activate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return await self._call(
+            _ACTIVATE, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def deactivate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> PlusReturnRule:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}/deactivate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return PlusReturnRule.model_validate(response.json()["plus_return_rule"])
+        return await self._call(
+            _DEACTIVATE, id, store_id=store_id, response_mode=response_mode
+        )
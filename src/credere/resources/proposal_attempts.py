@@ -4,29 +4,33 @@ from __future__ import annotations
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.proposal_attempts import (
     ProposalAttempt,
     ProposalAttemptCreateRequest,
 )
 
+_BASE_PATH = "/v1/proposals/{}/proposal_attempts"
+_PROPOSAL_ATTEMPT = Decoder(ProposalAttempt, "data")
 
-def _base_path(proposal_id: str) -> str:
-    return f"/v1/proposals/{proposal_id}/proposal_attempts"
+_CREATE = Endpoint("POST", _BASE_PATH, _PROPOSAL_ATTEMPT)
+_LIST = Endpoint("GET", _BASE_PATH, Decoder(list[ProposalAttempt], "data"))
+_GET = Endpoint("GET", _BASE_PATH + "/{}", _PROPOSAL_ATTEMPT)
+_UPDATE = Endpoint("PUT", _BASE_PATH + "/{}", _PROPOSAL_ATTEMPT)
+_PERFORM_ACTION = Endpoint("GET", _BASE_PATH + "/{}/{}", _PROPOSAL_ATTEMPT)
 
 
 class ProposalAttempts:
     """Synchronous proposal attempts resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def create(
         self,
@@ -34,37 +38,26 @@ class ProposalAttempts:
         data: ProposalAttemptCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = self._client.post(
-                _base_path(proposal_id),
-                json=data.model_dump(exclude_none=True),
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return self._call(
+            _CREATE,
+            proposal_id,
+            store_id=store_id,
+            body=data,
+            response_mode=response_mode,
+        )
 
     def list(
         self,
         proposal_id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> list[ProposalAttempt]:
-        try:
-            response = self._client.get(
-                _base_path(proposal_id),
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            ProposalAttempt.model_validate(item) for item in response.json()["data"]
-        ]
+        return self._call(
+            _LIST, proposal_id, store_id=store_id, response_mode=response_mode
+        )
 
     def get(
         self,
@@ -72,17 +65,11 @@ class ProposalAttempts:
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = self._client.get(
-                f"{_base_path(proposal_id)}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return self._call(
+            _GET, proposal_id, id, store_id=store_id, response_mode=response_mode
+        )
 
     def update(
         self,
@@ -91,18 +78,16 @@ class ProposalAttempts:
         data: ProposalAttemptCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = self._client.put(
-                f"{_base_path(proposal_id)}/{id}",
-                json=data.model_dump(exclude_none=True),
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return self._call(
+            _UPDATE,
+            proposal_id,
+            id,
+            store_id=store_id,
+            body=data,
+            response_mode=response_mode,
+        )
 
     def perform_action(
         self,
@@ -111,31 +96,28 @@ class ProposalAttempts:
         action: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = self._client.get(
-                f"{_base_path(proposal_id)}/{id}/{action}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return self._call(
+            _PERFORM_ACTION,
+            proposal_id,
+            id,
+            action,
+            store_id=store_id,
+            response_mode=response_mode,
+        )
 
 
 class AsyncProposalAttempts:
     """Asynchronous proposal attempts resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def create(
         self,
@@ -143,37 +125,26 @@ class AsyncProposalAttempts:
         data: ProposalAttemptCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = await self._client.post(
-                _base_path(proposal_id),
-                json=data.model_dump(exclude_none=True),
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return await self._call(
+            _CREATE,
+            proposal_id,
+            store_id=store_id,
+            body=data,
+            response_mode=response_mode,
+        )
 
     async def list(
         self,
         proposal_id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> list[ProposalAttempt]:
-        try:
-            response = await self._client.get(
-                _base_path(proposal_id),
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            ProposalAttempt.model_validate(item) for item in response.json()["data"]
-        ]
+        return await self._call(
+            _LIST, proposal_id, store_id=store_id, response_mode=response_mode
+        )
 
     async def get(
         self,
@@ -181,17 +152,11 @@ class AsyncProposalAttempts:
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = await self._client.get(
-                f"{_base_path(proposal_id)}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return await self._call(
+            _GET, proposal_id, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def update(
         self,
@@ -200,18 +165,16 @@ class AsyncProposalAttempts:
         data: ProposalAttemptCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = await self._client.put(
-                f"{_base_path(proposal_id)}/{id}",
-                json=data.model_dump(exclude_none=True),
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return await self._call(
+            _UPDATE,
+            proposal_id,
+            id,
+            store_id=store_id,
+            body=data,
+            response_mode=response_mode,
+        )
 
     async def perform_action(
         self,
@@ -220,14 +183,13 @@ class AsyncProposalAttempts:
         action: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> ProposalAttempt:
-        try:
-            response = await self._client.get(
-                f"{_base_path(proposal_id)}/{id}/{action}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return ProposalAttempt.model_validate(response.json()["data"])
+        return await self._call(
+            _PERFORM_ACTION,
+            proposal_id,
+            id,
+            action,
+            store_id=store_id,
+            response_mode=response_mode,
+        )
@@ -2,73 +2,64 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.proposals import Proposal, ProposalCreateRequest
 
 _BASE_PATH = "/v1/proposals"
+_PROPOSAL = Decoder(Proposal, "data")
+
+_CREATE = Endpoint("POST", _BASE_PATH, _PROPOSAL, body_key="proposal")
+_LIST = Endpoint("GET", _BASE_PATH, Decoder(list[Proposal], "data"))
+_GET = Endpoint("GET", _BASE_PATH + "/{}", _PROPOSAL)
+_UPDATE = Endpoint("PUT", _BASE_PATH + "/{}", _PROPOSAL, body_key="proposal")
+_DELETE: Endpoint[None] = Endpoint("DELETE", _BASE_PATH + "/{}")
+_GET_OWNERSHIP = Endpoint("GET", _BASE_PATH + "/{}/get_ownership", _PROPOSAL)
+_LEAVE_OWNERSHIP = Endpoint("GET", _BASE_PATH + "/{}/leave_ownership", _PROPOSAL)
+_ACTIVITY_LOG = Endpoint(
+    "GET", _BASE_PATH + "/{}/activity_log", Decoder(list[dict[str, Any]], "data")
+)
 
 
 class Proposals:
     """Synchronous proposals resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def create(
         self,
         data: ProposalCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = self._client.post(
-                _BASE_PATH,
-                json={"proposal": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise  # unreachable, satisfies type checker
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
-    def list(self, *, store_id: int | None = None) -> list[Proposal]:
-        try:
-            response = self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Proposal.model_validate(item) for item in response.json()["data"]]
+    def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[Proposal]:
+        return self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     def get(
         self,
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return self._call(_GET, id, store_id=store_id, response_mode=response_mode)
 
     def update(
         self,
@@ -76,18 +67,11 @@ class Proposals:
         data: ProposalCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = self._client.put(
-                f"{_BASE_PATH}/{id}",
-                json={"proposal": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     def delete(
         self,
@@ -95,49 +79,29 @@ class Proposals:
         *,
         store_id: int | None = None,
     ) -> None:
-        try:
-            response = self._client.delete(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
+        self._call(_DELETE, id, store_id=store_id)
 
     def get_ownership(
         self,
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}/get_ownership",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return self._call(
+            _GET_OWNERSHIP, id, store_id=store_id, response_mode=response_mode
+        )
 
     def leave_ownership(
         self,
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}/leave_ownership",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return self._call(
+            _LEAVE_OWNERSHIP, id, store_id=store_id, response_mode=response_mode
+        )
 
     def activity_log(
         self,
@@ -145,77 +109,46 @@ class Proposals:
         *,
         store_id: int | None = None,
     ) -> list[dict]:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}/activity_log",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()["data"]
+        return self._call(_ACTIVITY_LOG, id, store_id=store_id)
 
 
 class AsyncProposals:
     """Asynchronous proposals resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def create(
         self,
         data: ProposalCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = await self._client.post(
-                _BASE_PATH,
-                json={"proposal": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return await self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
-    async def list(self, *, store_id: int | None = None) -> list[Proposal]:
-        try:
-            response = await self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Proposal.model_validate(item) for item in response.json()["data"]]
+    async def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[Proposal]:
+        return await self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     async def get(
         self,
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return await self._call(
+            _GET, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def update(
         self,
@@ -223,18 +156,11 @@ class AsyncProposals:
         data: ProposalCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = await self._client.put(
-                f"{_BASE_PATH}/{id}",
-                json={"proposal": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return await self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     async def delete(
         self,
@@ -242,49 +168,29 @@ class AsyncProposals:
         *,
         store_id: int | None = None,
     ) -> None:
-        try:
-            response = await self._client.delete(
-                f"{_BASE_PATH}/{id}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
+        await self._call(_DELETE, id, store_id=store_id)
 
     async def get_ownership(
         self,
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}/get_ownership",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return await self._call(
+            _GET_OWNERSHIP, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def leave_ownership(
         self,
         id: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Proposal:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}/leave_ownership",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Proposal.model_validate(response.json()["data"])
+        return await self._call(
+            _LEAVE_OWNERSHIP, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def activity_log(
         self,
@@ -292,13 +198,4 @@ class AsyncProposals:
         *,
         store_id: int | None = None,
     ) -> list[dict]:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}/activity_log",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()["data"]
+        return await self._call(_ACTIVITY_LOG, id, store_id=store_id)
@@ -2,132 +2,219 @@
 
 from __future__ import annotations
 
-import httpx
+import hashlib
+import json
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
 
-from credere._response import handle_request_error, raise_for_status
-from credere.models.simulations import Simulation, SimulationCreateRequest
+import httpx
 
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
+from credere.bulk import AsyncBulkRun, BulkRun
+from credere.cache import TTLCache
+from credere.models.simulations import (
+    Simulation,
+    SimulationCreateRequest,
+    SimulationVehicleRequest,
+)
+from credere.sweep import SimulationSweep, SweepRow, merge_sweep, simulation_grid
+
+_CACHE_NAMESPACE = "simulations"
 _BASE_PATH = "/v1/banks_api/simulations"
 _LIST_PATH = "/v1/proposal_simulations"
+_SIMULATION = Decoder(Simulation, "data")
+
+_CREATE = Endpoint("POST", _BASE_PATH, _SIMULATION, body_key="simulation")
+_LIST = Endpoint("GET", _LIST_PATH, Decoder(list[Simulation], "data"))
+_GET = Endpoint("GET", _BASE_PATH + "/{}", _SIMULATION)
+
+
+def _cache_key(
+    data: SimulationCreateRequest, store_id: int | None
+) -> tuple[str, str, int | None]:
+    """Key *data* by a hash of its canonical JSON, so equal requests share it."""
+    payload = json.dumps(
+        data.model_dump(mode="json", exclude_none=True),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return _CACHE_NAMESPACE, hashlib.sha256(payload.encode()).hexdigest(), store_id
 
 
 class Simulations:
-    """Synchronous simulations resource."""
+    """Synchronous simulations resource.
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
+    When a :class:`~credere.cache.TTLCache` is given, :meth:`create` returns
+    the stored result of an identical earlier request, keyed by a hash of
+    the request payload and the store, instead of simulating again. Only
+    validated models are cached; ``"raw"`` and ``"lazy"`` creates always go
+    to the network.
+    """
 
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        cache: TTLCache | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
+        self._cache = cache
 
     def create(
         self,
         data: SimulationCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Simulation:
-        try:
-            response = self._client.post(
-                _BASE_PATH,
-                json={"simulation": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise  # unreachable, satisfies type checker
-        raise_for_status(response)
-        return Simulation.model_validate(response.json()["data"])
-
-    def list(self, *, store_id: int | None = None) -> list[Simulation]:
-        try:
-            response = self._client.get(
-                _LIST_PATH,
-                headers=self._headers(store_id),
+        mode = response_mode or self._call.response_mode
+        if self._cache is None or mode != "model":
+            return self._call(_CREATE, store_id=store_id, body=data, response_mode=mode)
+        sid = store_id if store_id is not None else self._call.store_id
+        key = _cache_key(data, sid)
+        simulation: Simulation | None = self._cache.get(key)
+        if simulation is None:
+            simulation = self._call(
+                _CREATE, store_id=store_id, body=data, response_mode="model"
             )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Simulation.model_validate(item) for item in response.json()["data"]]
+            self._cache.set(key, simulation)
+        return simulation.model_copy(deep=True)
+
+    def sweep(
+        self,
+        template: SimulationCreateRequest,
+        *,
+        down_payments: Iterable[int],
+        installments: Iterable[int],
+        vehicles: Iterable[SimulationVehicleRequest] | None = None,
+        conditions_per_request: int = 10,
+        concurrency: int = 8,
+        key: Callable[[SweepRow], Any] | None = None,
+        store_id: int | None = None,
+    ) -> SimulationSweep:
+        """Simulate each down payment and installments pair for each vehicle.
+
+        The grid is built by :func:`~credere.sweep.simulation_grid` from
+        *template* and sent *concurrency* requests at a time. The returned
+        conditions are merged into one table ranked by *key*, cheapest total
+        cost first by default. Failed requests are reported in
+        :attr:`~credere.sweep.SimulationSweep.failed` and do not stop the
+        others.
+        """
+        requests = simulation_grid(
+            template,
+            down_payments=down_payments,
+            installments=installments,
+            vehicles=vehicles,
+            conditions_per_request=conditions_per_request,
+        )
+        create = partial(self.create, store_id=store_id, response_mode="model")
+        run = BulkRun(create, requests, concurrency=concurrency)
+        return merge_sweep(run.collect(), run.stats(), key)
+
+    def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[Simulation]:
+        return self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     def get(
         self,
         uuid: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Simulation:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{uuid}",
-                headers=self._headers(store_id),
+        return self._call(_GET, uuid, store_id=store_id, response_mode=response_mode)
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached simulation result."""
+        if self._cache is not None:
+            self._cache.invalidate_where(
+                lambda key: isinstance(key, tuple) and key[:1] == (_CACHE_NAMESPACE,)
             )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Simulation.model_validate(response.json()["data"])
 
 
 class AsyncSimulations:
-    """Asynchronous simulations resource."""
+    """Asynchronous simulations resource; see :class:`Simulations` for caching."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        cache: TTLCache | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
+        self._cache = cache
 
     async def create(
         self,
         data: SimulationCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Simulation:
-        try:
-            response = await self._client.post(
-                _BASE_PATH,
-                json={"simulation": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
+        mode = response_mode or self._call.response_mode
+        if self._cache is None or mode != "model":
+            return await self._call(
+                _CREATE, store_id=store_id, body=data, response_mode=mode
             )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Simulation.model_validate(response.json()["data"])
-
-    async def list(self, *, store_id: int | None = None) -> list[Simulation]:
-        try:
-            response = await self._client.get(
-                _LIST_PATH,
-                headers=self._headers(store_id),
+        sid = store_id if store_id is not None else self._call.store_id
+        key = _cache_key(data, sid)
+        simulation: Simulation | None = self._cache.get(key)
+        if simulation is None:
+            simulation = await self._call(
+                _CREATE, store_id=store_id, body=data, response_mode="model"
             )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Simulation.model_validate(item) for item in response.json()["data"]]
+            self._cache.set(key, simulation)
+        return simulation.model_copy(deep=True)
+
+    async def sweep(
+        self,
+        template: SimulationCreateRequest,
+        *,
+        down_payments: Iterable[int],
+        installments: Iterable[int],
+        vehicles: Iterable[SimulationVehicleRequest] | None = None,
+        conditions_per_request: int = 10,
+        concurrency: int = 8,
+        key: Callable[[SweepRow], Any] | None = None,
+        store_id: int | None = None,
+    ) -> SimulationSweep:
+        """Async counterpart of :meth:`Simulations.sweep`."""
+        requests = simulation_grid(
+            template,
+            down_payments=down_payments,
+            installments=installments,
+            vehicles=vehicles,
+            conditions_per_request=conditions_per_request,
+        )
+        create = partial(self.create, store_id=store_id, response_mode="model")
+        run = AsyncBulkRun(create, requests, concurrency=concurrency)
+        return merge_sweep(await run.collect(), run.stats(), key)
+
+    async def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[Simulation]:
+        return await self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     async def get(
         self,
         uuid: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Simulation:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{uuid}",
-                headers=self._headers(store_id),
+        return await self._call(
+            _GET, uuid, store_id=store_id, response_mode=response_mode
+        )
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached simulation result."""
+        if self._cache is not None:
+            self._cache.invalidate_where(
+                lambda key: isinstance(key, tuple) and key[:1] == (_CACHE_NAMESPACE,)
             )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Simulation.model_validate(response.json()["data"])
@@ -4,54 +4,45 @@ from __future__ import annotations
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.stock import StockVehicle, StockVehicleCreateRequest
 
 _BASE_PATH = "/v1/vehicles"
+_STOCK_VEHICLE = Decoder(StockVehicle, "vehicle")
+
+_CREATE = Endpoint("POST", _BASE_PATH, _STOCK_VEHICLE, body_key="vehicle")
+_LIST = Endpoint("GET", _BASE_PATH, Decoder(list[StockVehicle]))
+_UPDATE = Endpoint("PUT", _BASE_PATH + "/{}", _STOCK_VEHICLE, body_key="vehicle")
+_REMOVE = Endpoint("PUT", _BASE_PATH + "/{}/remove_from_stock", _STOCK_VEHICLE)
 
 
 class Stock:
     """Synchronous stock resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def create(
         self,
         data: StockVehicleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> StockVehicle:
-        try:
-            response = self._client.post(
-                _BASE_PATH,
-                json={"vehicle": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return StockVehicle.model_validate(response.json()["vehicle"])
-
-    def list(self, *, store_id: int | None = None) -> list[StockVehicle]:
-        try:
-            response = self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [StockVehicle.model_validate(item) for item in response.json()]
+        return self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
+
+    def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[StockVehicle]:
+        return self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     def update(
         self,
@@ -59,79 +50,48 @@ class Stock:
         data: StockVehicleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> StockVehicle:
-        try:
-            response = self._client.put(
-                f"{_BASE_PATH}/{id}",
-                json={"vehicle": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return StockVehicle.model_validate(response.json()["vehicle"])
+        return self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     def remove(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> StockVehicle:
-        try:
-            response = self._client.put(
-                f"{_BASE_PATH}/{id}/remove_from_stock",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return StockVehicle.model_validate(response.json()["vehicle"])
+        return self._call(_REMOVE, id, store_id=store_id, response_mode=response_mode)
 
 
 class AsyncStock:
     """Asynchronous stock resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def create(
         self,
         data: StockVehicleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> StockVehicle:
-        try:
-            response = await self._client.post(
-                _BASE_PATH,
-                json={"vehicle": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return StockVehicle.model_validate(response.json()["vehicle"])
-
-    async def list(self, *, store_id: int | None = None) -> list[StockVehicle]:
-        try:
-            response = await self._client.get(
-                _BASE_PATH,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [StockVehicle.model_validate(item) for item in response.json()]
+        return await self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
+
+    async def list(
+        self, *, store_id: int | None = None, response_mode: ResponseMode | None = None
+    ) -> list[StockVehicle]:
+        return await self._call(_LIST, store_id=store_id, response_mode=response_mode)
 
     async def update(
         self,
@@ -139,32 +99,19 @@ class AsyncStock:
         data: StockVehicleCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> StockVehicle:
-        try:
-            response = await self._client.put(
-                f"{_BASE_PATH}/{id}",
-                json={"vehicle": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return StockVehicle.model_validate(response.json()["vehicle"])
+        return await self._call(
+            _UPDATE, id, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     async def remove(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> StockVehicle:
-        try:
-            response = await self._client.put(
-                f"{_BASE_PATH}/{id}/remove_from_stock",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return StockVehicle.model_validate(response.json()["vehicle"])
+        return await self._call(
+            _REMOVE, id, store_id=store_id, response_mode=response_mode
+        )
@@ -6,175 +6,124 @@ from typing import Any
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.stores import Store, StoreCreateRequest
 
 _BASE_PATH = "/v1/stores"
+_STORE = Decoder(Store, "store")
+
+_CREATE = Endpoint("POST", _BASE_PATH, _STORE, body_key="store")
+_LIST = Endpoint("GET", _BASE_PATH, Decoder(list[Store], "stores"))
+_ACTIVATE = Endpoint("GET", _BASE_PATH + "/{}/activate", _STORE)
+_DEACTIVATE = Endpoint("GET", _BASE_PATH + "/{}/deactivate", _STORE)
 
 
 class Stores:
     """Synchronous stores resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def create(
         self,
         data: StoreCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Store:
-        try:
-            response = self._client.post(
-                _BASE_PATH,
-                json={"store": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Store.model_validate(response.json()["store"])
+        return self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     def list(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> list[Store]:
-        try:
-            response = self._client.get(
-                _BASE_PATH,
-                params=params or None,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Store.model_validate(item) for item in response.json()["stores"]]
+        return self._call(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
 
     def activate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Store:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}/activate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Store.model_validate(response.json()["store"])
+        return self._call(_ACTIVATE, id, store_id=store_id, response_mode=response_mode)
 
     def deactivate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Store:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/{id}/deactivate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Store.model_validate(response.json()["store"])
+        return self._call(
+            _DEACTIVATE, id, store_id=store_id, response_mode=response_mode
+        )
 
 
 class AsyncStores:
     """Asynchronous stores resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def create(
         self,
         data: StoreCreateRequest,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Store:
-        try:
-            response = await self._client.post(
-                _BASE_PATH,
-                json={"store": data.model_dump(exclude_none=True)},
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Store.model_validate(response.json()["store"])
+        return await self._call(
+            _CREATE, store_id=store_id, body=data, response_mode=response_mode
+        )
 
     async def list(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> list[Store]:
-        try:
-            response = await self._client.get(
-                _BASE_PATH,
-                params=params or None,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Store.model_validate(item) for item in response.json()["stores"]]
+        return await self._call(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
 
     async def activate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Store:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}/activate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Store.model_validate(response.json()["store"])
+        return await self._call(
+            _ACTIVATE, id, store_id=store_id, response_mode=response_mode
+        )
 
     async def deactivate(
         self,
         id: int,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> Store:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/{id}/deactivate",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return Store.model_validate(response.json()["store"])
+        return await self._call(
+            _DEACTIVATE, id, store_id=store_id, response_mode=response_mode
+        )
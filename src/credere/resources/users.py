@@ -4,85 +4,65 @@ from __future__ import annotations
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.users import User
 
 _BASE_PATH = "/v1/users"
 
+_CURRENT = Endpoint(
+    "GET", _BASE_PATH + "/current", Decoder(User, "user"), store_header=False
+)
+_PROPOSALS_FILTER_LIST = Endpoint(
+    "GET", _BASE_PATH + "/proposals_filter_list", Decoder(list[User], "users")
+)
+
 
 class Users:
     """Synchronous users resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
-    def current(self) -> User:
-        try:
-            response = self._client.get(f"{_BASE_PATH}/current")
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return User.model_validate(response.json()["user"])
+    def current(self, *, response_mode: ResponseMode | None = None) -> User:
+        return self._call(_CURRENT, response_mode=response_mode)
 
     def proposals_filter_list(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> list[User]:
-        try:
-            response = self._client.get(
-                f"{_BASE_PATH}/proposals_filter_list",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [User.model_validate(item) for item in response.json()["users"]]
+        return self._call(
+            _PROPOSALS_FILTER_LIST, store_id=store_id, response_mode=response_mode
+        )
 
 
 class AsyncUsers:
     """Asynchronous users resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
-    async def current(self) -> User:
-        try:
-            response = await self._client.get(f"{_BASE_PATH}/current")
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return User.model_validate(response.json()["user"])
+    async def current(self, *, response_mode: ResponseMode | None = None) -> User:
+        return await self._call(_CURRENT, response_mode=response_mode)
 
     async def proposals_filter_list(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
     ) -> list[User]:
-        try:
-            response = await self._client.get(
-                f"{_BASE_PATH}/proposals_filter_list",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [User.model_validate(item) for item in response.json()["users"]]
+        return await self._call(
+            _PROPOSALS_FILTER_LIST, store_id=store_id, response_mode=response_mode
+        )
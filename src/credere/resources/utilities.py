@@ -2,63 +2,139 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 import httpx
+from pydantic import BaseModel
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
+from credere.cache import TTLCache
 from credere.models.simulations import Bank
 from credere.models.utilities import Domain
 
+_T = TypeVar("_T", bound=BaseModel)
+
+_CACHE_NAMESPACE = "utilities"
+_DOMAIN_LIST = Decoder(list[Domain])
+_VEHICLE = Decoder(dict[str, Any])
+
+_DOMAINS = Endpoint("GET", "/v1/domains", _DOMAIN_LIST)
+_LEAD_DOMAINS = Endpoint("GET", "/v1/banks_api/domains", _DOMAIN_LIST)
+_BANKS = Endpoint("GET", "/v1/banks", Decoder(list[Bank], "banks"))
+_VEHICLE_BY_PLATE = Endpoint("GET", "/v1/vehicles/license_plate/{}", _VEHICLE)
+_VEHICLE_BY_CHASSIS = Endpoint("GET", "/v1/vehicles/chassi_code/{}", _VEHICLE)
+
+
+def _copies(models: list[_T]) -> list[_T]:
+    """Deep copies of cached *models*, so callers cannot mutate the cache."""
+    return [model.model_copy(deep=True) for model in models]
+
 
 class Utilities:
-    """Synchronous utilities resource."""
+    """Synchronous utilities resource.
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
+    When a :class:`~credere.cache.TTLCache` is given, the reference-data
+    endpoints (``domains``, ``lead_domains`` and ``banks``) are served from
+    it, keyed by endpoint and store. Only validated models are cached;
+    ``"raw"`` and ``"lazy"`` reads always go to the network.
+    """
 
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        cache: TTLCache | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
+        self._cache = cache
 
-    def domains(self, *, store_id: int | None = None) -> list[Domain]:
-        try:
-            response = self._client.get(
-                "/v1/domains",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Domain.model_validate(item) for item in response.json()]
+    def _cached(
+        self,
+        name: str,
+        store_id: int | None,
+        response_mode: ResponseMode | None,
+        fetch: Callable[[int | None, ResponseMode], list[_T]],
+    ) -> list[_T]:
+        mode = response_mode or self._call.response_mode
+        if self._cache is None or mode != "model":
+            return fetch(store_id, mode)
+        cache = self._cache
+        sid = store_id if store_id is not None else self._call.store_id
+        key = (_CACHE_NAMESPACE, name, sid)
+        found = cache.lookup(key)
+        if found is not None:
+            value, stale = found
+            if stale and cache.begin_refresh(key):
+                threading.Thread(
+                    target=self._refresh, args=(key, fetch, store_id), daemon=True
+                ).start()
+            return _copies(value)
+        value = fetch(store_id, "model")
+        cache.set(key, value)
+        return _copies(value)
 
-    def lead_domains(self, *, store_id: int | None = None) -> list[Domain]:
+    def _refresh(
+        self,
+        key: tuple[str, str, int | None],
+        fetch: Callable[[int | None, ResponseMode], list[Any]],
+        store_id: int | None,
+    ) -> None:
+        assert self._cache is not None
         try:
-            response = self._client.get(
-                "/v1/banks_api/domains",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Domain.model_validate(item) for item in response.json()]
+            self._cache.set(key, fetch(store_id, "model"))
+        except Exception:
+            pass  # keep serving the stale value until the next attempt
+        finally:
+            self._cache.end_refresh(key)
 
-    def banks(self, *, store_id: int | None = None) -> list[Bank]:
-        try:
-            response = self._client.get(
-                "/v1/banks",
-                headers=self._headers(store_id),
+    def invalidate_cache(self) -> None:
+        """Drop every cached reference-data response."""
+        if self._cache is not None:
+            self._cache.invalidate_where(
+                lambda key: isinstance(key, tuple) and key[:1] == (_CACHE_NAMESPACE,)
             )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Bank.model_validate(item) for item in response.json()["banks"]]
+
+    def domains(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> list[Domain]:
+        return self._cached("domains", store_id, response_mode, self._domains)
+
+    def lead_domains(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> list[Domain]:
+        return self._cached("lead_domains", store_id, response_mode, self._lead_domains)
+
+    def banks(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> list[Bank]:
+        return self._cached("banks", store_id, response_mode, self._banks)
+
+    def _domains(
+        self, store_id: int | None, response_mode: ResponseMode
+    ) -> list[Domain]:
+        return self._call(_DOMAINS, store_id=store_id, response_mode=response_mode)
+
+    def _lead_domains(
+        self, store_id: int | None, response_mode: ResponseMode
+    ) -> list[Domain]:
+        return self._call(_LEAD_DOMAINS, store_id=store_id, response_mode=response_mode)
+
+    def _banks(self, store_id: int | None, response_mode: ResponseMode) -> list[Bank]:
+        return self._call(_BANKS, store_id=store_id, response_mode=response_mode)
 
     def vehicle_by_plate(
         self,
@@ -66,16 +142,7 @@ class Utilities:
         *,
         store_id: int | None = None,
     ) -> dict[str, Any]:
-        try:
-            response = self._client.get(
-                f"/v1/vehicles/license_plate/{plate}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()
+        return self._call(_VEHICLE_BY_PLATE, plate, store_id=store_id)
 
     def vehicle_by_chassis(
         self,
@@ -83,66 +150,113 @@ class Utilities:
         *,
         store_id: int | None = None,
     ) -> dict[str, Any]:
-        try:
-            response = self._client.get(
-                f"/v1/vehicles/chassi_code/{chassi}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()
+        return self._call(_VEHICLE_BY_CHASSIS, chassi, store_id=store_id)
 
 
 class AsyncUtilities:
-    """Asynchronous utilities resource."""
+    """Asynchronous utilities resource; see :class:`Utilities` for caching."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        cache: TTLCache | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
+        self._cache = cache
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
 
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    async def _cached(
+        self,
+        name: str,
+        store_id: int | None,
+        response_mode: ResponseMode | None,
+        fetch: Callable[[int | None, ResponseMode], Awaitable[list[_T]]],
+    ) -> list[_T]:
+        mode = response_mode or self._call.response_mode
+        if self._cache is None or mode != "model":
+            return await fetch(store_id, mode)
+        cache = self._cache
+        sid = store_id if store_id is not None else self._call.store_id
+        key = (_CACHE_NAMESPACE, name, sid)
+        found = cache.lookup(key)
+        if found is not None:
+            value, stale = found
+            if stale and cache.begin_refresh(key):
+                task = asyncio.create_task(self._refresh(key, fetch, store_id))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return _copies(value)
+        value = await fetch(store_id, "model")
+        cache.set(key, value)
+        return _copies(value)
 
-    async def domains(self, *, store_id: int | None = None) -> list[Domain]:
+    async def _refresh(
+        self,
+        key: tuple[str, str, int | None],
+        fetch: Callable[[int | None, ResponseMode], Awaitable[list[Any]]],
+        store_id: int | None,
+    ) -> None:
+        assert self._cache is not None
         try:
-            response = await self._client.get(
-                "/v1/domains",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Domain.model_validate(item) for item in response.json()]
+            self._cache.set(key, await fetch(store_id, "model"))
+        except Exception:
+            pass  # keep serving the stale value until the next attempt
+        finally:
+            self._cache.end_refresh(key)
 
-    async def lead_domains(self, *, store_id: int | None = None) -> list[Domain]:
-        try:
-            response = await self._client.get(
-                "/v1/banks_api/domains",
-                headers=self._headers(store_id),
+    def invalidate_cache(self) -> None:
+        """Drop every cached reference-data response."""
+        if self._cache is not None:
+            self._cache.invalidate_where(
+                lambda key: isinstance(key, tuple) and key[:1] == (_CACHE_NAMESPACE,)
             )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Domain.model_validate(item) for item in response.json()]
 
-    async def banks(self, *, store_id: int | None = None) -> list[Bank]:
-        try:
-            response = await self._client.get(
-                "/v1/banks",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [Bank.model_validate(item) for item in response.json()["banks"]]
+    async def domains(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> list[Domain]:
+        return await self._cached("domains", store_id, response_mode, self._domains)
+
+    async def lead_domains(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> list[Domain]:
+        return await self._cached(
+            "lead_domains", store_id, response_mode, self._lead_domains
+        )
+
+    async def banks(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+    ) -> list[Bank]:
+        return await self._cached("banks", store_id, response_mode, self._banks)
+
+    async def _domains(
+        self, store_id: int | None, response_mode: ResponseMode
+    ) -> list[Domain]:
+        return await self._call(
+            _DOMAINS, store_id=store_id, response_mode=response_mode
+        )
+
+    async def _lead_domains(
+        self, store_id: int | None, response_mode: ResponseMode
+    ) -> list[Domain]:
+        return await self._call(
+            _LEAD_DOMAINS, store_id=store_id, response_mode=response_mode
+        )
+
+    async def _banks(
+        self, store_id: int | None, response_mode: ResponseMode
+    ) -> list[Bank]:
+        return await self._call(_BANKS, store_id=store_id, response_mode=response_mode)
 
     async def vehicle_by_plate(
         self,
@@ -150,16 +264,7 @@ class AsyncUtilities:
         *,
         store_id: int | None = None,
     ) -> dict[str, Any]:
-        try:
-            response = await self._client.get(
-                f"/v1/vehicles/license_plate/{plate}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()
+        return await self._call(_VEHICLE_BY_PLATE, plate, store_id=store_id)
 
     async def vehicle_by_chassis(
         self,
@@ -167,13 +272,4 @@ class AsyncUtilities:
         *,
         store_id: int | None = None,
     ) -> dict[str, Any]:
-        try:
-            response = await self._client.get(
-                f"/v1/vehicles/chassi_code/{chassi}",
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return response.json()
+        return await self._call(_VEHICLE_BY_CHASSIS, chassi, store_id=store_id)
@@ -2,164 +2,212 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable, Iterator
 from typing import Any
 
 import httpx
 
-from credere._response import handle_request_error, raise_for_status
+from credere._decode import Decoder, ResponseMode
+from credere._executor import AsyncExecutor, Endpoint, Executor
 from credere.models.vehicle_models import VehicleModel, VehiclePrice
+from credere.price_table import PriceTable
 
 _MODELS_PATH = "/v1/vehicle_models"
 _PRICES_PATH = "/v1/vehicle_prices"
 
+_LIST = Endpoint("GET", _MODELS_PATH, Decoder(list[VehicleModel], "vehicle_models"))
+_SEARCH = Endpoint(
+    "GET", _MODELS_PATH + "/search", Decoder(VehicleModel, "vehicle_model")
+)
+_PRICES = Endpoint("GET", _PRICES_PATH, Decoder(list[VehiclePrice], "vehicle_prices"))
+
 
 class VehicleModels:
     """Synchronous vehicle models resource."""
 
-    def __init__(self, client: httpx.Client, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.Client,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = Executor(client, store_id, response_mode)
 
     def list(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> list[VehicleModel]:
-        try:
-            response = self._client.get(
-                _MODELS_PATH,
-                params=params or None,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            VehicleModel.model_validate(item)
-            for item in response.json()["vehicle_models"]
-        ]
+        return self._call(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
 
     def search(
         self,
         q: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> VehicleModel:
         params["q"] = q
-        try:
-            response = self._client.get(
-                f"{_MODELS_PATH}/search",
-                params=params,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return VehicleModel.model_validate(response.json()["vehicle_model"])
+        return self._call(
+            _SEARCH, store_id=store_id, params=params, response_mode=response_mode
+        )
 
     def prices(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> list[VehiclePrice]:
-        try:
-            response = self._client.get(
-                _PRICES_PATH,
-                params=params or None,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            VehiclePrice.model_validate(item)
-            for item in response.json()["vehicle_prices"]
-        ]
+        return self._call(
+            _PRICES, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    def iter_list(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+        **params: Any,
+    ) -> Iterator[VehicleModel]:
+        """Yield vehicle models one at a time as the response streams in.
+
+        The ``vehicle_models`` array is parsed incrementally from the body,
+        so memory use stays flat however many models the response holds.
+        """
+        return self._call.stream(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    def iter_prices(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+        **params: Any,
+    ) -> Iterator[VehiclePrice]:
+        """Yield vehicle prices one at a time as the response streams in.
+
+        Streaming counterpart of :meth:`prices`; see :meth:`iter_list`.
+        """
+        return self._call.stream(
+            _PRICES, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    def price_table(
+        self,
+        *,
+        columns: Iterable[str] | None = None,
+        store_id: int | None = None,
+        **params: Any,
+    ) -> PriceTable:
+        """Load vehicle prices into a columnar :class:`PriceTable`.
+
+        The body is parsed with the client's JSON codec and its rows copied
+        into one list per column, named as in
+        :data:`~credere.price_table.PRICE_COLUMNS`, without validating a
+        :class:`VehiclePrice` per row; *columns* keeps only those named.
+        """
+        rows: list[Any] = self._call(
+            _PRICES, store_id=store_id, params=params, response_mode="raw"
+        )
+        return PriceTable.from_rows(rows, columns)
 
 
 class AsyncVehicleModels:
     """Asynchronous vehicle models resource."""
 
-    def __init__(self, client: httpx.AsyncClient, store_id: int | None = None) -> None:
-        self._client = client
-        self._store_id = store_id
-
-    def _headers(self, store_id: int | None = None) -> dict[str, str]:
-        sid = store_id if store_id is not None else self._store_id
-        if sid is not None:
-            return {"Store-Id": str(sid)}
-        return {}
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        store_id: int | None = None,
+        response_mode: ResponseMode = "model",
+    ) -> None:
+        self._call = AsyncExecutor(client, store_id, response_mode)
 
     async def list(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> list[VehicleModel]:
-        try:
-            response = await self._client.get(
-                _MODELS_PATH,
-                params=params or None,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            VehicleModel.model_validate(item)
-            for item in response.json()["vehicle_models"]
-        ]
+        return await self._call(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
 
     async def search(
         self,
         q: str,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> VehicleModel:
         params["q"] = q
-        try:
-            response = await self._client.get(
-                f"{_MODELS_PATH}/search",
-                params=params,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return VehicleModel.model_validate(response.json()["vehicle_model"])
+        return await self._call(
+            _SEARCH, store_id=store_id, params=params, response_mode=response_mode
+        )
 
     async def prices(
         self,
         *,
         store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
         **params: Any,
     ) -> list[VehiclePrice]:
-        try:
-            response = await self._client.get(
-                _PRICES_PATH,
-                params=params or None,
-                headers=self._headers(store_id),
-            )
-        except httpx.HTTPError as exc:
-            handle_request_error(exc)
-            raise
-        raise_for_status(response)
-        return [
-            VehiclePrice.model_validate(item)
-            for item in response.json()["vehicle_prices"]
-        ]
+        return await self._call(
+            _PRICES, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    def iter_list(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+        **params: Any,
+    ) -> AsyncIterator[VehicleModel]:
+        """Yield vehicle models one at a time as the response streams in.
+
+        The ``vehicle_models`` array is parsed incrementally from the body,
+        so memory use stays flat however many models the response holds.
+        """
+        return self._call.stream(
+            _LIST, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    def iter_prices(
+        self,
+        *,
+        store_id: int | None = None,
+        response_mode: ResponseMode | None = None,
+        **params: Any,
+    ) -> AsyncIterator[VehiclePrice]:
+        """Yield vehicle prices one at a time as the response streams in.
+
+        Streaming counterpart of :meth:`prices`; see :meth:`iter_list`.
+        """
+        return self._call.stream(
+            _PRICES, store_id=store_id, params=params, response_mode=response_mode
+        )
+
+    async def price_table(
+        self,
+        *,
+        columns: Iterable[str] | None = None,
+        store_id: int | None = None,
+        **params: Any,
+    ) -> PriceTable:
+        """Load vehicle prices into a columnar :class:`PriceTable`.
+
+        Async counterpart of :meth:`VehicleModels.price_table`.
+        """
+        rows: list[Any] = await self._call(
+            _PRICES, store_id=store_id, params=params, response_mode="raw"
+        )
+        return PriceTable.from_rows(rows, columns)
@@ -0,0 +1,216 @@
+"""Retry policy and retrying transports for the Credere clients."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+# Errors raised before the request left the client: safe to retry any verb.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How failed requests are retried.
+
+    Delays use exponential backoff with full jitter: attempt *n* sleeps a
+    random duration in ``[0, min(backoff_max, backoff_base * 2**n))``. A
+    ``Retry-After`` header on 429/503 responses replaces the computed delay.
+    ``budget`` caps the total seconds a single call may spend, across all
+    attempts, before the last error is surfaced.
+
+    Only ``retry_methods`` are retried on error responses and read failures.
+    Connection failures are retried for every method, since the request was
+    never sent.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    budget: float | None = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    retry_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    respect_retry_after: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {self.max_attempts}")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max must be >= 0")
+        if self.budget is not None and self.budget <= 0:
+            raise ValueError(f"budget must be > 0, got {self.budget}")
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retrying after *attempt* (1-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def retry_after(self, response: httpx.Response) -> float | None:
+        """Seconds requested by a ``Retry-After`` header, if it applies."""
+        if not self.respect_retry_after or response.status_code not in (429, 503):
+            return None
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def delay_for_response(
+        self, request: httpx.Request, response: httpx.Response, attempt: int
+    ) -> float | None:
+        """Delay before retrying *response*, or ``None`` if it is final."""
+        if attempt >= self.max_attempts:
+            return None
+        if request.method not in self.retry_methods:
+            return None
+        if response.status_code not in self.retry_statuses:
+            return None
+        retry_after = self.retry_after(response)
+        return self.backoff(attempt) if retry_after is None else retry_after
+
+    def delay_for_error(
+        self, request: httpx.Request, exc: httpx.TransportError, attempt: int
+    ) -> float | None:
+        """Delay before retrying after *exc*, or ``None`` if it is final."""
+        if attempt >= self.max_attempts:
+            return None
+        if request.method not in self.retry_methods and not isinstance(
+            exc, _NOT_SENT_ERRORS
+        ):
+            return None
+        return self.backoff(attempt)
+
+
+class _RetryStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def as_dict(self) -> dict[str, int]:
+        return {"retries": self.retries, "exhausted": self.exhausted}
+
+
+def _within_budget(deadline: float | None, delay: float) -> bool:
+    return deadline is None or time.monotonic() + delay <= deadline
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retries requests on the wrapped transport according to a policy."""
+
+    metrics_name = "retry"
+
+    def __init__(
+        self,
+        wrapped: httpx.BaseTransport,
+        policy: RetryPolicy,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.wrapped = wrapped
+        self.policy = policy
+        self._sleep = sleep
+        self._stats = _RetryStats()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.policy
+        deadline = None if policy.budget is None else time.monotonic() + policy.budget
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self.wrapped.handle_request(request)
+            except httpx.TransportError as exc:
+                delay = policy.delay_for_error(request, exc, attempt)
+                if delay is None or not _within_budget(deadline, delay):
+                    if attempt > 1:
+                        self._stats.record_exhausted()
+                    raise
+            else:
+                delay = policy.delay_for_response(request, response, attempt)
+                if delay is None or not _within_budget(deadline, delay):
+                    if attempt > 1 and response.status_code in policy.retry_statuses:
+                        self._stats.record_exhausted()
+                    return response
+                response.close()
+            self._stats.record_retry()
+            self._sleep(delay)
+
+    def metrics(self) -> dict[str, Any]:
+        return self._stats.as_dict()
+
+    def close(self) -> None:
+        self.wrapped.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`RetryTransport`."""
+
+    metrics_name = "retry"
+
+    def __init__(
+        self,
+        wrapped: httpx.AsyncBaseTransport,
+        policy: RetryPolicy,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.wrapped = wrapped
+        self.policy = policy
+        self._sleep = sleep
+        self._stats = _RetryStats()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.policy
+        deadline = None if policy.budget is None else time.monotonic() + policy.budget
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.wrapped.handle_async_request(request)
+            except httpx.TransportError as exc:
+                delay = policy.delay_for_error(request, exc, attempt)
+                if delay is None or not _within_budget(deadline, delay):
+                    if attempt > 1:
+                        self._stats.record_exhausted()
+                    raise
+            else:
+                delay = policy.delay_for_response(request, response, attempt)
+                if delay is None or not _within_budget(deadline, delay):
+                    if attempt > 1 and response.status_code in policy.retry_statuses:
+                        self._stats.record_exhausted()
+                    return response
+                await response.aclose()
+            self._stats.record_retry()
+            await self._sleep(delay)
+
+    def metrics(self) -> dict[str, Any]:
+        return self._stats.as_dict()
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
@@ -0,0 +1,287 @@
+"""Persistent response cache for cacheable GET endpoints, stored in SQLite."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from credere.http_cache import HTTPCache
+
+_HOUR = 3600.0
+
+# Reference data that changes rarely, by URL path pattern (``fnmatch`` syntax).
+DEFAULT_TTLS: dict[str, float] = {
+    "/v1/banks": 24 * _HOUR,
+    "/v1/domains": 24 * _HOUR,
+    "/v1/banks_api/domains": 24 * _HOUR,
+    "/v1/vehicle_models": 6 * _HOUR,
+    "/v1/vehicle_models/search": 6 * _HOUR,
+    "/v1/vehicles/license_plate/*": 24 * _HOUR,
+    "/v1/vehicles/chassi_code/*": 24 * _HOUR,
+    "/v1/users/current": 300.0,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    content_type TEXT,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_by_access ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_by_expiry ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals
+    SELECT 0, (SELECT COALESCE(SUM(LENGTH(body)), 0) FROM entries)
+    WHERE NOT EXISTS (SELECT 1 FROM totals);
+CREATE TRIGGER IF NOT EXISTS entries_added AFTER INSERT ON entries BEGIN
+    UPDATE totals SET bytes = bytes + LENGTH(NEW.body);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_removed AFTER DELETE ON entries BEGIN
+    UPDATE totals SET bytes = bytes - LENGTH(OLD.body);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_replaced AFTER UPDATE OF body ON entries BEGIN
+    UPDATE totals SET bytes = bytes + LENGTH(NEW.body) - LENGTH(OLD.body);
+END;
+"""
+
+# An upsert rather than INSERT OR REPLACE, whose implicit delete would not
+# fire the trigger keeping the total size.
+_UPSERT = """
+INSERT INTO entries VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    expires_at = excluded.expires_at,
+    accessed_at = excluded.accessed_at,
+    content_type = excluded.content_type,
+    body = excluded.body
+"""
+
+
+class SQLiteCache:
+    """Response bodies of cacheable GETs, in a SQLite database file.
+
+    One file can be shared by every worker process on a host and survives
+    restarts, so new workers start warm. The database runs in WAL mode, so
+    readers never block on a writer. Only endpoints whose path matches a
+    pattern in *ttls* are cached, each for its own number of seconds; the
+    first matching pattern wins. Bodies are stored zlib-compressed, and
+    beyond *max_bytes* of stored bodies the least recently read entries are
+    evicted; triggers keep the total size up to date, so checking it does
+    not scan the table. Entries are keyed by URL, ``Store-Id`` and
+    credentials, like :class:`~credere.http_cache.HTTPCache`.
+
+    Expiry uses wall-clock time, since entries are shared across processes.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ttls: Mapping[str, float] | None = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = 0
+        self._counters = {"hits": 0, "misses": 0, "stored": 0, "evictions": 0}
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection inherited through fork() must not be used by the child.
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=10.0, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def ttl(self, path: str) -> float | None:
+        """Return the TTL for requests to *path*, or ``None`` if not cacheable."""
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    def get(self, key: str) -> tuple[bytes, str | None] | None:
+        """Return ``(body, content_type)`` for a fresh entry, or ``None``."""
+        now = self._clock()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                row = connection.execute(
+                    "SELECT expires_at, content_type, body FROM entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and row[0] <= now:
+                    connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self._counters["misses"] += 1
+                    return None
+                connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                self._counters["hits"] += 1
+        return zlib.decompress(row[2]), row[1]
+
+    def set(self, key: str, body: bytes, content_type: str | None, ttl: float) -> None:
+        now = self._clock()
+        compressed = zlib.compress(body)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    _UPSERT, (key, now + ttl, now, content_type, compressed)
+                )
+                self._counters["stored"] += 1
+                self._evict(connection, now)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        (total,) = connection.execute("SELECT bytes FROM totals").fetchone()
+        if total <= self.max_bytes:
+            return
+        victims = []
+        rows = connection.execute(
+            "SELECT key, LENGTH(body) FROM entries ORDER BY accessed_at"
+        )
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self._counters["evictions"] += len(victims)
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = (
+                self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()
+            )
+        return int(count)
+
+    def stats(self) -> dict[str, Any]:
+        """Return this process's counters and the size of the shared database."""
+        with self._lock:
+            count, size = (
+                self._connect()
+                .execute("SELECT COUNT(*), (SELECT bytes FROM totals) FROM entries")
+                .fetchone()
+            )
+            return {**self._counters, "size": count, "bytes": size}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+
+def _response(body: bytes, content_type: str | None) -> httpx.Response:
+    headers = {"Content-Type": content_type} if content_type is not None else {}
+    return httpx.Response(200, headers=headers, content=body)
+
+
+class SQLiteCacheTransport(httpx.BaseTransport):
+    """Answers cacheable GETs from a :class:`SQLiteCache`."""
+
+    metrics_name = "sqlite_cache"
+
+    def __init__(self, wrapped: httpx.BaseTransport, cache: SQLiteCache) -> None:
+        self.wrapped = wrapped
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        ttl = self.cache.ttl(request.url.path) if request.method == "GET" else None
+        if ttl is None:
+            return self.wrapped.handle_request(request)
+        key = HTTPCache.key(request)
+        hit = self.cache.get(key)
+        if hit is not None:
+            return _response(*hit)
+        response = self.wrapped.handle_request(request)
+        if response.status_code != 200:
+            return response
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        content_type = response.headers.get("Content-Type")
+        self.cache.set(key, body, content_type, ttl)
+        return _response(body, content_type)
+
+    def metrics(self) -> dict[str, Any]:
+        return self.cache.stats()
+
+    def close(self) -> None:
+        self.wrapped.close()
+
+
+class AsyncSQLiteCacheTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`SQLiteCacheTransport`.
+
+    SQLite calls are local and short, so they run inline on the event loop.
+    """
+
+    metrics_name = "sqlite_cache"
+
+    def __init__(self, wrapped: httpx.AsyncBaseTransport, cache: SQLiteCache) -> None:
+        self.wrapped = wrapped
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        ttl = self.cache.ttl(request.url.path) if request.method == "GET" else None
+        if ttl is None:
+            return await self.wrapped.handle_async_request(request)
+        key = HTTPCache.key(request)
+        hit = self.cache.get(key)
+        if hit is not None:
+            return _response(*hit)
+        response = await self.wrapped.handle_async_request(request)
+        if response.status_code != 200:
+            return response
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        content_type = response.headers.get("Content-Type")
+        self.cache.set(key, body, content_type, ttl)
+        return _response(body, content_type)
+
+    def metrics(self) -> dict[str, Any]:
+        return self.cache.stats()
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
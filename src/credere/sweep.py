@@ -0,0 +1,144 @@
+"""Simulation sweeps over a grid of down payments, installments and vehicles."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from credere.bulk import BulkResult, BulkStats
+from credere.models.simulations import (
+    Simulation,
+    SimulationCondition,
+    SimulationConditionRequest,
+    SimulationCreateRequest,
+    SimulationVehicleRequest,
+)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SweepRow:
+    """One condition returned by a sweep, with the vehicle it was quoted for."""
+
+    vehicle: SimulationVehicleRequest
+    condition: SimulationCondition
+
+
+@dataclass(frozen=True)
+class SimulationSweep:
+    """Merged, ranked outcome of a simulation sweep.
+
+    ``rows`` holds every returned condition, best first. ``failed`` holds
+    the requests that raised; each result's ``item`` is the request, so it
+    can be submitted again.
+    """
+
+    rows: list[SweepRow]
+    failed: list[BulkResult[Simulation]]
+    stats: BulkStats
+
+    @property
+    def best(self) -> SweepRow | None:
+        return self.rows[0] if self.rows else None
+
+
+def by_total_cost(row: SweepRow) -> tuple[bool, float, float]:
+    """Rank successful conditions first, then by total cost, then by CET.
+
+    The total cost is the down payment plus the amount paid in financing,
+    so conditions with different down payments compare on what the buyer
+    pays overall, not only on the financed part.
+    """
+    condition = row.condition
+    paid = condition.amount_paid_in_financing
+    return (
+        condition.success is not True,
+        math.inf if paid is None else (condition.down_payment or 0) + paid,
+        _or_inf(condition.cet_monthly),
+    )
+
+
+def simulation_grid(
+    template: SimulationCreateRequest,
+    *,
+    down_payments: Iterable[int],
+    installments: Iterable[int],
+    vehicles: Iterable[SimulationVehicleRequest] | None = None,
+    conditions_per_request: int = 10,
+) -> list[SimulationCreateRequest]:
+    """Build the requests covering each down payment and installments pair.
+
+    Each vehicle (by default the template's) gets one condition per pair,
+    financing its ``asset_value`` minus the down payment; pairs whose down
+    payment covers the whole value are skipped. A vehicle's conditions are
+    split into as few requests as *conditions_per_request* allows, with
+    sizes differing by at most one so that no request lags the others. The
+    remaining fields are copied from *template*.
+    """
+    if conditions_per_request < 1:
+        raise ValueError(
+            f"conditions_per_request must be >= 1, got {conditions_per_request}"
+        )
+    down_payments = list(down_payments)
+    installments = list(installments)
+    requests = []
+    for vehicle in [template.vehicle] if vehicles is None else vehicles:
+        conditions = [
+            SimulationConditionRequest(
+                down_payment=down_payment,
+                financed_amount=vehicle.asset_value - down_payment,
+                installments=count,
+            )
+            for down_payment in down_payments
+            for count in installments
+            if down_payment < vehicle.asset_value
+        ]
+        for chunk in _split(conditions, conditions_per_request):
+            update = {
+                "assets_value": vehicle.asset_value,
+                "conditions": chunk,
+                "vehicle": vehicle,
+            }
+            requests.append(template.model_copy(update=update))
+    return requests
+
+
+def merge_sweep(
+    results: Iterable[BulkResult[Simulation]],
+    stats: BulkStats,
+    key: Callable[[SweepRow], Any] | None = None,
+) -> SimulationSweep:
+    """Merge the results of a sweep's requests into one ranked table."""
+    rows: list[SweepRow] = []
+    failed: list[BulkResult[Simulation]] = []
+    for result in results:
+        if result.value is None:
+            failed.append(result)
+            continue
+        vehicle = result.item.vehicle
+        rows.extend(
+            SweepRow(vehicle, condition) for condition in result.value.conditions or ()
+        )
+    rows.sort(key=by_total_cost if key is None else key)
+    return SimulationSweep(rows, failed, stats)
+
+
+def _split(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    count = math.ceil(len(items) / size)
+    if not count:
+        return []
+    quotient, remainder = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + quotient + (i < remainder)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def _or_inf(value: float | None) -> float:
+    return math.inf if value is None else value
@@ -9,6 +9,21 @@ TEST_BASE_URL = "https://api.credere.com"
 TEST_STORE_ID = 42
 
 
+class FakeClock:
+    """Clock for code that takes a ``clock`` callable; move time via ``now``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
 @pytest.fixture
 def sync_client() -> CredereClient:
     client = CredereClient(
@@ -0,0 +1,153 @@
+"""Tests for bulk operations."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from credere.bulk import AsyncBulkRun, BulkRun, BulkStats
+
+
+class Gauge:
+    """Tracks how many calls are running at once."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def __exit__(self, *args: object) -> None:
+        with self._lock:
+            self.running -= 1
+
+
+class TestBulkRun:
+    def test_runs_at_most_concurrency_calls_at_once(self) -> None:
+        gauge = Gauge()
+
+        def call(item: int) -> int:
+            with gauge:
+                time.sleep(0.01)
+            return item * 2
+
+        results = BulkRun(call, range(12), concurrency=3).collect()
+
+        assert [r.value for r in results] == [i * 2 for i in range(12)]
+        assert gauge.peak == 3
+
+    def test_pulls_input_lazily(self) -> None:
+        pulled = []
+
+        def items() -> Iterator[int]:
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        run = BulkRun(lambda item: item, items(), concurrency=2)
+        assert pulled == []
+
+        next(run)
+
+        assert len(pulled) <= 3
+
+    def test_failure_does_not_stop_the_run(self) -> None:
+        def call(item: int) -> int:
+            if item == 1:
+                raise ValueError("bad item")
+            return item
+
+        results = BulkRun(call, range(3), concurrency=1).collect()
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert results[1].value is None
+
+    def test_close_skips_remaining_items(self) -> None:
+        calls = []
+
+        def call(item: int) -> int:
+            calls.append(item)
+            return item
+
+        run = BulkRun(call, range(1000), concurrency=2)
+        next(run)
+        run.close()
+
+        assert len(calls) < 10
+
+    def test_stats(self) -> None:
+        ticks = iter([10.0, 12.0, 14.0])
+        run = BulkRun(
+            lambda item: 1 / item, [1, 0, 2], concurrency=1, clock=lambda: next(ticks)
+        )
+
+        assert run.stats() == BulkStats(0, 0, 0, 0.0)
+        run.collect()
+
+        stats = run.stats()
+        assert stats == BulkStats(submitted=3, succeeded=2, failed=1, elapsed=2.0)
+        assert stats.throughput == 1.5
+        assert stats.as_dict()["completed"] == 3
+
+    def test_rejects_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            BulkRun(lambda item: item, [], concurrency=0)
+
+
+class TestAsyncBulkRun:
+    async def test_runs_at_most_concurrency_calls_at_once(self) -> None:
+        gauge = Gauge()
+
+        async def call(item: int) -> int:
+            with gauge:
+                await asyncio.sleep(0.01)
+            return item
+
+        run = AsyncBulkRun(call, range(10), concurrency=4)
+        results = await run.collect()
+
+        assert [r.value for r in results] == list(range(10))
+        assert gauge.peak == 4
+        assert run.stats().succeeded == 10
+
+    async def test_accepts_async_iterable(self) -> None:
+        async def items() -> AsyncIterator[int]:
+            for i in range(3):
+                yield i
+
+        async def call(item: int) -> int:
+            if item == 2:
+                raise KeyError(item)
+            return item
+
+        results = await AsyncBulkRun(call, items(), concurrency=2).collect()
+
+        assert [(r.index, r.ok) for r in results] == [(0, True), (1, True), (2, False)]
+
+    async def test_closing_cancels_running_calls(self) -> None:
+        cancelled = 0
+
+        async def call(item: int) -> int:
+            nonlocal cancelled
+            if item == 0:
+                return item
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return item
+
+        run = AsyncBulkRun(call, range(5), concurrency=3)
+        first = await anext(run)
+        await run.aclose()
+
+        assert first.index == 0
+        assert cancelled == 2
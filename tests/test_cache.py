@@ -0,0 +1,211 @@
+"""Tests for the TTL cache and cached Utilities reference-data endpoints."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from credere.cache import TTLCache
+from credere.client import AsyncCredereClient, CredereClient
+from credere.models.simulations import Bank
+from tests.conftest import FakeClock
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+BANKS_URL = f"{BASE_URL}/v1/banks"
+DOMAINS_URL = f"{BASE_URL}/v1/domains"
+
+SAMPLE_BANK = {"id": 1, "febraban_code": "001", "name": "Banco do Brasil"}
+SAMPLE_DOMAIN = {"id": 1, "type": "gender", "label": "Masculino"}
+
+
+class TestTTLCache:
+    def test_expires_after_ttl(self, clock: FakeClock) -> None:
+        cache = TTLCache(ttl=10.0, clock=clock)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        clock.now = 10.0
+        assert cache.get("key") is None
+        assert cache.stats().misses == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+
+    def test_serves_stale_within_revalidate_window(self, clock: FakeClock) -> None:
+        cache = TTLCache(ttl=10.0, stale_while_revalidate=5.0, clock=clock)
+        cache.set("key", "value")
+
+        clock.now = 12.0
+        assert cache.lookup("key") == ("value", True)
+        assert cache.begin_refresh("key") is True
+        assert cache.begin_refresh("key") is False
+        clock.now = 16.0
+        assert cache.lookup("key") is None
+
+    def test_get_treats_stale_entries_as_misses(self, clock: FakeClock) -> None:
+        cache = TTLCache(ttl=10.0, stale_while_revalidate=5.0, clock=clock)
+        cache.set("key", "value")
+
+        clock.now = 12.0
+        assert cache.get("key") is None
+        # The entry is still there for callers that accept stale values.
+        assert cache.lookup("key") == ("value", True)
+        stats = cache.stats()
+        assert (stats.misses, stats.stale_hits) == (1, 1)
+
+    def test_stats_hit_rate(self) -> None:
+        cache = TTLCache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"maxsize": 0}, {"ttl": 0}, {"stale_while_revalidate": -1}]
+    )
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            TTLCache(**kwargs)
+
+
+class TestCachedUtilities:
+    @respx.mock
+    def test_banks_are_served_from_cache(self) -> None:
+        route = respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json={"banks": [SAMPLE_BANK]})
+        )
+        with CredereClient(api_key=API_KEY, reference_cache=TTLCache()) as client:
+            first = client.utilities.banks()
+            second = client.utilities.banks()
+
+            assert route.call_count == 1
+            assert first == second
+            assert isinstance(second[0], Bank)
+            assert first is not second
+            stats = client.metrics()["reference_cache"]
+            assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    @respx.mock
+    def test_callers_cannot_mutate_the_cache(self) -> None:
+        respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json={"banks": [SAMPLE_BANK]})
+        )
+        with CredereClient(api_key=API_KEY, reference_cache=TTLCache()) as client:
+            client.utilities.banks()[0].name = "changed"
+            cached = client.utilities.banks()
+            cached[0].name = "changed again"
+
+            assert client.utilities.banks()[0].name == "Banco do Brasil"
+
+    @respx.mock
+    def test_cache_is_keyed_by_store(self) -> None:
+        route = respx.get(DOMAINS_URL).mock(
+            return_value=httpx.Response(200, json=[SAMPLE_DOMAIN])
+        )
+        with CredereClient(api_key=API_KEY, reference_cache=TTLCache()) as client:
+            client.utilities.domains(store_id=1)
+            client.utilities.domains(store_id=2)
+            client.utilities.domains(store_id=1)
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_invalidate_cache_forces_refetch(self) -> None:
+        route = respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json={"banks": [SAMPLE_BANK]})
+        )
+        with CredereClient(api_key=API_KEY, reference_cache=TTLCache()) as client:
+            client.utilities.banks()
+            client.utilities.invalidate_cache()
+            client.utilities.banks()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_stale_value_is_served_while_revalidating(self, clock: FakeClock) -> None:
+        route = respx.get(BANKS_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"banks": [SAMPLE_BANK]}),
+                httpx.Response(200, json={"banks": [{**SAMPLE_BANK, "id": 2}]}),
+            ]
+        )
+        cache = TTLCache(ttl=10.0, stale_while_revalidate=60.0, clock=clock)
+        with CredereClient(api_key=API_KEY, reference_cache=cache) as client:
+            client.utilities.banks()
+            clock.now = 20.0
+
+            stale = client.utilities.banks()
+            deadline = time.monotonic() + 2
+            while (
+                route.call_count < 2 or cache.get(("utilities", "banks", None)) is None
+            ):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            fresh = client.utilities.banks()
+
+        assert stale[0].id == 1
+        assert fresh[0].id == 2
+
+    @respx.mock
+    def test_without_cache_every_call_hits_the_api(self) -> None:
+        route = respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json={"banks": [SAMPLE_BANK]})
+        )
+        with CredereClient(api_key=API_KEY) as client:
+            client.utilities.banks()
+            client.utilities.banks()
+
+        assert route.call_count == 2
+
+
+class TestAsyncCachedUtilities:
+    @respx.mock
+    async def test_lead_domains_are_served_from_cache(self) -> None:
+        route = respx.get(f"{BASE_URL}/v1/banks_api/domains").mock(
+            return_value=httpx.Response(200, json=[SAMPLE_DOMAIN])
+        )
+        async with AsyncCredereClient(
+            api_key=API_KEY, reference_cache=TTLCache()
+        ) as client:
+            await client.utilities.lead_domains()
+            result = await client.utilities.lead_domains()
+
+        assert route.call_count == 1
+        assert result[0].label == "Masculino"
+
+    @respx.mock
+    async def test_stale_value_is_served_while_revalidating(
+        self, clock: FakeClock
+    ) -> None:
+        route = respx.get(BANKS_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"banks": [SAMPLE_BANK]}),
+                httpx.Response(200, json={"banks": [{**SAMPLE_BANK, "id": 2}]}),
+            ]
+        )
+        cache = TTLCache(ttl=10.0, stale_while_revalidate=60.0, clock=clock)
+        async with AsyncCredereClient(api_key=API_KEY, reference_cache=cache) as client:
+            await client.utilities.banks()
+            clock.now = 20.0
+
+            stale = await client.utilities.banks()
+            await asyncio.sleep(0.05)
+            fresh = await client.utilities.banks()
+
+        assert route.call_count == 2
+        assert stale[0].id == 1
+        assert fresh[0].id == 2
@@ -0,0 +1,228 @@
+"""Tests for the offline vehicle catalog index."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from credere.catalog import VehicleCatalog
+from credere.client import AsyncCredereClient, CredereClient
+from credere.models.vehicle_models import VehicleModel
+
+BASE_URL = "https://api.credere.com"
+MODELS_URL = f"{BASE_URL}/v1/vehicle_models"
+
+MODELS = [
+    {
+        "id": 1,
+        "brand": "Honda",
+        "name": "Civic",
+        "version": "EXL 2.0 Flex",
+        "molicar_code": "001234-5",
+        "fipe_code": "014071-3",
+        "year_start": 2017,
+        "year_end": 2021,
+        "active": True,
+        "updated_at": "2024-01-01T00:00:00Z",
+    },
+    {
+        "id": 2,
+        "brand": "Honda",
+        "name": "City",
+        "version": "Touring 1.5",
+        "molicar_code": "001300-1",
+        "year_start": 2022,
+        "active": True,
+        "updated_at": "2024-01-01T00:00:00Z",
+    },
+    {
+        "id": 3,
+        "brand": "Peugeot",
+        "name": "2008",
+        "version": "Griffe 1.6",
+        "molicar_code": "004455-0",
+        "year_start": 2015,
+        "year_end": 2020,
+        "active": True,
+        "updated_at": "2024-01-01T00:00:00Z",
+    },
+    {
+        "id": 4,
+        "brand": "Citroën",
+        "name": "C4 Cactus",
+        "version": "Shine",
+        "molicar_code": "005500-9",
+        "year_start": 2019,
+        "year_end": 2023,
+        "active": False,
+        "updated_at": "2024-01-01T00:00:00Z",
+    },
+]
+
+
+def _catalog(models: list[dict[str, object]] = MODELS) -> VehicleCatalog:
+    return VehicleCatalog(VehicleModel.model_validate(model) for model in models)
+
+
+def _ids(models: list[VehicleModel]) -> list[int | None]:
+    return [model.id for model in models]
+
+
+class TestSearch:
+    def test_prefix_of_a_name(self) -> None:
+        assert _ids(_catalog().search("civ")) == [1]
+
+    def test_every_word_must_match(self) -> None:
+        catalog = _catalog()
+
+        assert _ids(catalog.search("honda c")) == [2, 1]
+        assert _ids(catalog.search("honda touring")) == [2]
+        assert catalog.search("honda shine") == []
+
+    def test_exact_match_ranks_before_prefix(self) -> None:
+        catalog = _catalog(
+            [
+                {"id": 1, "name": "Onix Plus"},
+                {"id": 2, "name": "On"},
+            ]
+        )
+
+        assert _ids(catalog.search("on")) == [2, 1]
+
+    def test_tolerates_one_typo(self) -> None:
+        catalog = _catalog()
+
+        assert _ids(catalog.search("cvic")) == [1]
+        assert _ids(catalog.search("icvic")) == [1]
+        assert _ids(catalog.search("peugot")) == [3]
+        assert catalog.search("cvc") == []
+
+    def test_ignores_case_and_accents(self) -> None:
+        assert _ids(_catalog().search("CITROEN")) == [4]
+        assert _ids(_catalog().search("citroën")) == [4]
+
+    def test_by_code(self) -> None:
+        catalog = _catalog()
+
+        assert _ids(catalog.search("001234-5")) == [1]
+        assert _ids(catalog.search("0012345")) == [1]
+        assert _ids(catalog.search("014071")) == [1]
+        assert catalog.get("014071-3") == catalog.search("civic")[0]
+        assert catalog.get("999999-9") is None
+
+    def test_year_filters_the_range(self) -> None:
+        catalog = _catalog()
+
+        assert _ids(catalog.search("honda 2020")) == [1]
+        assert _ids(catalog.search("honda", year=2023)) == [2]
+        assert _ids(catalog.search("", year=2016)) == [3]
+
+    def test_year_like_name_is_a_name(self) -> None:
+        assert _ids(_catalog().search("2008")) == [3]
+
+    def test_inactive_models_rank_last(self) -> None:
+        catalog = _catalog(
+            [
+                {"id": 1, "name": "Gol", "active": False},
+                {"id": 2, "name": "Gol", "active": True},
+            ]
+        )
+
+        assert _ids(catalog.search("gol")) == [2, 1]
+
+    def test_limit(self) -> None:
+        assert len(_catalog().search("honda", limit=1)) == 1
+
+    def test_empty_query(self) -> None:
+        assert _catalog().search("  ") == []
+
+
+class TestReplace:
+    def test_counts_only_changed_models(self) -> None:
+        catalog = _catalog()
+        updated = {**MODELS[0], "name": "Civic Si", "updated_at": "2024-06-01T00:00Z"}
+
+        assert catalog.replace(VehicleModel.model_validate(m) for m in MODELS) == 0
+        changed = catalog.replace(
+            VehicleModel.model_validate(m) for m in [updated, *MODELS[1:3]]
+        )
+
+        assert changed == 2
+        assert len(catalog) == 3
+        assert catalog.search("si")[0].name == "Civic Si"
+        assert catalog.search("cactus") == []
+
+
+class TestRefresh:
+    @respx.mock
+    def test_load_from_resource(self, sync_client: CredereClient) -> None:
+        route = respx.get(MODELS_URL).mock(
+            return_value=httpx.Response(200, json={"vehicle_models": MODELS})
+        )
+
+        catalog = VehicleCatalog.load(sync_client.vehicle_models, active=True)
+
+        assert route.calls[0].request.url.params["active"] == "true"
+        assert len(catalog) == 4
+        assert catalog.refresh(sync_client.vehicle_models) == 0
+
+    @respx.mock
+    def test_background_refresh(self, sync_client: CredereClient) -> None:
+        refreshed = threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if respx.calls.call_count > 1:
+                refreshed.set()
+                return httpx.Response(200, json={"vehicle_models": MODELS[:1]})
+            return httpx.Response(200, json={"vehicle_models": MODELS})
+
+        respx.get(MODELS_URL).mock(side_effect=respond)
+        catalog = VehicleCatalog.load(sync_client.vehicle_models)
+
+        catalog.start_refresh(sync_client.vehicle_models, interval=0.01)
+        try:
+            assert refreshed.wait(5)
+            for _ in range(500):
+                if len(catalog) == 1:
+                    break
+                time.sleep(0.01)
+        finally:
+            catalog.stop_refresh()
+
+        assert len(catalog) == 1
+
+    def test_rejects_invalid_interval(self, sync_client: CredereClient) -> None:
+        with pytest.raises(ValueError, match="interval"):
+            VehicleCatalog().start_refresh(sync_client.vehicle_models, interval=0)
+
+
+class TestAsyncRefresh:
+    @respx.mock
+    async def test_load_and_refresh_in_background(
+        self, async_client: AsyncCredereClient
+    ) -> None:
+        route = respx.get(MODELS_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"vehicle_models": MODELS}),
+                httpx.Response(500, json={"error": "boom"}),
+                httpx.Response(200, json={"vehicle_models": MODELS[:2]}),
+            ]
+        )
+
+        catalog = await VehicleCatalog.aload(async_client.vehicle_models)
+        assert len(catalog) == 4
+
+        catalog.start_refresh(async_client.vehicle_models, interval=0.01)
+        try:
+            for _ in range(500):
+                if len(catalog) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            catalog.stop_refresh()
+
+        assert route.call_count >= 3
+        assert len(catalog) == 2
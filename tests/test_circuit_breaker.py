@@ -0,0 +1,193 @@
+"""Tests for the per-endpoint circuit breaker."""
+
+import httpx
+import pytest
+import respx
+
+from credere._transport import endpoint_family
+from credere.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitState,
+)
+from credere.client import AsyncCredereClient, CredereClient
+from credere.exceptions import (
+    CircuitOpenError,
+    CredereAPIError,
+    CredereConnectionError,
+)
+from credere.factory import CredereClientFactory
+from credere.retry import RetryPolicy
+from tests.conftest import FakeClock
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+SIMULATIONS_URL = f"{BASE_URL}/v1/proposal_simulations"
+LEADS_URL = f"{BASE_URL}/v1/banks_api/leads"
+
+CONFIG = CircuitBreakerConfig(window_size=4, minimum_calls=4, open_duration=30.0)
+
+
+@pytest.mark.parametrize(
+    ("path", "family"),
+    [
+        ("/v1/banks_api/simulations", "simulations"),
+        ("/v1/banks_api/leads/123/required_fields", "leads"),
+        ("/v1/proposals/abc/proposal_attempts", "proposals"),
+        ("/v1/customers/find", "customers"),
+    ],
+)
+def test_endpoint_family(path: str, family: str) -> None:
+    assert endpoint_family(path) == family
+
+
+class TestCircuitBreaker:
+    def _trip(self, breaker: CircuitBreaker) -> None:
+        for _ in range(4):
+            breaker.before_call()
+            breaker.record(failed=True, duration=0.1)
+
+    def test_opens_when_failure_rate_reached(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker("simulations", CONFIG, clock=clock)
+
+        self._trip(breaker)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.endpoint == "simulations"
+        assert exc_info.value.retry_after == 30.0
+
+    def test_stays_closed_below_minimum_calls(self) -> None:
+        breaker = CircuitBreaker("leads", CONFIG)
+
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record(failed=True, duration=0.1)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_opens_on_slow_calls(self) -> None:
+        config = CircuitBreakerConfig(
+            window_size=2,
+            minimum_calls=2,
+            slow_call_duration=1.0,
+            slow_call_rate_threshold=1.0,
+        )
+        breaker = CircuitBreaker("simulations", config)
+
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record(failed=False, duration=5.0)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_success_closes_circuit(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker("simulations", CONFIG, clock=clock)
+        self._trip(breaker)
+
+        clock.now = 30.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record(failed=False, duration=0.1)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_failure_reopens_circuit(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker("simulations", CONFIG, clock=clock)
+        self._trip(breaker)
+
+        clock.now = 31.0
+        breaker.before_call()
+        breaker.record(failed=True, duration=0.1)
+
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"failure_rate_threshold": 0.0},
+            {"minimum_calls": 50},
+            {"open_duration": -1.0},
+        ],
+    )
+    def test_rejects_invalid_config(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            CircuitBreakerConfig(**kwargs)
+
+
+class TestClientCircuitBreaker:
+    @respx.mock
+    def test_fails_fast_once_open(self) -> None:
+        route = respx.get(SIMULATIONS_URL).mock(return_value=httpx.Response(503))
+        with CredereClient(api_key=API_KEY, circuit_breaker=CONFIG) as client:
+            for _ in range(4):
+                with pytest.raises(CredereAPIError):
+                    client.simulations.list()
+
+            with pytest.raises(CircuitOpenError):
+                client.simulations.list()
+
+            assert route.call_count == 4
+            metrics = client.metrics()["circuit_breaker"]
+            assert metrics["proposal_simulations"]["state"] == "open"
+            assert metrics["proposal_simulations"]["rejected"] == 1
+
+    @respx.mock
+    def test_other_families_are_unaffected(self) -> None:
+        respx.get(SIMULATIONS_URL).mock(return_value=httpx.Response(503))
+        leads = respx.get(LEADS_URL).mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+        with CredereClient(api_key=API_KEY, circuit_breaker=CONFIG) as client:
+            for _ in range(4):
+                with pytest.raises(CredereAPIError):
+                    client.simulations.list()
+
+            assert client.leads.list() == []
+            assert leads.called
+
+    @respx.mock
+    def test_open_circuit_is_not_retried(self) -> None:
+        route = respx.get(SIMULATIONS_URL).mock(return_value=httpx.Response(503))
+        with CredereClient(
+            api_key=API_KEY,
+            circuit_breaker=CONFIG,
+            retry=RetryPolicy(max_attempts=10, backoff_base=0.0),
+        ) as client:
+            with pytest.raises(CircuitOpenError):
+                client.simulations.list()
+
+            assert route.call_count == 4
+
+    @respx.mock
+    def test_factory_shares_breaker_between_clients(self) -> None:
+        respx.get(SIMULATIONS_URL).mock(return_value=httpx.Response(503))
+        with CredereClientFactory(circuit_breaker=CONFIG) as factory:
+            for store_id in range(4):
+                with pytest.raises(CredereAPIError):
+                    factory.client(API_KEY, store_id=store_id).simulations.list()
+
+            with pytest.raises(CircuitOpenError):
+                factory.client(API_KEY, store_id=99).simulations.list()
+
+
+class TestAsyncClientCircuitBreaker:
+    @respx.mock
+    async def test_fails_fast_once_open(self) -> None:
+        route = respx.get(SIMULATIONS_URL).mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+        async with AsyncCredereClient(
+            api_key=API_KEY, circuit_breaker=CONFIG
+        ) as client:
+            for _ in range(4):
+                with pytest.raises(CredereConnectionError):
+                    await client.simulations.list()
+
+            with pytest.raises(CircuitOpenError):
+                await client.simulations.list()
+
+            assert route.call_count == 4
@@ -1,12 +1,19 @@
 """Tests for client instantiation and auth header injection."""
 
 import httpx
+import pytest
 import respx
 
+import credere.client
+from credere._decode import LazyModel
 from credere.client import AsyncCredereClient, CredereClient
+from credere.config import PoolConfig
+from credere.models.vehicle_models import VehiclePrice
 
 API_KEY = "sk-test-key"
 BASE_URL = "https://api.credere.com"
+PRICES_URL = f"{BASE_URL}/v1/vehicle_prices"
+PRICES_BODY = {"vehicle_prices": [{"id": 1, "vehicle_model": {"name": "Civic"}}]}
 
 
 class TestCredereClient:
@@ -47,3 +54,107 @@ class TestAsyncCredereClient:
         async with AsyncCredereClient(api_key=API_KEY) as client:
             assert client._http.is_closed is False
         assert client._http.is_closed is True
+
+
+class TestPoolConfig:
+    def test_defaults_are_valid(self) -> None:
+        pool = PoolConfig()
+
+        limits = pool.limits()
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+        assert limits.keepalive_expiry == 5.0
+
+    def test_unset_timeouts_fall_back_to_default(self) -> None:
+        timeout = PoolConfig(connect_timeout=2.0, pool_timeout=1.0).timeout(10.0)
+
+        assert timeout.connect == 2.0
+        assert timeout.read == 10.0
+        assert timeout.write == 10.0
+        assert timeout.pool == 1.0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_connections": 0},
+            {"max_keepalive_connections": 0},
+            {"keepalive_expiry": -1.0},
+            {"read_timeout": -0.5},
+            {"max_connections": 5, "max_keepalive_connections": 10},
+        ],
+    )
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            PoolConfig(**kwargs)
+
+    def test_client_applies_pool_config(self) -> None:
+        pool = PoolConfig(
+            max_connections=50, max_keepalive_connections=10, read_timeout=60.0
+        )
+        with CredereClient(api_key=API_KEY, timeout=5.0, pool=pool) as client:
+            assert client._http.timeout.read == 60.0
+            assert client._http.timeout.connect == 5.0
+            pool_metrics = client.metrics()["pool"]
+            assert pool_metrics["max_connections"] == 50
+            assert pool_metrics["max_keepalive_connections"] == 10
+            assert pool_metrics["connections"] == 0
+
+    async def test_async_client_applies_pool_config(self) -> None:
+        pool = PoolConfig(max_connections=8, max_keepalive_connections=4)
+        async with AsyncCredereClient(api_key=API_KEY, pool=pool) as client:
+            pool_metrics = client.metrics()["pool"]
+            assert pool_metrics["max_connections"] == 8
+            assert pool_metrics["idle_connections"] == 0
+
+
+class TestHTTP2:
+    async def test_http2_enabled_when_h2_installed(self) -> None:
+        pytest.importorskip("h2")
+        async with AsyncCredereClient(api_key=API_KEY, http2=True) as client:
+            assert client.metrics()["http2"] is True
+
+    async def test_falls_back_to_http1_without_h2(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(credere.client.importlib.util, "find_spec", lambda _: None)
+
+        with pytest.warns(RuntimeWarning, match="falling back to HTTP/1.1"):
+            client = AsyncCredereClient(api_key=API_KEY, http2=True)
+
+        assert client.metrics()["http2"] is False
+        await client.close()
+
+    def test_sync_client_defaults_to_http1(self) -> None:
+        with CredereClient(api_key=API_KEY) as client:
+            assert client.metrics()["http2"] is False
+
+
+class TestResponseMode:
+    @respx.mock
+    def test_defaults_to_models(self) -> None:
+        respx.get(PRICES_URL).mock(return_value=httpx.Response(200, json=PRICES_BODY))
+        with CredereClient(api_key=API_KEY) as client:
+            (price,) = client.vehicle_models.prices()
+
+        assert isinstance(price, VehiclePrice)
+
+    @respx.mock
+    def test_client_mode_applies_to_every_call(self) -> None:
+        respx.get(PRICES_URL).mock(return_value=httpx.Response(200, json=PRICES_BODY))
+        with CredereClient(api_key=API_KEY, response_mode="raw") as client:
+            prices = client.vehicle_models.prices()
+
+        assert prices == PRICES_BODY["vehicle_prices"]
+
+    @respx.mock
+    async def test_call_mode_overrides_client_mode(self) -> None:
+        respx.get(PRICES_URL).mock(return_value=httpx.Response(200, json=PRICES_BODY))
+        async with AsyncCredereClient(api_key=API_KEY, response_mode="raw") as client:
+            (price,) = await client.vehicle_models.prices(response_mode="lazy")
+
+        assert isinstance(price, LazyModel)
+        assert price.vehicle_model.name == "Civic"
+
+    def test_rejects_unknown_mode(self) -> None:
+        with pytest.raises(ValueError, match="response_mode"):
+            CredereClient(api_key=API_KEY, response_mode="fast")  # type: ignore[arg-type]
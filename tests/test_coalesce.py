@@ -0,0 +1,198 @@
+"""Tests for single-flight coalescing of identical GET requests."""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import respx
+
+from credere.client import AsyncCredereClient, CredereClient
+from credere.coalesce import CoalescingTransport
+from credere.exceptions import CredereConnectionError
+from credere.models.leads import Lead, LeadCreateRequest
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+LEAD_URL = f"{BASE_URL}/v1/banks_api/leads/12345678900"
+
+SAMPLE_LEAD = {"data": {"id": 1, "cpf_cnpj": "12345678900", "name": "João"}}
+
+
+def _slow_response(request: httpx.Request) -> httpx.Response:
+    time.sleep(0.1)
+    return httpx.Response(200, json=SAMPLE_LEAD)
+
+
+class TestCoalescingTransport:
+    def test_waiters_share_one_upstream_call(self) -> None:
+        calls = 0
+        release = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            release.wait(1)
+            return httpx.Response(
+                200,
+                headers={"Content-Encoding": "gzip"},
+                content=gzip.compress(json.dumps(SAMPLE_LEAD).encode()),
+            )
+
+        transport = CoalescingTransport(httpx.MockTransport(handler))
+        with (
+            httpx.Client(transport=transport) as client,
+            ThreadPoolExecutor(max_workers=5) as pool,
+        ):
+            futures = [pool.submit(client.get, LEAD_URL) for _ in range(5)]
+            while transport.metrics()["coalesced"] < 4:
+                time.sleep(0.005)
+            release.set()
+            responses = [future.result() for future in futures]
+
+        assert calls == 1
+        assert all(response.json() == SAMPLE_LEAD for response in responses)
+        assert transport.metrics() == {"requests": 5, "coalesced": 4, "in_flight": 0}
+
+    def test_different_store_ids_are_not_merged(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json=SAMPLE_LEAD)
+
+        transport = CoalescingTransport(httpx.MockTransport(handler))
+        with httpx.Client(transport=transport) as client:
+            client.get(LEAD_URL, headers={"Store-Id": "1"})
+            client.get(LEAD_URL, headers={"Store-Id": "2"})
+
+        assert calls == 2
+
+
+class TestClientCoalescing:
+    @respx.mock
+    def test_concurrent_gets_are_coalesced(self) -> None:
+        route = respx.get(LEAD_URL).mock(side_effect=_slow_response)
+        with (
+            CredereClient(api_key=API_KEY, coalesce_requests=True) as client,
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            leads = list(pool.map(lambda _: client.leads.get("12345678900"), range(4)))
+
+        assert route.call_count == 1
+        assert all(isinstance(lead, Lead) and lead.id == 1 for lead in leads)
+
+    @respx.mock
+    def test_sequential_gets_are_not_cached(self) -> None:
+        route = respx.get(LEAD_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_LEAD)
+        )
+        with CredereClient(api_key=API_KEY, coalesce_requests=True) as client:
+            client.leads.get("12345678900")
+            client.leads.get("12345678900")
+
+        assert route.call_count == 2
+
+
+class TestAsyncClientCoalescing:
+    @respx.mock
+    async def test_concurrent_gets_are_coalesced(self) -> None:
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=SAMPLE_LEAD)
+
+        route = respx.get(LEAD_URL).mock(side_effect=slow)
+        async with AsyncCredereClient(
+            api_key=API_KEY, coalesce_requests=True
+        ) as client:
+            leads = await asyncio.gather(
+                *(client.leads.get("12345678900") for _ in range(10))
+            )
+
+            assert route.call_count == 1
+            assert all(lead.id == 1 for lead in leads)
+            assert client.metrics()["coalescing"]["coalesced"] == 9
+
+    @respx.mock
+    async def test_errors_reach_every_waiter(self) -> None:
+        async def failing(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            raise httpx.ConnectError("refused")
+
+        route = respx.get(LEAD_URL).mock(side_effect=failing)
+        async with AsyncCredereClient(
+            api_key=API_KEY, coalesce_requests=True
+        ) as client:
+            results = await asyncio.gather(
+                *(client.leads.get("12345678900") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        assert route.call_count == 1
+        assert all(isinstance(result, CredereConnectionError) for result in results)
+
+    @respx.mock
+    async def test_cancelled_leader_does_not_cancel_waiters(self) -> None:
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=SAMPLE_LEAD)
+
+        route = respx.get(LEAD_URL).mock(side_effect=slow)
+        async with AsyncCredereClient(
+            api_key=API_KEY, coalesce_requests=True
+        ) as client:
+            leader = asyncio.create_task(client.leads.get("12345678900"))
+            await asyncio.sleep(0.01)
+            waiters = [
+                asyncio.create_task(client.leads.get("12345678900")) for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            leads = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert route.call_count == 1
+        assert all(lead.id == 1 for lead in leads)
+
+    @respx.mock
+    async def test_call_is_cancelled_when_nobody_waits(self) -> None:
+        started, finished = asyncio.Event(), asyncio.Event()
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            started.set()
+            await asyncio.sleep(0.05)
+            finished.set()
+            return httpx.Response(200, json=SAMPLE_LEAD)
+
+        respx.get(LEAD_URL).mock(side_effect=slow)
+        async with AsyncCredereClient(
+            api_key=API_KEY, coalesce_requests=True
+        ) as client:
+            callers = [
+                asyncio.create_task(client.leads.get("12345678900")) for _ in range(2)
+            ]
+            await started.wait()
+            for caller in callers:
+                caller.cancel()
+            await asyncio.sleep(0.1)
+
+            assert not finished.is_set()
+            assert client.metrics()["coalescing"]["in_flight"] == 0
+
+    @respx.mock
+    async def test_posts_are_never_coalesced(self) -> None:
+        route = respx.post(f"{BASE_URL}/v1/banks_api/leads").mock(
+            return_value=httpx.Response(201, json=SAMPLE_LEAD)
+        )
+        async with AsyncCredereClient(
+            api_key=API_KEY, coalesce_requests=True
+        ) as client:
+            await asyncio.gather(
+                *(client.leads.create(LeadCreateRequest(name="x")) for _ in range(3))
+            )
+
+        assert route.call_count == 3
@@ -0,0 +1,124 @@
+"""Tests for the pluggable JSON codecs."""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from credere.client import AsyncCredereClient, CredereClient
+from credere.codec import (
+    JSONCodec,
+    OrjsonCodec,
+    StdlibCodec,
+    resolve_codec,
+    response_codec,
+)
+from credere.exceptions import CredereAPIError
+from credere.models.leads import LeadCreateRequest
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+LEADS_URL = f"{BASE_URL}/v1/banks_api/leads"
+
+
+class RecordingCodec(StdlibCodec):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def dumps(self, value: Any) -> bytes:
+        self.calls.append("dumps")
+        return super().dumps(value)
+
+    def loads(self, data: bytes | str) -> Any:
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+class TestResolveCodec:
+    def test_auto_prefers_orjson(self) -> None:
+        pytest.importorskip("orjson")
+
+        assert isinstance(resolve_codec("auto"), OrjsonCodec)
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("importlib.util.find_spec", lambda _: None)
+
+        assert isinstance(resolve_codec("auto"), StdlibCodec)
+
+    def test_instance_is_used_as_is(self) -> None:
+        codec = RecordingCodec()
+
+        assert resolve_codec(codec) is codec
+
+    def test_backend_must_implement_dumps_and_loads(self) -> None:
+        class DumpsOnly(JSONCodec):
+            def dumps(self, value: Any) -> bytes:
+                return b""
+
+        with pytest.raises(TypeError, match="loads"):
+            DumpsOnly()  # type: ignore[abstract]
+
+    def test_unknown_name_raises(self) -> None:
+        with pytest.raises(ValueError, match="unknown JSON codec"):
+            resolve_codec("simplejson")
+
+    def test_missing_backend_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("importlib.util.find_spec", lambda _: None)
+
+        with pytest.raises(ImportError, match="pip install msgspec"):
+            resolve_codec("msgspec")
+
+
+class TestEncode:
+    def test_envelope_matches_model_dump(self) -> None:
+        data = LeadCreateRequest(cpf_cnpj="12345678900", name="João")
+
+        body = StdlibCodec().encode({"lead": data})
+
+        assert json.loads(body) == {"lead": data.model_dump(exclude_none=True)}
+
+    def test_plain_values_use_dumps(self) -> None:
+        assert StdlibCodec().encode({"a": [1, None]}) == b'{"a":[1,null]}'
+
+    def test_hand_built_response_uses_stdlib(self) -> None:
+        assert isinstance(response_codec(httpx.Response(200)), StdlibCodec)
+
+
+class TestClientCodec:
+    @respx.mock
+    def test_requests_and_responses_go_through_codec(self) -> None:
+        route = respx.post(LEADS_URL).mock(
+            return_value=httpx.Response(
+                201, json={"data": {"cpf_cnpj": "12345678900", "name": "João"}}
+            )
+        )
+        codec = RecordingCodec()
+        with CredereClient(api_key=API_KEY, codec=codec) as client:
+            client.leads.create(
+                LeadCreateRequest(cpf_cnpj="12345678900", name="João"),
+                response_mode="raw",
+            )
+            assert client.metrics()["codec"] == "recording"
+
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "lead": {"cpf_cnpj": "12345678900", "name": "João"}
+        }
+        assert codec.calls == ["dumps", "loads"]
+
+    @respx.mock
+    async def test_async_error_body_decoded_with_codec(self) -> None:
+        respx.get(LEADS_URL).mock(
+            return_value=httpx.Response(500, json={"message": "boom"})
+        )
+        codec = RecordingCodec()
+        async with AsyncCredereClient(api_key=API_KEY, codec=codec) as client:
+            with pytest.raises(CredereAPIError, match="boom"):
+                await client.leads.list()
+
+        assert codec.calls == ["loads"]
@@ -1,5 +1,6 @@
 """Tests for the Customers resource (sync + async)."""
 
+import asyncio
 import json
 
 import httpx
@@ -75,6 +76,22 @@ SAMPLE_CREATE_DATA = CustomerCreateRequest(
 # ---------------------------------------------------------------------------
 
 
+def _pages(count: int, per_page: int = 2):
+    """Serve *count* full pages of customers followed by an empty page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page > count:
+            return httpx.Response(200, json={"customers": []})
+        customers = [
+            {**SAMPLE_CUSTOMER_RESPONSE["customer"], "id": (page - 1) * per_page + i}
+            for i in range(1, per_page + 1)
+        ]
+        return httpx.Response(200, json={"customers": customers})
+
+    return handler
+
+
 class TestCustomersCreate:
     @respx.mock
     def test_create_customer(self, sync_client: CredereClient) -> None:
@@ -198,6 +215,46 @@ class TestCustomersList:
         assert len(customers) == 0
 
 
+class TestCustomersIterAll:
+    @respx.mock
+    def test_iterates_until_empty_page(self, sync_client: CredereClient) -> None:
+        route = respx.get(CUSTOMERS_URL).mock(side_effect=_pages(3))
+
+        customers = list(sync_client.customers.iter_all(per_page=2, name="Maria"))
+
+        assert [c.id for c in customers] == [1, 2, 3, 4, 5, 6]
+        assert route.call_count == 4
+        params = route.calls[0].request.url.params
+        assert (params["per_page"], params["name"]) == ("2", "Maria")
+
+    @respx.mock
+    def test_prefetch_yields_the_same_customers(
+        self, sync_client: CredereClient
+    ) -> None:
+        respx.get(CUSTOMERS_URL).mock(side_effect=_pages(3))
+
+        customers = sync_client.customers.iter_all(per_page=2, prefetch=True)
+
+        assert [c.id for c in customers] == [1, 2, 3, 4, 5, 6]
+
+    @respx.mock
+    def test_fetches_lazily(self, sync_client: CredereClient) -> None:
+        route = respx.get(CUSTOMERS_URL).mock(side_effect=_pages(3))
+
+        customers = sync_client.customers.iter_all(per_page=2, start_page=2)
+        first = next(customers)
+
+        assert first.id == 3
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_errors_propagate(self, sync_client: CredereClient) -> None:
+        respx.get(CUSTOMERS_URL).mock(return_value=httpx.Response(401))
+
+        with pytest.raises(AuthenticationError):
+            list(sync_client.customers.iter_all(prefetch=True))
+
+
 class TestCustomersGet:
     @respx.mock
     def test_get_customer(self, sync_client: CredereClient) -> None:
@@ -379,6 +436,68 @@ class TestAsyncCustomersList:
         assert len(customers) == 0
 
 
+class TestAsyncCustomersIterAll:
+    @respx.mock
+    async def test_iterates_until_empty_page(
+        self, async_client: AsyncCredereClient
+    ) -> None:
+        route = respx.get(CUSTOMERS_URL).mock(side_effect=_pages(2))
+
+        customers = [c async for c in async_client.customers.iter_all(per_page=2)]
+
+        assert [c.id for c in customers] == [1, 2, 3, 4]
+        assert route.call_count == 3
+
+    async def test_concurrent_pages_keep_order_and_stop_at_short_page(
+        self,
+    ) -> None:
+        in_flight = peak = 0
+        requested: list[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            page = int(request.url.params["page"])
+            requested.append(page)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later pages answer first.
+            await asyncio.sleep(0.05 / page)
+            in_flight -= 1
+            size = 3 if page < 5 else 1 if page == 5 else 0
+            customers = [
+                {**SAMPLE_CUSTOMER_RESPONSE["customer"], "id": page * 10 + i}
+                for i in range(size)
+            ]
+            return httpx.Response(200, json={"customers": customers})
+
+        async with AsyncCredereClient(
+            api_key="sk-test-key", transport=httpx.MockTransport(handler)
+        ) as client:
+            customers = [c.id async for c in client.customers.iter_all(concurrency=3)]
+
+        assert customers == [10, 11, 12, 20, 21, 22, 30, 31, 32, 40, 41, 42, 50]
+        assert peak == 3
+        assert max(requested) <= 7
+
+    async def test_rejects_invalid_concurrency(
+        self, async_client: AsyncCredereClient
+    ) -> None:
+        with pytest.raises(ValueError):
+            await anext(async_client.customers.iter_all(concurrency=0))
+
+    @respx.mock
+    async def test_prefetch_stops_cleanly_when_abandoned(
+        self, async_client: AsyncCredereClient
+    ) -> None:
+        respx.get(CUSTOMERS_URL).mock(side_effect=_pages(5))
+
+        customers = async_client.customers.iter_all(per_page=2, prefetch=True)
+        first = [await anext(customers), await anext(customers)]
+        await customers.aclose()
+
+        assert [c.id for c in first] == [1, 2]
+
+
 class TestAsyncCustomersGet:
     @respx.mock
     async def test_async_get_customer(self, async_client: AsyncCredereClient) -> None:
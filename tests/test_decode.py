@@ -0,0 +1,99 @@
+"""Tests for the shared response decoder."""
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from credere._decode import Decoder, LazyModel
+from credere.models.vehicle_models import VehiclePrice
+
+PRICES = Decoder(list[VehiclePrice], "vehicle_prices")
+
+
+class TestDecoder:
+    def test_decodes_list_under_key(self) -> None:
+        response = httpx.Response(
+            200,
+            json={"vehicle_prices": [{"id": 1}, {"id": 2}], "meta": {"total": 2}},
+        )
+
+        prices = PRICES(response)
+
+        assert [p.id for p in prices] == [1, 2]
+        assert all(isinstance(p, VehiclePrice) for p in prices)
+
+    def test_decodes_bare_body(self) -> None:
+        decoder = Decoder(VehiclePrice)
+
+        price = decoder(httpx.Response(200, json={"id": 3, "extra": "kept"}))
+
+        assert price.id == 3
+        assert price.model_extra == {"extra": "kept"}
+
+    def test_missing_key_raises_validation_error(self) -> None:
+        with pytest.raises(ValidationError):
+            PRICES(httpx.Response(200, json={"data": []}))
+
+    def test_invalid_item_raises_validation_error(self) -> None:
+        response = httpx.Response(200, json={"vehicle_prices": [{"id": "x"}]})
+
+        with pytest.raises(ValidationError):
+            PRICES(response)
+
+    def test_raw_mode_returns_plain_json(self) -> None:
+        response = httpx.Response(200, json={"vehicle_prices": [{"id": "x"}]})
+
+        assert PRICES(response, "raw") == [{"id": "x"}]
+
+    def test_unknown_mode_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="response_mode"):
+            PRICES(httpx.Response(200, json={"vehicle_prices": []}), "fast")  # type: ignore[arg-type]
+
+
+class TestLazyModel:
+    def test_validates_fields_on_access(self) -> None:
+        response = httpx.Response(
+            200,
+            json={
+                "vehicle_prices": [
+                    {
+                        "id": 1,
+                        "vehicle_model": {"name": "Civic", "vehicle_brand": "bad"},
+                        "note": "extra",
+                    }
+                ]
+            },
+        )
+
+        (price,) = PRICES(response, "lazy")
+
+        assert isinstance(price, LazyModel)
+        assert price.id == 1
+        assert price.active is None
+        assert price.note == "extra"
+        assert price.vehicle_model.name == "Civic"
+        with pytest.raises(ValidationError):
+            price.vehicle_model.vehicle_brand  # noqa: B018
+
+    def test_invalid_field_raises_on_access(self) -> None:
+        (price,) = PRICES(
+            httpx.Response(200, json={"vehicle_prices": [{"id": "x"}]}), "lazy"
+        )
+
+        with pytest.raises(ValidationError):
+            price.id  # noqa: B018
+
+    def test_unknown_attribute_raises_attribute_error(self) -> None:
+        price = LazyModel(VehiclePrice, {"id": 1})
+
+        with pytest.raises(AttributeError):
+            price.missing  # noqa: B018
+
+    def test_model_validates_whole_object(self) -> None:
+        price = LazyModel(VehiclePrice, {"id": 1, "vehicle_model": {"name": "Civic"}})
+
+        model = price.model()
+
+        assert isinstance(model, VehiclePrice)
+        assert model.vehicle_model is not None
+        assert model.vehicle_model.name == "Civic"
@@ -0,0 +1,149 @@
+"""Tests for the shared request executor."""
+
+import json
+
+import httpx
+import pytest
+
+from credere._decode import Decoder
+from credere._executor import AsyncExecutor, Endpoint, Executor
+from credere.exceptions import CredereConnectionError, NotFoundError
+from credere.models.leads import Lead
+
+BASE_URL = "https://api.example.test"
+LEAD = Decoder(Lead, "data")
+GET = Endpoint("GET", "/v1/leads/{}/{}", LEAD)
+CREATE = Endpoint("POST", "/v1/leads", LEAD, body_key="lead")
+DELETE: Endpoint[None] = Endpoint("DELETE", "/v1/leads/{}")
+CURRENT = Endpoint("GET", "/v1/me", LEAD, store_header=False)
+LIST = Endpoint("GET", "/v1/leads", Decoder(list[Lead], "data"))
+
+
+class Recorder:
+    def __init__(self, body: object = None, status: int = 200) -> None:
+        self.requests: list[httpx.Request] = []
+        self.body = {"data": {"id": 1}} if body is None else body
+        self.status = status
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(self.status, json=self.body)
+
+
+def _client(handler: Recorder) -> httpx.Client:
+    return httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+
+
+class TestExecutor:
+    def test_fills_path_and_sends_default_store_header(self) -> None:
+        recorder = Recorder()
+        call = Executor(_client(recorder), store_id=42)
+
+        lead = call(GET, "abc", 7)
+
+        assert isinstance(lead, Lead)
+        request = recorder.requests[0]
+        assert request.url.path == "/v1/leads/abc/7"
+        assert request.headers["Store-Id"] == "42"
+
+    def test_per_call_store_overrides_default(self) -> None:
+        recorder = Recorder()
+        call = Executor(_client(recorder), store_id=42)
+
+        call(GET, "abc", 7, store_id=99)
+
+        assert recorder.requests[0].headers["Store-Id"] == "99"
+
+    def test_no_store_header_without_store(self) -> None:
+        recorder = Recorder()
+
+        Executor(_client(recorder))(GET, "abc", 7)
+
+        assert "Store-Id" not in recorder.requests[0].headers
+
+    def test_endpoint_without_store_header(self) -> None:
+        recorder = Recorder()
+
+        Executor(_client(recorder), store_id=42)(CURRENT, store_id=1)
+
+        assert "Store-Id" not in recorder.requests[0].headers
+
+    def test_wraps_body_in_envelope(self) -> None:
+        recorder = Recorder()
+
+        Executor(_client(recorder))(CREATE, body={"name": "Maria"})
+
+        request = recorder.requests[0]
+        assert request.method == "POST"
+        assert json.loads(request.content) == {"lead": {"name": "Maria"}}
+
+    def test_sends_params_only_when_given(self) -> None:
+        recorder = Recorder({"data": []})
+        call = Executor(_client(recorder))
+
+        call(LIST, params={})
+        call(LIST, params={"page": 2})
+
+        assert recorder.requests[0].url.query == b""
+        assert recorder.requests[1].url.params["page"] == "2"
+
+    def test_endpoint_without_decoder_returns_none(self) -> None:
+        recorder = Recorder()
+
+        assert Executor(_client(recorder))(DELETE, "abc") is None
+        assert recorder.requests[0].method == "DELETE"
+
+    def test_response_mode_defaults_to_executor_mode(self) -> None:
+        recorder = Recorder()
+        call = Executor(_client(recorder), response_mode="raw")
+
+        assert call(GET, "a", 1) == {"id": 1}
+        assert isinstance(call(GET, "a", 1, response_mode="model"), Lead)
+
+    def test_maps_error_status(self) -> None:
+        recorder = Recorder({"error": "not found"}, status=404)
+
+        with pytest.raises(NotFoundError):
+            Executor(_client(recorder))(GET, "a", 1)
+
+    def test_maps_transport_error(self) -> None:
+        def fail(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        client = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(fail))
+
+        with pytest.raises(CredereConnectionError):
+            Executor(client)(GET, "a", 1)
+
+    def test_stream_yields_items(self) -> None:
+        recorder = Recorder({"data": [{"id": 1}, {"id": 2}]})
+
+        leads = list(Executor(_client(recorder), store_id=3).stream(LIST))
+
+        assert [lead.id for lead in leads] == [1, 2]
+        assert recorder.requests[0].headers["Store-Id"] == "3"
+
+
+class TestAsyncExecutor:
+    async def test_sends_request_and_decodes(self) -> None:
+        recorder = Recorder()
+        client = httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(recorder)
+        )
+
+        lead = await AsyncExecutor(client, store_id=42)(CREATE, body={"name": "M"})
+
+        assert isinstance(lead, Lead)
+        request = recorder.requests[0]
+        assert request.headers["Store-Id"] == "42"
+        assert json.loads(request.content) == {"lead": {"name": "M"}}
+
+    async def test_stream_yields_items(self) -> None:
+        recorder = Recorder({"data": [{"id": 1}, {"id": 2}]})
+        client = httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(recorder)
+        )
+
+        leads = [lead async for lead in AsyncExecutor(client).stream(LIST)]
+
+        assert [lead.id for lead in leads] == [1, 2]
@@ -0,0 +1,124 @@
+"""Tests for the shared-transport client factories."""
+
+import httpx
+import respx
+
+from credere.cache import TTLCache
+from credere.factory import AsyncCredereClientFactory, CredereClientFactory
+from credere.models.users import User
+
+BASE_URL = "https://api.credere.com"
+
+SAMPLE_USER = {"user": {"id": 1, "name": "Vendedor"}}
+
+
+class TestCredereClientFactory:
+    def test_clients_share_one_transport(self) -> None:
+        with CredereClientFactory() as factory:
+            first = factory.client("key-a", store_id=1)
+            second = factory.client("key-b", store_id=2)
+
+            assert first is not second
+            assert first._transport.wrapped is second._transport.wrapped
+            assert factory.metrics()["clients"] == 2
+
+    def test_client_is_cached_per_key_and_store(self) -> None:
+        with CredereClientFactory() as factory:
+            assert factory.client("key-a", store_id=1) is factory.client(
+                "key-a", store_id=1
+            )
+            assert factory.client("key-a", store_id=1) is not factory.client(
+                "key-a", store_id=2
+            )
+            assert len(factory) == 2
+
+    @respx.mock
+    def test_each_client_sends_its_own_key_and_store(self) -> None:
+        route = respx.get(f"{BASE_URL}/v1/users/proposals_filter_list").mock(
+            return_value=httpx.Response(200, json={"users": []})
+        )
+        with CredereClientFactory() as factory:
+            factory.client("key-a", store_id=1).users.proposals_filter_list()
+            factory.client("key-b", store_id=2).users.proposals_filter_list()
+
+        first, second = (call.request for call in route.calls)
+        assert first.headers["Authorization"] == "Bearer key-a"
+        assert first.headers["Store-Id"] == "1"
+        assert second.headers["Authorization"] == "Bearer key-b"
+        assert second.headers["Store-Id"] == "2"
+
+    @respx.mock
+    def test_clients_share_the_reference_and_simulation_caches(self) -> None:
+        route = respx.get(f"{BASE_URL}/v1/banks").mock(
+            return_value=httpx.Response(200, json={"banks": []})
+        )
+        references, simulations = TTLCache(), TTLCache()
+        with CredereClientFactory(
+            reference_cache=references, simulation_cache=simulations
+        ) as factory:
+            factory.client("key-a").utilities.banks()
+            client = factory.client("key-b")
+            client.utilities.banks()
+
+            assert route.call_count == 1
+            assert client.metrics()["reference_cache"]["hits"] == 1
+            assert "simulation_cache" in client.metrics()
+
+    @respx.mock
+    def test_closing_a_client_keeps_the_pool_open(self) -> None:
+        respx.get(f"{BASE_URL}/v1/users/current").mock(
+            return_value=httpx.Response(200, json=SAMPLE_USER)
+        )
+        with CredereClientFactory() as factory:
+            factory.client("key-a").close()
+
+            user = factory.client("key-b").users.current()
+
+            assert isinstance(user, User)
+            reopened = factory.client("key-a")
+            assert reopened._http.is_closed is False
+
+    def test_close_closes_every_client(self) -> None:
+        factory = CredereClientFactory()
+        client = factory.client("key-a", store_id=1)
+
+        factory.close()
+
+        assert client._http.is_closed is True
+        assert len(factory) == 0
+
+
+class TestAsyncCredereClientFactory:
+    @respx.mock
+    async def test_each_client_sends_its_own_key_and_store(self) -> None:
+        route = respx.get(f"{BASE_URL}/v1/users/proposals_filter_list").mock(
+            return_value=httpx.Response(200, json={"users": []})
+        )
+        async with AsyncCredereClientFactory() as factory:
+            first = factory.client("key-a", store_id=1)
+            second = factory.client("key-b", store_id=2)
+            await first.users.proposals_filter_list()
+            await second.users.proposals_filter_list()
+
+            assert first._transport.wrapped is second._transport.wrapped
+
+        assert route.calls[0].request.headers["Store-Id"] == "1"
+        assert route.calls[1].request.headers["Authorization"] == "Bearer key-b"
+
+    async def test_clients_get_the_reference_and_simulation_caches(self) -> None:
+        references, simulations = TTLCache(), TTLCache()
+        async with AsyncCredereClientFactory(
+            reference_cache=references, simulation_cache=simulations
+        ) as factory:
+            metrics = factory.client("key-a").metrics()
+
+        assert "reference_cache" in metrics
+        assert "simulation_cache" in metrics
+
+    async def test_close_closes_every_client(self) -> None:
+        factory = AsyncCredereClientFactory()
+        client = factory.client("key-a")
+
+        await factory.close()
+
+        assert client._http.is_closed is True
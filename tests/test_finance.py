@@ -0,0 +1,140 @@
+"""Tests for the offline financing calculator."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from credere import finance
+from credere.models.simulations import (
+    Simulation,
+    SimulationCondition,
+    SimulationConditionRequest,
+)
+
+RATES = finance.RateTable({24: (1.2, 1.4), 48: (1.49, 1.62)})
+
+
+@pytest.fixture(params=["python", "numpy"], autouse=True)
+def backend(request: pytest.FixtureRequest) -> Iterator[None]:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield
+    else:
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(finance, "_numpy", lambda: None)
+            yield
+
+
+def _condition(financed_amount: int, installments: int) -> SimulationConditionRequest:
+    return SimulationConditionRequest(
+        down_payment=5000000 - financed_amount,
+        financed_amount=financed_amount,
+        installments=installments,
+    )
+
+
+class TestPriceInstallment:
+    def test_french_amortization(self) -> None:
+        values = finance.price_installment([4000000, 1200], [48, 12], [1.49, 0])
+
+        assert list(values) == pytest.approx([117249.33, 100.0])
+
+
+class TestEstimate:
+    def test_reproduces_the_seeded_rates(self) -> None:
+        result = finance.estimate([4000000], [48], RATES)
+
+        assert list(result.interest_monthly) == [1.49]
+        assert list(result.cet_monthly) == pytest.approx([1.62])
+        # Financed fees raise the installment above the bare Price table.
+        assert result.installment_value[0] > 117249.33
+        assert result.amount_paid_in_financing[0] == pytest.approx(
+            result.installment_value[0] * 48
+        )
+
+    def test_cet_equals_interest_without_fees(self) -> None:
+        rates = finance.RateTable({36: (1.3, 1.3)})
+
+        result = finance.estimate([3000000, 1000000], [36, 60], rates)
+
+        assert list(result.cet_monthly) == pytest.approx([1.3, 1.3])
+
+    def test_fees_weigh_more_over_fewer_installments(self) -> None:
+        rates = finance.RateTable({48: (1.49, 1.62)})
+
+        result = finance.estimate([4000000, 4000000], [12, 48], rates)
+
+        short, long = result.cet_monthly
+        assert short > long > 1.49
+
+    def test_uses_nearest_installments_count(self) -> None:
+        result = finance.estimate([1000000, 1000000], [18, 60], RATES)
+
+        assert list(result.interest_monthly) == [1.2, 1.49]
+
+    def test_empty_input(self) -> None:
+        result = finance.estimate([], [], RATES)
+
+        assert len(result.installment_value) == 0
+
+
+class TestScreen:
+    def test_keeps_conditions_within_every_limit(self) -> None:
+        conditions = [
+            _condition(4000000, 48),
+            _condition(4000000, 24),
+            _condition(2000000, 24),
+        ]
+
+        kept = finance.screen(conditions, RATES, max_installment=150000)
+
+        assert kept == [conditions[0], conditions[2]]
+        assert finance.screen(
+            conditions, RATES, max_installment=150000, max_amount_paid=3000000
+        ) == [conditions[2]]
+
+    def test_without_limits_keeps_everything(self) -> None:
+        conditions = [_condition(4000000, 48)]
+
+        assert finance.screen(conditions, RATES) == conditions
+
+
+class TestRateTable:
+    def test_from_simulations_keeps_best_successful_rate(self) -> None:
+        simulations = [
+            Simulation(
+                conditions=[
+                    SimulationCondition(
+                        installments=48,
+                        success=True,
+                        interest_monthly=1.6,
+                        cet_monthly=1.8,
+                    ),
+                    SimulationCondition(
+                        installments=48, success=False, interest_monthly=0.5
+                    ),
+                ]
+            ),
+            Simulation(
+                conditions=[
+                    SimulationCondition(
+                        installments=48,
+                        success=True,
+                        interest_monthly=1.49,
+                        cet_monthly=1.62,
+                    ),
+                    SimulationCondition(
+                        installments=24, success=True, interest_monthly=1.2
+                    ),
+                ]
+            ),
+        ]
+
+        table = finance.RateTable.from_simulations(simulations)
+
+        assert table[48] == (1.49, 1.62)
+        assert table[24] == (1.2, 1.2)
+
+    def test_requires_an_entry(self) -> None:
+        with pytest.raises(ValueError, match="at least one entry"):
+            finance.RateTable.from_simulations([Simulation(conditions=[])])
@@ -0,0 +1,220 @@
+"""Tests for conditional GET requests and the HTTP response cache."""
+
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from credere.cache import DiskCache
+from credere.client import AsyncCredereClient, CredereClient
+from credere.http_cache import CachedResponse, HTTPCache
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+BANKS_URL = f"{BASE_URL}/v1/banks"
+
+SAMPLE_BANK = {"id": 1, "febraban_code": "001", "name": "Banco do Brasil"}
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 21 Oct 2026 07:28:00 GMT"
+
+
+def _conditional(request: httpx.Request) -> httpx.Response:
+    if request.headers.get("If-None-Match") == ETAG:
+        return httpx.Response(304, headers={"ETag": ETAG})
+    return httpx.Response(200, json={"banks": [SAMPLE_BANK]}, headers={"ETag": ETAG})
+
+
+class TestHTTPCache:
+    @respx.mock
+    def test_revalidates_and_serves_304_from_cache(self) -> None:
+        route = respx.get(BANKS_URL).mock(side_effect=_conditional)
+        cache = HTTPCache()
+        with CredereClient(api_key=API_KEY, http_cache=cache) as client:
+            first = client.utilities.banks()
+            second = client.utilities.banks()
+
+            assert route.call_count == 2
+            assert "If-None-Match" not in route.calls[0].request.headers
+            assert route.calls[1].request.headers["If-None-Match"] == ETAG
+            assert first == second
+            stats = client.metrics()["http_cache"]
+            assert (stats["stored"], stats["revalidated"], stats["misses"]) == (1, 1, 1)
+
+    @respx.mock
+    def test_not_modified_returns_independent_models(self) -> None:
+        respx.get(BANKS_URL).mock(side_effect=_conditional)
+        with CredereClient(api_key=API_KEY, http_cache=HTTPCache()) as client:
+            client.utilities.banks()
+            second = client.utilities.banks()
+            second[0].name = "changed"
+            third = client.utilities.banks()
+
+        assert second[0] is not third[0]
+        assert third[0].name == "Banco do Brasil"
+
+    @respx.mock
+    def test_sends_if_modified_since(self) -> None:
+        route = respx.get(BANKS_URL).mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={"banks": [SAMPLE_BANK]},
+                    headers={"Last-Modified": LAST_MODIFIED},
+                ),
+                httpx.Response(304),
+            ]
+        )
+        with CredereClient(api_key=API_KEY, http_cache=HTTPCache()) as client:
+            client.utilities.banks()
+            result = client.utilities.banks()
+
+        assert route.calls[1].request.headers["If-Modified-Since"] == LAST_MODIFIED
+        assert result[0].name == "Banco do Brasil"
+
+    @respx.mock
+    def test_changed_resource_replaces_entry(self) -> None:
+        respx.get(BANKS_URL).mock(
+            side_effect=[
+                httpx.Response(
+                    200, json={"banks": [SAMPLE_BANK]}, headers={"ETag": ETAG}
+                ),
+                httpx.Response(
+                    200,
+                    json={"banks": [{**SAMPLE_BANK, "id": 2}]},
+                    headers={"ETag": '"v2"'},
+                ),
+                httpx.Response(304),
+            ]
+        )
+        with CredereClient(api_key=API_KEY, http_cache=HTTPCache()) as client:
+            client.utilities.banks()
+            client.utilities.banks()
+            result = client.utilities.banks()
+
+        assert result[0].id == 2
+
+    @respx.mock
+    def test_responses_without_validators_are_not_stored(self) -> None:
+        route = respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json={"banks": [SAMPLE_BANK]})
+        )
+        cache = HTTPCache()
+        with CredereClient(api_key=API_KEY, http_cache=cache) as client:
+            client.utilities.banks()
+            client.utilities.banks()
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+        assert cache.stats()["size"] == 0
+
+    @respx.mock
+    def test_entries_are_keyed_by_store(self) -> None:
+        route = respx.get(BANKS_URL).mock(side_effect=_conditional)
+        with CredereClient(api_key=API_KEY, http_cache=HTTPCache()) as client:
+            client.utilities.banks(store_id=1)
+            client.utilities.banks(store_id=2)
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @respx.mock
+    def test_disk_entries_survive_a_new_cache(self, tmp_path: Path) -> None:
+        route = respx.get(BANKS_URL).mock(side_effect=_conditional)
+        with CredereClient(
+            api_key=API_KEY, http_cache=HTTPCache(directory=tmp_path)
+        ) as client:
+            client.utilities.banks()
+
+        cache = HTTPCache(directory=tmp_path)
+        with CredereClient(api_key=API_KEY, http_cache=cache) as client:
+            result = client.utilities.banks()
+
+        assert route.calls[1].request.headers["If-None-Match"] == ETAG
+        assert result[0].id == 1
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_cached_response_round_trips_through_bytes(self) -> None:
+        entry = CachedResponse(
+            200, [(b"content-type", b"application/json")], b'{"a": 1}', ETAG, None
+        )
+
+        assert CachedResponse.from_bytes(entry.to_bytes()) == entry
+
+
+class TestDiskCache:
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path, max_entries=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        # Give the entries distinct, old modification times.
+        for name, mtime in (("a", 1), ("b", 2)):
+            os.utime(cache._path(name), (mtime, mtime))
+        cache.get("a")
+        cache.set("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert len(cache) == 2
+
+    def test_scans_the_directory_only_to_evict(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        DiskCache(tmp_path).set("old", b"0")
+        cache = DiskCache(tmp_path, max_entries=20)
+        os.utime(cache._path("old"), (1, 1))
+        scans = []
+        entries = cache._entries
+
+        def scan() -> list[Path]:
+            scans.append(1)
+            return entries()
+
+        monkeypatch.setattr(cache, "_entries", scan)
+        for i in range(19):
+            cache.set(str(i), b"1")
+        cache.set("0", b"2")
+        assert not scans
+
+        cache.set("19", b"1")
+
+        assert len(scans) == 1
+        # Evicted down to 90% of max_entries, least recently used first.
+        assert len(cache) == 18
+        assert cache.get("old") is None
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.invalidate()
+        assert len(cache) == 0
+
+
+class TestAsyncHTTPCache:
+    @respx.mock
+    async def test_revalidates_and_serves_304_from_cache(self) -> None:
+        route = respx.get(BANKS_URL).mock(side_effect=_conditional)
+        async with AsyncCredereClient(
+            api_key=API_KEY, http_cache=HTTPCache()
+        ) as client:
+            await client.utilities.banks()
+            result = await client.utilities.banks()
+
+        assert route.calls[1].request.headers["If-None-Match"] == ETAG
+        assert result[0].name == "Banco do Brasil"
+
+    @respx.mock
+    async def test_post_requests_bypass_the_cache(self) -> None:
+        route = respx.post(f"{BASE_URL}/v1/leads").mock(
+            return_value=httpx.Response(
+                201, json={"lead": {"id": 1}}, headers={"ETag": ETAG}
+            )
+        )
+        cache = HTTPCache()
+        async with AsyncCredereClient(api_key=API_KEY, http_cache=cache) as client:
+            await client._http.post("/v1/leads", json={})
+
+        assert route.call_count == 1
+        assert cache.stats()["stored"] == 0
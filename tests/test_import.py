@@ -0,0 +1,151 @@
+"""Import-time checks, measured with ``python -X importtime``."""
+
+import subprocess
+import sys
+
+import pytest
+
+import credere
+import credere.models
+
+# Transport wrappers, loaded only when a client is configured to use them.
+WRAPPERS = {
+    "credere.circuit_breaker",
+    "credere.coalesce",
+    "credere.http_cache",
+    "credere.rate_limit",
+    "credere.retry",
+    "credere.sqlite_cache",
+}
+
+
+def _run(code: str) -> tuple[set[str], dict[str, int]]:
+    """Run *code* in a fresh interpreter.
+
+    Returns the modules loaded at exit and, from ``-X importtime``, the
+    cumulative import time in microseconds of each module imported with an
+    ``import`` statement.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{code}\nimport sys; print(*sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return set(result.stdout.split()), times
+
+
+def _loaded(code: str, prefix: str) -> set[str]:
+    return {name for name in _run(code)[0] if name.startswith(prefix)}
+
+
+class TestImportTime:
+    def test_import_loads_no_submodules(self) -> None:
+        modules, times = _run("import credere")
+
+        assert {m for m in modules if m.startswith("credere.")} == {"credere._lazy"}
+        assert "pydantic" not in modules
+        assert "httpx" not in modules
+        # Eagerly importing everything took a few hundred milliseconds.
+        assert times["credere"] < 50_000
+
+    def test_client_builds_no_resources(self) -> None:
+        code = "import credere; credere.CredereClient('key')"
+
+        assert not _loaded(code, "credere.resources")
+        assert not _loaded(code, "credere.models")
+
+    def test_client_loads_only_configured_wrappers(self) -> None:
+        plain = _run("import credere; credere.CredereClient('key')")[0]
+        retrying = _run(
+            "import credere\n"
+            "from credere.retry import RetryPolicy\n"
+            "credere.CredereClient('key', retry=RetryPolicy())"
+        )[0]
+
+        assert not WRAPPERS & plain
+        assert "sqlite3" not in plain
+        assert WRAPPERS & retrying == {"credere.retry"}
+
+    def test_factory_loads_no_wrappers(self) -> None:
+        modules = _run("import credere; credere.CredereClientFactory().client('key')")[
+            0
+        ]
+
+        assert "sqlite3" not in modules
+        assert not WRAPPERS & modules
+
+    def test_resource_loads_only_its_models(self) -> None:
+        code = "import credere; credere.CredereClient('key').simulations"
+
+        assert _loaded(code, "credere.models.") == {"credere.models.simulations"}
+        assert _loaded(code, "credere.resources.") == {"credere.resources.simulations"}
+
+    def test_validators_are_built_on_first_use(self) -> None:
+        code = (
+            "from credere.resources.vehicle_models import _PRICES\n"
+            "from credere.models.vehicle_models import VehiclePrice\n"
+            "state = lambda: (VehiclePrice.__pydantic_complete__,"
+            " '_adapter' in vars(_PRICES.decoder))\n"
+            "print(*state())\n"
+            "_PRICES.decoder.decode(b'{\"vehicle_prices\": []}')\n"
+            "VehiclePrice.model_validate({})\n"
+            "print(*state())\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.split() == ["False", "False", "True", "True"]
+
+    def test_only_response_models_defer_their_build(self) -> None:
+        # Request models are built on import: they are validated on the
+        # caller's first call, where a deferred build would only add latency.
+        code = (
+            "import credere.models as m\n"
+            "for name in m.__all__:\n"
+            "    model = getattr(m, name)\n"
+            "    print(name, model.__pydantic_complete__)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        built = dict(line.split() for line in result.stdout.splitlines())
+
+        assert built["LeadCreateRequest"] == "True"
+        assert built["Lead"] == "False"
+        for name, complete in built.items():
+            assert complete == str(name.endswith("Request")), name
+
+
+class TestLazyExports:
+    @pytest.mark.parametrize("package", [credere, credere.models])
+    def test_every_export_resolves(self, package: object) -> None:
+        for name in package.__all__:  # type: ignore[attr-defined]
+            assert getattr(package, name) is not None
+
+    def test_dir_lists_exports(self) -> None:
+        assert set(credere.__all__) <= set(dir(credere))
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            credere.Missing  # noqa: B018
+
+    def test_resource_is_built_once(self) -> None:
+        client = credere.CredereClient("key")
+
+        assert client.leads is client.leads
+        assert "leads" in vars(client)
+        assert "stock" not in vars(client)
@@ -1,5 +1,7 @@
 """Tests for the Leads resource (sync + async)."""
 
+import json
+
 import httpx
 import pytest
 import respx
@@ -7,6 +9,7 @@ import respx
 from credere.client import AsyncCredereClient, CredereClient
 from credere.exceptions import AuthenticationError, CredereAPIError, NotFoundError
 from credere.models.leads import Lead, LeadCreateRequest, LeadRequiredFields
+from credere.resources.leads import Leads
 
 BASE_URL = "https://api.credere.com"
 LEADS_URL = f"{BASE_URL}/v1/banks_api/leads"
@@ -129,6 +132,60 @@ class TestLeadsCreate:
         assert "lead" in body
         assert body["lead"]["cpf_cnpj"] == "12345678900"
 
+    @respx.mock
+    def test_create_with_plain_httpx_client(self) -> None:
+        route = respx.post(LEADS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_LEAD_RESPONSE)
+        )
+
+        with httpx.Client(base_url=BASE_URL) as client:
+            lead = Leads(client, store_id=42).create(SAMPLE_CREATE_DATA)
+
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["Store-Id"] == "42"
+        assert json.loads(request.content)["lead"]["cpf_cnpj"] == "12345678900"
+        assert lead.id == 1
+
+
+class TestLeadsCreateMany:
+    @respx.mock
+    def test_reports_each_item_without_stopping(
+        self, sync_client: CredereClient
+    ) -> None:
+        def respond(request: httpx.Request) -> httpx.Response:
+            cpf = json.loads(request.content)["lead"]["cpf_cnpj"]
+            if cpf == "2":
+                return httpx.Response(422, json={"error": "invalid"})
+            return httpx.Response(200, json=SAMPLE_LEAD_RESPONSE)
+
+        route = respx.post(LEADS_URL).mock(side_effect=respond)
+        items = (
+            SAMPLE_CREATE_DATA.model_copy(update={"cpf_cnpj": str(i)}) for i in range(5)
+        )
+
+        run = sync_client.leads.create_many(items, concurrency=2)
+        results = run.collect()
+
+        assert route.call_count == 5
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+        assert [r.ok for r in results] == [True, True, False, True, True]
+        assert isinstance(results[0].value, Lead)
+        assert isinstance(results[2].error, CredereAPIError)
+        assert results[2].item.cpf_cnpj == "2"
+        stats = run.stats()
+        assert (stats.submitted, stats.succeeded, stats.failed) == (5, 4, 1)
+
+    @respx.mock
+    def test_sends_store_id_override(self, sync_client: CredereClient) -> None:
+        route = respx.post(LEADS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_LEAD_RESPONSE)
+        )
+
+        list(sync_client.leads.create_many([SAMPLE_CREATE_DATA], store_id=7))
+
+        assert route.calls.last.request.headers["Store-Id"] == "7"
+
 
 class TestLeadsUpdate:
     @respx.mock
@@ -339,6 +396,27 @@ class TestAsyncLeadsCreate:
         assert lead.cpf_cnpj == "12345678900"
 
 
+class TestAsyncLeadsCreateMany:
+    @respx.mock
+    async def test_async_reports_each_item(
+        self, async_client: AsyncCredereClient
+    ) -> None:
+        respx.post(LEADS_URL).mock(
+            side_effect=[
+                httpx.Response(200, json=SAMPLE_LEAD_RESPONSE),
+                httpx.Response(401, json={"error": "unauthorized"}),
+                httpx.Response(200, json=SAMPLE_LEAD_RESPONSE),
+            ]
+        )
+
+        run = async_client.leads.create_many([SAMPLE_CREATE_DATA] * 3, concurrency=1)
+        results = await run.collect()
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, AuthenticationError)
+        assert run.stats().completed == 3
+
+
 class TestAsyncLeadsList:
     @respx.mock
     async def test_async_list_leads(self, async_client: AsyncCredereClient) -> None:
@@ -0,0 +1,109 @@
+"""Tests for the columnar vehicle price table."""
+
+from typing import Any
+
+import pytest
+
+from credere.price_table import PRICE_COLUMNS, PriceTable
+
+ROWS: list[dict[str, Any]] = [
+    {
+        "id": 1,
+        "store_id": 42,
+        "min_price_cents": 5000000,
+        "default_price_cents": 6000000,
+        "active": True,
+        "vehicle_model": {"id": 7, "molicar_code": "001234-5", "brand": "Honda"},
+        "store": {"id": 42, "name": "Loja Centro", "uf": "SP"},
+    },
+    {
+        "id": 2,
+        "store_id": 43,
+        "min_price_cents": None,
+        "default_price_cents": 8000000,
+        "active": False,
+        "vehicle_model": None,
+    },
+]
+
+
+class TestPriceTable:
+    def test_flattens_rows_into_columns(self) -> None:
+        table = PriceTable.from_rows(ROWS)
+
+        assert len(table) == 2
+        assert table.columns == list(PRICE_COLUMNS)
+        assert table["default_price_cents"] == [6000000, 8000000]
+        assert table["vehicle_model.molicar_code"] == ["001234-5", None]
+        assert table["store.uf"] == ["SP", None]
+        assert table["min_price_cents"] == [5000000, None]
+
+    def test_selected_columns(self) -> None:
+        table = PriceTable.from_rows(ROWS, ["store_id", "vehicle_model.brand"])
+
+        assert list(table) == ["store_id", "vehicle_model.brand"]
+        assert table["vehicle_model.brand"] == ["Honda", None]
+
+    def test_rejects_unknown_columns(self) -> None:
+        with pytest.raises(ValueError, match="'price'"):
+            PriceTable.from_rows(ROWS, ["price"])
+
+    def test_rejects_ragged_columns(self) -> None:
+        with pytest.raises(ValueError, match="same length"):
+            PriceTable({"id": [1, 2], "store_id": [1]})
+
+    def test_empty(self) -> None:
+        table = PriceTable.from_rows([])
+
+        assert len(table) == 0
+        assert table["id"] == []
+
+
+class TestToNumpy:
+    def test_typed_arrays_with_masked_missing_values(self) -> None:
+        np = pytest.importorskip("numpy")
+
+        arrays = PriceTable.from_rows(ROWS).to_numpy()
+
+        assert arrays["default_price_cents"].dtype == np.int64
+        assert not isinstance(arrays["default_price_cents"], np.ma.MaskedArray)
+        assert arrays["active"].dtype == np.bool_
+        assert arrays["min_price_cents"].mask.tolist() == [False, True]
+        assert arrays["min_price_cents"].sum() == 5000000
+        assert arrays["store.name"].tolist() == ["Loja Centro", None]
+
+    def test_vectorized_filtering(self) -> None:
+        pytest.importorskip("numpy")
+
+        arrays = PriceTable.from_rows(ROWS).to_numpy()
+        expensive = arrays["default_price_cents"] > 7000000
+
+        assert arrays["store_id"][expensive].tolist() == [43]
+
+    def test_requires_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+        with pytest.raises(ImportError, match=r"credere-sdk\[numpy\]"):
+            PriceTable.from_rows(ROWS).to_numpy()
+
+
+class TestToArrow:
+    def test_typed_table_with_nulls(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+
+        table = PriceTable.from_rows(ROWS).to_arrow()
+
+        assert table.num_rows == 2
+        assert table.schema.field("min_price_cents").type == pa.int64()
+        assert table.schema.field("active").type == pa.bool_()
+        assert table.column("min_price_cents").null_count == 1
+        assert table.column("vehicle_model.molicar_code").to_pylist() == [
+            "001234-5",
+            None,
+        ]
+
+    def test_requires_pyarrow(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+        with pytest.raises(ImportError, match=r"credere-sdk\[arrow\]"):
+            PriceTable.from_rows(ROWS).to_arrow()
@@ -0,0 +1,122 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+
+from credere.client import AsyncCredereClient, CredereClient
+from credere.rate_limit import (
+    AsyncRateLimitTransport,
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+)
+from tests.conftest import FakeClock
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+CUSTOMERS_URL = f"{BASE_URL}/v1/customers"
+LEADS_URL = f"{BASE_URL}/v1/banks_api/leads"
+
+
+def _request(url: str) -> httpx.Request:
+    return httpx.Request("GET", url)
+
+
+class TestTokenBucket:
+    def test_burst_then_spaced_reservations(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(RateLimit(rate=2.0, burst=2), clock=clock)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 0.5, 1.0]
+
+    def test_refills_over_time(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(RateLimit(rate=1.0, burst=1), clock=clock)
+        bucket.reserve()
+
+        clock.now = 1.0
+
+        assert bucket.reserve() == 0.0
+
+    @pytest.mark.parametrize("kwargs", [{"rate": 0.0}, {"rate": 1.0, "burst": 0}])
+    def test_rejects_invalid_limits(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            RateLimit(**kwargs)
+
+
+class TestRateLimiter:
+    def test_applies_global_and_endpoint_budgets(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(
+            RateLimit(rate=10.0, burst=10),
+            {"customers": RateLimit(rate=1.0, burst=1)},
+            clock=clock,
+        )
+
+        assert limiter.reserve(_request(CUSTOMERS_URL)) == 0.0
+        assert limiter.reserve(_request(CUSTOMERS_URL)) == 1.0
+        assert limiter.reserve(_request(LEADS_URL)) == 0.0
+        assert limiter.metrics() == {"waits": 1, "waited_seconds": 1.0}
+
+    def test_unlisted_endpoints_are_unlimited_without_global_budget(self) -> None:
+        limiter = RateLimiter(per_endpoint={"customers": RateLimit(rate=1.0)})
+
+        assert all(limiter.reserve(_request(LEADS_URL)) == 0.0 for _ in range(50))
+
+
+class TestClientRateLimiting:
+    @respx.mock
+    def test_threads_share_one_budget(self, clock: FakeClock) -> None:
+        route = respx.get(CUSTOMERS_URL).mock(
+            return_value=httpx.Response(200, json={"customers": []})
+        )
+        # The clock never moves, so the bucket never refills and every call
+        # after the first must wait, however the threads are scheduled.
+        limiter = RateLimiter(RateLimit(rate=200.0, burst=1), clock=clock)
+        with CredereClient(api_key=API_KEY, rate_limiter=limiter) as client:
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda _: client.customers.list(), range(20)))
+            elapsed = time.monotonic() - start
+
+            assert route.call_count == 20
+            assert elapsed >= 19 / 200 * 0.9
+            assert client.metrics()["rate_limit"]["waits"] == 19
+
+    @respx.mock
+    async def test_async_tasks_wait_for_capacity(self, clock: FakeClock) -> None:
+        respx.get(LEADS_URL).mock(return_value=httpx.Response(200, json={"data": []}))
+        # As in the threaded test, the bucket never refills: every call past
+        # the burst must wait, however the tasks are scheduled.
+        limiter = RateLimiter(
+            per_endpoint={"leads": RateLimit(rate=200.0, burst=2)}, clock=clock
+        )
+        async with AsyncCredereClient(api_key=API_KEY, rate_limiter=limiter) as client:
+            start = time.monotonic()
+            await asyncio.gather(*(client.leads.list() for _ in range(12)))
+            elapsed = time.monotonic() - start
+
+            assert elapsed >= 10 / 200 * 0.9
+            assert client.metrics()["rate_limit"]["waits"] == 10
+
+    async def test_async_transport_sleeps_through_the_given_sleep(
+        self, clock: FakeClock
+    ) -> None:
+        delays: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            delays.append(delay)
+
+        transport = AsyncRateLimitTransport(
+            httpx.MockTransport(lambda request: httpx.Response(200)),
+            RateLimiter(RateLimit(rate=2.0, burst=1), clock=clock),
+            sleep=sleep,
+        )
+        for _ in range(3):
+            await transport.handle_async_request(_request(LEADS_URL))
+
+        assert delays == [0.5, 1.0]
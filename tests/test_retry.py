@@ -0,0 +1,197 @@
+"""Tests for the retry policy and retrying transports."""
+
+import httpx
+import pytest
+import respx
+
+from credere.client import AsyncCredereClient, CredereClient
+from credere.exceptions import CredereAPIError, CredereConnectionError
+from credere.models.stores import StoreCreateRequest
+from credere.models.users import User
+from credere.retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+USER_URL = f"{BASE_URL}/v1/users/current"
+
+SAMPLE_USER = {"user": {"id": 1, "name": "Vendedor"}}
+
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_base=0.0)
+
+
+def _request(method: str = "GET") -> httpx.Request:
+    return httpx.Request(method, USER_URL)
+
+
+class TestRetryPolicy:
+    def test_backoff_is_bounded_by_exponential_ceiling(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+
+        for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 4.0), (6, 4.0)):
+            assert 0 <= policy.backoff(attempt) <= ceiling
+
+    def test_retry_after_seconds_on_429(self) -> None:
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+
+        assert RetryPolicy().retry_after(response) == 7.0
+
+    def test_retry_after_ignored_on_other_statuses(self) -> None:
+        response = httpx.Response(502, headers={"Retry-After": "7"})
+
+        assert RetryPolicy().retry_after(response) is None
+
+    def test_non_idempotent_methods_are_not_retried_on_status(self) -> None:
+        response = httpx.Response(503)
+
+        assert NO_WAIT.delay_for_response(_request("POST"), response, 1) is None
+        assert NO_WAIT.delay_for_response(_request("GET"), response, 1) == 0.0
+
+    def test_connect_errors_are_retried_for_any_method(self) -> None:
+        exc = httpx.ConnectError("refused")
+
+        assert NO_WAIT.delay_for_error(_request("POST"), exc, 1) == 0.0
+        assert (
+            NO_WAIT.delay_for_error(_request("POST"), httpx.ReadError("x"), 1) is None
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_attempts": 0}, {"backoff_base": -1.0}, {"budget": 0.0}]
+    )
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
+
+
+class TestRetryTransport:
+    def test_honors_retry_after(self) -> None:
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json=SAMPLE_USER),
+            ]
+        )
+        delays: list[float] = []
+        transport = RetryTransport(
+            httpx.MockTransport(lambda request: next(responses)),
+            RetryPolicy(),
+            sleep=delays.append,
+        )
+
+        response = transport.handle_request(_request())
+
+        assert response.status_code == 200
+        assert delays == [2.0]
+
+    def test_stops_when_budget_would_be_exceeded(self) -> None:
+        delays: list[float] = []
+        transport = RetryTransport(
+            httpx.MockTransport(
+                lambda request: httpx.Response(503, headers={"Retry-After": "60"})
+            ),
+            RetryPolicy(budget=10.0),
+            sleep=delays.append,
+        )
+
+        response = transport.handle_request(_request())
+
+        assert response.status_code == 503
+        assert delays == []
+
+
+class TestClientRetries:
+    @respx.mock
+    def test_retries_transient_status_then_succeeds(self) -> None:
+        route = respx.get(USER_URL).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json=SAMPLE_USER)]
+        )
+        with CredereClient(api_key=API_KEY, retry=NO_WAIT) as client:
+            user = client.users.current()
+
+            assert isinstance(user, User)
+            assert route.call_count == 2
+            assert client.metrics()["retry"] == {"retries": 1, "exhausted": 0}
+
+    @respx.mock
+    def test_raises_after_max_attempts(self) -> None:
+        route = respx.get(USER_URL).mock(return_value=httpx.Response(502))
+        with CredereClient(api_key=API_KEY, retry=NO_WAIT) as client:
+            with pytest.raises(CredereAPIError) as exc_info:
+                client.users.current()
+
+            assert exc_info.value.status_code == 502
+            assert route.call_count == 3
+            assert client.metrics()["retry"]["exhausted"] == 1
+
+    @respx.mock
+    def test_connection_errors_are_retried(self) -> None:
+        route = respx.get(USER_URL).mock(
+            side_effect=[
+                httpx.ConnectError("refused"),
+                httpx.Response(200, json=SAMPLE_USER),
+            ]
+        )
+        with CredereClient(api_key=API_KEY, retry=NO_WAIT) as client:
+            client.users.current()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_post_is_not_retried_on_server_error(self) -> None:
+        route = respx.post(f"{BASE_URL}/v1/stores").mock(
+            return_value=httpx.Response(503)
+        )
+        with (
+            CredereClient(api_key=API_KEY, retry=NO_WAIT) as client,
+            pytest.raises(CredereAPIError),
+        ):
+            client.stores.create(StoreCreateRequest(name="Loja"))
+
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_without_policy_errors_surface_immediately(self) -> None:
+        route = respx.get(USER_URL).mock(side_effect=httpx.ConnectError("refused"))
+        with (
+            CredereClient(api_key=API_KEY) as client,
+            pytest.raises(CredereConnectionError),
+        ):
+            client.users.current()
+
+        assert route.call_count == 1
+
+
+class TestAsyncClientRetries:
+    @respx.mock
+    async def test_retries_transient_status_then_succeeds(self) -> None:
+        route = respx.get(USER_URL).mock(
+            side_effect=[httpx.Response(429), httpx.Response(200, json=SAMPLE_USER)]
+        )
+        async with AsyncCredereClient(api_key=API_KEY, retry=NO_WAIT) as client:
+            user = await client.users.current()
+
+            assert isinstance(user, User)
+            assert route.call_count == 2
+            assert client.metrics()["retry"]["retries"] == 1
+
+    async def test_async_transport_honors_retry_after(self) -> None:
+        responses = iter(
+            [
+                httpx.Response(503, headers={"Retry-After": "1.5"}),
+                httpx.Response(200, json=SAMPLE_USER),
+            ]
+        )
+        delays: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            delays.append(delay)
+
+        transport = AsyncRetryTransport(
+            httpx.MockTransport(lambda request: next(responses)),
+            RetryPolicy(),
+            sleep=sleep,
+        )
+
+        response = await transport.handle_async_request(_request())
+
+        assert response.status_code == 200
+        assert delays == [1.5]
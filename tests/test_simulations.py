@@ -6,6 +6,7 @@ import httpx
 import pytest
 import respx
 
+from credere.cache import TTLCache
 from credere.client import AsyncCredereClient, CredereClient
 from credere.exceptions import AuthenticationError, NotFoundError
 from credere.models.simulations import (
@@ -14,6 +15,7 @@ from credere.models.simulations import (
     SimulationCreateRequest,
     SimulationVehicleRequest,
 )
+from tests.conftest import FakeClock
 
 BASE_URL = "https://api.credere.com"
 SIMULATIONS_URL = f"{BASE_URL}/v1/banks_api/simulations"
@@ -80,6 +82,25 @@ SAMPLE_CREATE_DATA = SimulationCreateRequest(
 )
 
 
+def _quote(request: httpx.Request) -> httpx.Response:
+    """Answer a simulation with one successful condition per requested one.
+
+    Each condition pays 1% of the financed amount per installment in interest.
+    """
+    simulation = json.loads(request.content)["simulation"]
+    conditions = [
+        {
+            **condition,
+            "success": True,
+            "amount_paid_in_financing": condition["financed_amount"]
+            * (100 + condition["installments"])
+            // 100,
+        }
+        for condition in simulation["conditions"]
+    ]
+    return httpx.Response(200, json={"data": {"conditions": conditions}})
+
+
 # ---------------------------------------------------------------------------
 # Sync tests
 # ---------------------------------------------------------------------------
@@ -133,6 +154,122 @@ class TestSimulationsCreate:
         assert request.headers["Store-Id"] == "42"
 
 
+class TestSimulationsSweep:
+    @respx.mock
+    def test_sweep_merges_ranked_conditions(self, sync_client: CredereClient) -> None:
+        route = respx.post(SIMULATIONS_URL).mock(side_effect=_quote)
+
+        sweep = sync_client.simulations.sweep(
+            SAMPLE_CREATE_DATA,
+            down_payments=[1000000, 2000000],
+            installments=[24, 48],
+            conditions_per_request=2,
+            store_id=7,
+        )
+
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["Store-Id"] == "7"
+        ranked = [
+            (r.condition.down_payment, r.condition.installments) for r in sweep.rows
+        ]
+        assert ranked == [(2000000, 24), (1000000, 24), (2000000, 48), (1000000, 48)]
+        assert sweep.stats.succeeded == 2
+
+    @respx.mock
+    def test_sweep_reports_failed_requests(self, sync_client: CredereClient) -> None:
+        respx.post(SIMULATIONS_URL).mock(
+            side_effect=[_quote, httpx.Response(404, json={"error": "Not found"})]
+        )
+
+        sweep = sync_client.simulations.sweep(
+            SAMPLE_CREATE_DATA,
+            down_payments=[1000000, 2000000],
+            installments=[48],
+            conditions_per_request=1,
+            concurrency=1,
+        )
+
+        assert len(sweep.rows) == 1
+        assert isinstance(sweep.failed[0].error, NotFoundError)
+        assert sweep.failed[0].item.conditions[0].down_payment == 2000000
+
+
+class TestSimulationsCache:
+    @respx.mock
+    def test_identical_request_is_served_from_cache(self) -> None:
+        route = respx.post(SIMULATIONS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_SIMULATION_RESPONSE)
+        )
+        with CredereClient(api_key="key", simulation_cache=TTLCache()) as client:
+            first = client.simulations.create(SAMPLE_CREATE_DATA)
+            second = client.simulations.create(
+                SimulationCreateRequest.model_validate(SAMPLE_CREATE_DATA.model_dump())
+            )
+
+            assert route.call_count == 1
+            assert first == second
+            assert first is not second
+            stats = client.metrics()["simulation_cache"]
+            assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    @respx.mock
+    def test_cache_is_keyed_by_payload_and_store(self) -> None:
+        route = respx.post(SIMULATIONS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_SIMULATION_RESPONSE)
+        )
+        other = SAMPLE_CREATE_DATA.model_copy(update={"seller_cpf": "11122233344"})
+        with CredereClient(api_key="key", simulation_cache=TTLCache()) as client:
+            client.simulations.create(SAMPLE_CREATE_DATA)
+            client.simulations.create(other)
+            client.simulations.create(SAMPLE_CREATE_DATA, store_id=7)
+            client.simulations.create(SAMPLE_CREATE_DATA, store_id=7)
+
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_expired_entry_is_simulated_again(self) -> None:
+        now = [0.0]
+        route = respx.post(SIMULATIONS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_SIMULATION_RESPONSE)
+        )
+        cache = TTLCache(ttl=60.0, clock=lambda: now[0])
+        with CredereClient(api_key="key", simulation_cache=cache) as client:
+            client.simulations.create(SAMPLE_CREATE_DATA)
+            now[0] = 61.0
+            client.simulations.create(SAMPLE_CREATE_DATA)
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_stale_entry_is_a_miss(self, clock: FakeClock) -> None:
+        route = respx.post(SIMULATIONS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_SIMULATION_RESPONSE)
+        )
+        cache = TTLCache(ttl=60.0, stale_while_revalidate=600.0, clock=clock)
+        with CredereClient(api_key="key", simulation_cache=cache) as client:
+            client.simulations.create(SAMPLE_CREATE_DATA)
+            clock.now = 61.0
+            client.simulations.create(SAMPLE_CREATE_DATA)
+
+            assert route.call_count == 2
+            stats = client.metrics()["simulation_cache"]
+            assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (0, 0, 2)
+
+    @respx.mock
+    def test_raw_mode_and_invalidation_bypass_cache(self) -> None:
+        route = respx.post(SIMULATIONS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_SIMULATION_RESPONSE)
+        )
+        with CredereClient(api_key="key", simulation_cache=TTLCache()) as client:
+            client.simulations.create(SAMPLE_CREATE_DATA)
+            raw = client.simulations.create(SAMPLE_CREATE_DATA, response_mode="raw")
+            client.simulations.invalidate_cache()
+            client.simulations.create(SAMPLE_CREATE_DATA)
+
+        assert isinstance(raw, dict)
+        assert route.call_count == 3
+
+
 class TestSimulationsList:
     @respx.mock
     def test_list_simulations(self, sync_client: CredereClient) -> None:
@@ -244,6 +381,47 @@ class TestAsyncSimulationsCreate:
         assert len(sim.conditions) == 1
 
 
+class TestAsyncSimulationsSweep:
+    @respx.mock
+    async def test_async_sweep_across_vehicles(
+        self, async_client: AsyncCredereClient
+    ) -> None:
+        route = respx.post(SIMULATIONS_URL).mock(side_effect=_quote)
+        other = SAMPLE_CREATE_DATA.vehicle.model_copy(
+            update={"asset_value": 3000000, "vehicle_molicar_code": "MOL456"}
+        )
+
+        sweep = await async_client.simulations.sweep(
+            SAMPLE_CREATE_DATA,
+            down_payments=[1000000],
+            installments=[48],
+            vehicles=[SAMPLE_CREATE_DATA.vehicle, other],
+        )
+
+        assert route.call_count == 2
+        assert sweep.best is not None
+        assert sweep.best.vehicle.vehicle_molicar_code == "MOL456"
+        assert sweep.best.condition.financed_amount == 2000000
+
+
+class TestAsyncSimulationsCache:
+    @respx.mock
+    async def test_async_identical_request_is_served_from_cache(self) -> None:
+        route = respx.post(SIMULATIONS_URL).mock(
+            return_value=httpx.Response(200, json=SAMPLE_SIMULATION_RESPONSE)
+        )
+        async with AsyncCredereClient(
+            api_key="key", simulation_cache=TTLCache()
+        ) as client:
+            await client.simulations.create(SAMPLE_CREATE_DATA)
+            sim = await client.simulations.create(SAMPLE_CREATE_DATA)
+
+            assert client.metrics()["simulation_cache"]["hits"] == 1
+
+        assert route.call_count == 1
+        assert isinstance(sim, Simulation)
+
+
 class TestAsyncSimulationsList:
     @respx.mock
     async def test_async_list_simulations(
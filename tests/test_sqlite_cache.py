@@ -0,0 +1,196 @@
+"""Tests for the SQLite-backed response cache."""
+
+import multiprocessing
+import os
+import sqlite3
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from credere.client import AsyncCredereClient, CredereClient
+from credere.exceptions import CredereAPIError
+from credere.factory import CredereClientFactory
+from credere.sqlite_cache import SQLiteCache
+from tests.conftest import FakeClock
+
+API_KEY = "sk-test-key"
+BASE_URL = "https://api.credere.com"
+BANKS_URL = f"{BASE_URL}/v1/banks"
+USERS_URL = f"{BASE_URL}/v1/users/current"
+
+SAMPLE_BANK = {"id": 1, "febraban_code": "001", "name": "Banco do Brasil"}
+BANKS_RESPONSE = {"banks": [SAMPLE_BANK] * 50}
+
+
+def _fill(path: Path, key: str) -> None:
+    SQLiteCache(path).set(key, b"from another process", None, 60.0)
+
+
+class TestSQLiteCache:
+    def test_round_trip_and_compression(self, tmp_path: Path) -> None:
+        cache = SQLiteCache(tmp_path / "cache.db")
+        body = b'{"banks": []}' * 100
+
+        cache.set("k", body, "application/json", 60.0)
+
+        assert cache.get("k") == (body, "application/json")
+        assert cache.stats()["bytes"] < len(body) / 10
+
+    def test_uses_wal_mode(self, tmp_path: Path) -> None:
+        SQLiteCache(tmp_path / "cache.db")
+
+        connection = sqlite3.connect(tmp_path / "cache.db")
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    def test_entries_expire(self, tmp_path: Path, clock: FakeClock) -> None:
+        cache = SQLiteCache(tmp_path / "cache.db", clock=clock)
+        cache.set("k", b"body", None, 60.0)
+
+        clock.now += 59
+        assert cache.get("k") is not None
+        clock.now += 1
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_read_beyond_max_bytes(
+        self, tmp_path: Path, clock: FakeClock
+    ) -> None:
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=2500, clock=clock)
+        for key in "abc":
+            if key == "c":
+                cache.get("a")
+            cache.set(key, os.urandom(1000), None, 60.0)
+            clock.now += 1
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_total_size_tracks_every_change(
+        self, tmp_path: Path, clock: FakeClock
+    ) -> None:
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=2500, clock=clock)
+        cache.set("a", os.urandom(1000), None, 60.0)
+        cache.set("a", os.urandom(800), None, 60.0)
+        cache.set("b", os.urandom(1000), None, 10.0)
+        clock.now += 10
+        cache.get("b")
+        cache.set("c", os.urandom(1000), None, 60.0)
+        cache.set("d", os.urandom(1000), None, 60.0)
+
+        connection = sqlite3.connect(tmp_path / "cache.db")
+        (actual,) = connection.execute(
+            "SELECT SUM(LENGTH(body)) FROM entries"
+        ).fetchone()
+        assert cache.stats()["bytes"] == actual <= 2500
+        cache.clear()
+        assert cache.stats()["bytes"] == 0
+
+    def test_ttl_by_path_pattern(self, tmp_path: Path) -> None:
+        cache = SQLiteCache(
+            tmp_path / "cache.db",
+            ttls={"/v1/banks": 10.0, "/v1/vehicles/license_plate/*": 20.0},
+        )
+
+        assert cache.ttl("/v1/banks") == 10.0
+        assert cache.ttl("/v1/vehicles/license_plate/ABC1234") == 20.0
+        assert cache.ttl("/v1/banks_api/leads") is None
+
+    def test_shared_between_processes(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.db"
+        cache = SQLiteCache(path)
+        process = multiprocessing.get_context("spawn").Process(
+            target=_fill, args=(path, "k")
+        )
+        process.start()
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert cache.get("k") == (b"from another process", None)
+
+    def test_rejects_invalid_size(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            SQLiteCache(tmp_path / "cache.db", max_bytes=0)
+
+
+class TestSQLiteCacheTransport:
+    @respx.mock
+    def test_new_client_starts_warm(self, tmp_path: Path) -> None:
+        route = respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json=BANKS_RESPONSE)
+        )
+        path = tmp_path / "cache.db"
+        with CredereClient(api_key=API_KEY, sqlite_cache=SQLiteCache(path)) as client:
+            first = client.utilities.banks()
+        with CredereClient(api_key=API_KEY, sqlite_cache=SQLiteCache(path)) as client:
+            second = client.utilities.banks()
+            stats = client.metrics()["sqlite_cache"]
+
+        assert route.call_count == 1
+        assert first == second
+        assert (stats["hits"], stats["misses"]) == (1, 0)
+
+    @respx.mock
+    def test_entries_are_keyed_by_credentials(self, tmp_path: Path) -> None:
+        route = respx.get(USERS_URL).mock(
+            return_value=httpx.Response(200, json={"user": {"id": 1}})
+        )
+        cache = SQLiteCache(tmp_path / "cache.db")
+        for api_key in ("key-a", "key-b", "key-a"):
+            with CredereClient(api_key=api_key, sqlite_cache=cache) as client:
+                client.users.current()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_uncacheable_requests_pass_through(self, tmp_path: Path) -> None:
+        leads = respx.get(f"{BASE_URL}/v1/banks_api/leads").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+        banks = respx.get(BANKS_URL).mock(
+            side_effect=[
+                httpx.Response(500, json={"error": "boom"}),
+                httpx.Response(200, json=BANKS_RESPONSE),
+            ]
+        )
+        cache = SQLiteCache(tmp_path / "cache.db")
+        with CredereClient(api_key=API_KEY, sqlite_cache=cache) as client:
+            client.leads.list()
+            client.leads.list()
+            with pytest.raises(CredereAPIError):
+                client.utilities.banks()
+            client.utilities.banks()
+
+        assert leads.call_count == 2
+        assert banks.call_count == 2
+        assert len(cache) == 1
+
+    @respx.mock
+    def test_shared_through_factory(self, tmp_path: Path) -> None:
+        route = respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json=BANKS_RESPONSE)
+        )
+        cache = SQLiteCache(tmp_path / "cache.db")
+        with CredereClientFactory(sqlite_cache=cache) as factory:
+            factory.client(API_KEY).utilities.banks()
+            factory.client(API_KEY).utilities.banks()
+
+        assert route.call_count == 1
+
+
+class TestAsyncSQLiteCacheTransport:
+    @respx.mock
+    async def test_serves_cached_response(self, tmp_path: Path) -> None:
+        route = respx.get(BANKS_URL).mock(
+            return_value=httpx.Response(200, json=BANKS_RESPONSE)
+        )
+        cache = SQLiteCache(tmp_path / "cache.db")
+        async with AsyncCredereClient(api_key=API_KEY, sqlite_cache=cache) as client:
+            await client.utilities.banks()
+            banks = await client.utilities.banks()
+
+        assert route.call_count == 1
+        assert banks[0].name == "Banco do Brasil"
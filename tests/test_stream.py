@@ -0,0 +1,77 @@
+"""Tests for the incremental JSON array parser."""
+
+import json
+
+import pytest
+
+from credere._stream import ArrayItemParser
+
+BODY = {
+    "meta": {"nested": [{"vehicle_prices": ["decoy"]}]},
+    "label": "vehicle_prices",
+    "vehicle_prices": [
+        {"id": 1, "name": 'quote " and ] } , \\ inside'},
+        [1, [2, 3]],
+        "plain, string",
+        42,
+        None,
+        {"deep": {"list": []}},
+    ],
+    "after": [1, 2],
+}
+
+
+def _parse(body: bytes, key: str | None, size: int) -> list[object]:
+    parser = ArrayItemParser(key)
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(parser.feed(body[start : start + size]))
+    parser.close()
+    return items
+
+
+class TestArrayItemParser:
+    @pytest.mark.parametrize("size", [1, 2, 5, 64, 1 << 16])
+    def test_splits_items_for_any_chunking(self, size: int) -> None:
+        body = json.dumps(BODY).encode()
+
+        assert _parse(body, "vehicle_prices", size) == BODY["vehicle_prices"]
+
+    def test_top_level_array(self) -> None:
+        body = json.dumps([{"a": 1}, {"b": [2]}], indent=2).encode()
+
+        assert _parse(body, None, 3) == [{"a": 1}, {"b": [2]}]
+
+    def test_empty_array(self) -> None:
+        assert _parse(b'{"vehicle_prices": [ ]}', "vehicle_prices", 4) == []
+
+    def test_buffer_stays_bounded(self) -> None:
+        parser = ArrayItemParser("vehicle_prices")
+        parser.feed(b'{"vehicle_prices": [')
+        item = json.dumps({"id": 1, "name": "x" * 100}).encode()
+
+        for _ in range(1000):
+            assert parser.feed(item + b",") == [{"id": 1, "name": "x" * 100}]
+
+        assert len(parser._text) <= len(item) + 1
+
+    def test_number_split_across_chunks(self) -> None:
+        assert _parse(b"[12345, 678]", None, 3) == [12345, 678]
+
+    def test_multibyte_character_split_across_chunks(self) -> None:
+        body = json.dumps({"vehicle_prices": ["São Paulo"]}, ensure_ascii=False)
+
+        assert _parse(body.encode(), "vehicle_prices", 1) == ["São Paulo"]
+
+    def test_close_raises_when_array_incomplete(self) -> None:
+        parser = ArrayItemParser("vehicle_prices")
+        parser.feed(b'{"vehicle_prices": [{"id": 1}')
+
+        with pytest.raises(ValueError, match="vehicle_prices"):
+            parser.close()
+
+    def test_missing_key_raises(self) -> None:
+        parser = ArrayItemParser("vehicle_prices")
+
+        with pytest.raises(ValueError, match="vehicle_prices"):
+            parser.feed(b'{"other": [1, 2]}')
@@ -0,0 +1,159 @@
+"""Tests for simulation sweeps."""
+
+import pytest
+
+from credere.bulk import BulkResult, BulkStats
+from credere.models.simulations import (
+    Simulation,
+    SimulationCondition,
+    SimulationCreateRequest,
+    SimulationVehicleRequest,
+)
+from credere.sweep import merge_sweep, simulation_grid
+
+VEHICLE = SimulationVehicleRequest(
+    asset_value=5000000,
+    licensing_uf="SP",
+    manufacture_year=2024,
+    model_year=2024,
+    vehicle_molicar_code="MOL123",
+    zero_km=True,
+)
+TEMPLATE = SimulationCreateRequest(
+    assets_value=5000000,
+    documentation_value=50000,
+    conditions=[],
+    retrieve_lead={"cpf_cnpj": "12345678900"},
+    seller_cpf="98765432100",
+    vehicle=VEHICLE,
+)
+STATS = BulkStats(0, 0, 0, 0.0)
+
+
+class TestSimulationGrid:
+    def test_covers_every_pair(self) -> None:
+        requests = simulation_grid(
+            TEMPLATE, down_payments=[0, 1000000], installments=[24, 36, 48]
+        )
+
+        assert len(requests) == 1
+        pairs = [(c.down_payment, c.installments) for c in requests[0].conditions]
+        assert pairs == [(d, n) for d in (0, 1000000) for n in (24, 36, 48)]
+        assert requests[0].conditions[-1].financed_amount == 4000000
+        assert requests[0].seller_cpf == TEMPLATE.seller_cpf
+        assert requests[0].documentation_value == 50000
+
+    def test_splits_into_balanced_requests(self) -> None:
+        requests = simulation_grid(
+            TEMPLATE,
+            down_payments=range(0, 1100000, 100000),
+            installments=[48],
+            conditions_per_request=5,
+        )
+
+        assert [len(r.conditions) for r in requests] == [4, 4, 3]
+
+    def test_one_set_of_requests_per_vehicle(self) -> None:
+        other = VEHICLE.model_copy(
+            update={"asset_value": 3000000, "vehicle_molicar_code": "MOL456"}
+        )
+
+        requests = simulation_grid(
+            TEMPLATE,
+            down_payments=[1000000, 4000000],
+            installments=[48],
+            vehicles=[VEHICLE, other],
+        )
+
+        assert [r.vehicle.vehicle_molicar_code for r in requests] == [
+            "MOL123",
+            "MOL456",
+        ]
+        assert requests[1].assets_value == 3000000
+        # A down payment above the asset value leaves nothing to finance.
+        assert [c.down_payment for c in requests[1].conditions] == [1000000]
+
+    def test_rejects_invalid_request_size(self) -> None:
+        with pytest.raises(ValueError, match="conditions_per_request"):
+            simulation_grid(
+                TEMPLATE,
+                down_payments=[0],
+                installments=[48],
+                conditions_per_request=0,
+            )
+
+
+class TestMergeSweep:
+    def _result(self, index: int, *conditions: dict) -> BulkResult[Simulation]:
+        simulation = Simulation(
+            conditions=[SimulationCondition(**c) for c in conditions]
+        )
+        return BulkResult(index, TEMPLATE, value=simulation)
+
+    def test_ranks_successful_conditions_by_total_cost(self) -> None:
+        results = [
+            self._result(0, {"id": 1, "success": True, "amount_paid_in_financing": 9}),
+            self._result(
+                1,
+                {"id": 2, "success": False},
+                {"id": 3, "success": True, "amount_paid_in_financing": 7},
+            ),
+        ]
+
+        sweep = merge_sweep(results, STATS)
+
+        assert [row.condition.id for row in sweep.rows] == [3, 1, 2]
+        assert sweep.best is not None
+        assert sweep.best.vehicle == VEHICLE
+
+    def test_total_cost_includes_the_down_payment(self) -> None:
+        results = [
+            self._result(
+                0,
+                {
+                    "id": 1,
+                    "success": True,
+                    "down_payment": 2000000,
+                    "amount_paid_in_financing": 3200000,
+                },
+                {
+                    "id": 2,
+                    "success": True,
+                    "down_payment": 0,
+                    "amount_paid_in_financing": 5600000,
+                },
+                {
+                    "id": 3,
+                    "success": True,
+                    "down_payment": 1000000,
+                    "amount_paid_in_financing": 4100000,
+                },
+            )
+        ]
+
+        sweep = merge_sweep(results, STATS)
+
+        # Totals are 5.2M, 5.6M and 5.1M; the financed part alone would
+        # rank 1 (3.2M) first.
+        assert [row.condition.id for row in sweep.rows] == [3, 1, 2]
+
+    def test_custom_key(self) -> None:
+        results = [
+            self._result(
+                0, {"id": 1, "installments": 48}, {"id": 2, "installments": 24}
+            )
+        ]
+
+        sweep = merge_sweep(results, STATS, key=lambda row: row.condition.installments)
+
+        assert [row.condition.id for row in sweep.rows] == [2, 1]
+
+    def test_collects_failed_requests(self) -> None:
+        error = RuntimeError("boom")
+        results = [BulkResult(0, TEMPLATE, error=error), self._result(1, {"id": 1})]
+
+        sweep = merge_sweep(results, STATS)
+
+        assert len(sweep.rows) == 1
+        assert sweep.failed[0].error is error
+        assert sweep.failed[0].item is TEMPLATE
@@ -1,5 +1,7 @@
 """Tests for the Vehicle Models resource (sync + async)."""
 
+import json
+
 import httpx
 import pytest
 import respx
@@ -98,6 +100,62 @@ class TestVehicleModelsPrices:
         assert result[0].active is True
 
 
+class TestVehicleModelsIterPrices:
+    @respx.mock
+    def test_iter_prices_yields_models_from_chunks(
+        self, sync_client: CredereClient
+    ) -> None:
+        body = json.dumps(
+            {
+                "vehicle_prices": [
+                    SAMPLE_VEHICLE_PRICE,
+                    {**SAMPLE_VEHICLE_PRICE, "id": 2},
+                ]
+            }
+        ).encode()
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        respx.get(PRICES_URL).mock(return_value=httpx.Response(200, content=chunks))
+
+        result = list(sync_client.vehicle_models.iter_prices())
+
+        assert [p.id for p in result] == [1, 2]
+        assert all(isinstance(p, VehiclePrice) for p in result)
+
+    @respx.mock
+    def test_iter_list_sends_params(self, sync_client: CredereClient) -> None:
+        route = respx.get(MODELS_URL).mock(
+            return_value=httpx.Response(
+                200, json={"vehicle_models": [SAMPLE_VEHICLE_MODEL]}
+            )
+        )
+
+        (result,) = sync_client.vehicle_models.iter_list(brand="Honda")
+
+        assert route.calls.last.request.url.params["brand"] == "Honda"
+        assert route.calls.last.request.headers["Store-Id"] == "42"
+        assert isinstance(result, VehicleModel)
+
+    @respx.mock
+    def test_iter_prices_maps_errors(self, sync_client: CredereClient) -> None:
+        respx.get(PRICES_URL).mock(
+            return_value=httpx.Response(
+                401, json={"error": {"message": "Unauthorized", "status": 401}}
+            )
+        )
+
+        with pytest.raises(AuthenticationError):
+            list(sync_client.vehicle_models.iter_prices())
+
+    @respx.mock
+    def test_truncated_body_raises(self, sync_client: CredereClient) -> None:
+        respx.get(PRICES_URL).mock(
+            return_value=httpx.Response(200, content=b'{"vehicle_prices": [{"id": 1}')
+        )
+
+        with pytest.raises(ValueError, match="vehicle_prices"):
+            list(sync_client.vehicle_models.iter_prices())
+
+
 # ---------------------------------------------------------------------------
 # Error mapping tests
 # ---------------------------------------------------------------------------
@@ -162,3 +220,59 @@ class TestAsyncVehicleModelsSearch:
         assert isinstance(result, VehicleModel)
         assert result.id == 1
         assert result.name == "Civic"
+
+
+class TestAsyncVehicleModelsIterPrices:
+    @respx.mock
+    async def test_async_iter_prices_yields_models(
+        self, async_client: AsyncCredereClient
+    ) -> None:
+        respx.get(PRICES_URL).mock(
+            return_value=httpx.Response(
+                200, json={"vehicle_prices": [SAMPLE_VEHICLE_PRICE]}
+            )
+        )
+
+        result = [p async for p in async_client.vehicle_models.iter_prices()]
+
+        assert len(result) == 1
+        assert isinstance(result[0], VehiclePrice)
+        assert result[0].min_price_cents == 5000000
+
+
+class TestVehicleModelsPriceTable:
+    @respx.mock
+    def test_price_table_flattens_rows_into_columns(
+        self, sync_client: CredereClient
+    ) -> None:
+        price = {**SAMPLE_VEHICLE_PRICE, "vehicle_model": SAMPLE_VEHICLE_MODEL}
+        body = json.dumps({"vehicle_prices": [price, {"id": 2}]}).encode()
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        route = respx.get(PRICES_URL).mock(
+            return_value=httpx.Response(200, content=chunks)
+        )
+
+        table = sync_client.vehicle_models.price_table(
+            columns=["id", "min_price_cents", "vehicle_model.molicar_code"],
+            active=True,
+        )
+
+        assert route.calls.last.request.url.params["active"] == "true"
+        assert table.columns == ["id", "min_price_cents", "vehicle_model.molicar_code"]
+        assert table["min_price_cents"] == [5000000, None]
+        assert table["vehicle_model.molicar_code"] == ["123456", None]
+
+
+class TestAsyncVehicleModelsPriceTable:
+    @respx.mock
+    async def test_async_price_table(self, async_client: AsyncCredereClient) -> None:
+        respx.get(PRICES_URL).mock(
+            return_value=httpx.Response(
+                200, json={"vehicle_prices": [SAMPLE_VEHICLE_PRICE]}
+            )
+        )
+
+        table = await async_client.vehicle_models.price_table()
+
+        assert len(table) == 1
+        assert table["store_id"] == [42]